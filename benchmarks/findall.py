@@ -0,0 +1,52 @@
+"""Time the text scan behind `timestring.findall` on a chat-like corpus where few
+messages hold a date.
+
+    python benchmarks/findall.py [messages] [date density]
+"""
+import random
+import sys
+import time
+
+WORDS = '''hey so I was thinking we could ship the release after the review but
+honestly the build keeps failing on the integration box and nobody knows why
+let me know what you think about the new design it looks great to me thanks
+again for the help with the migration everything went smoothly on our side
+could you please send over the report when you get a chance cheers'''.split()
+
+DATES = ['tomorrow at 3pm', 'next week', 'jan 5th', 'in 2 days', 'friday',
+         '2017-06-16', 'last month', 'noon', '10:30 am', '3 hours ago']
+
+
+def corpus(messages, density):
+    random.seed(0)
+    for _ in range(messages):
+        words = random.choices(WORDS, k=random.randint(5, 40))
+        if random.random() < density:
+            words.insert(random.randrange(len(words)), random.choice(DATES))
+        yield ' '.join(words)
+
+
+def bench(label, fn, data):
+    start = time.perf_counter()
+    found = sum(1 for text in data for _ in fn(text))
+    elapsed = time.perf_counter() - start
+    print('%-28s %7.3fs %8d matches' % (label, elapsed, found))
+    return elapsed
+
+
+def main():
+    # here, so that the corpus imports with a timestring that has no search
+    from timestring.search import scan
+    from timestring.timestring_re import TIMESTRING_RE
+
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    density = float(sys.argv[2]) if len(sys.argv) > 2 else 0.02
+    data = list(corpus(messages, density))
+    print('%d messages, %d%% with a date' % (messages, density * 100))
+    full = bench('TIMESTRING_RE.finditer', TIMESTRING_RE.finditer, data)
+    fast = bench('search.scan', scan, data)
+    print('speedup %.1fx' % (full / fast))
+
+
+if __name__ == '__main__':
+    main()
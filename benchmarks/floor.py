@@ -0,0 +1,40 @@
+"""Bucket an event stream by hour, day and week: `timestring.floor` on a
+``datetime64`` array against a Range per event.
+
+    python benchmarks/floor.py [events]
+"""
+import sys
+import time
+
+import numpy as np
+
+from timestring import Date, Range, floor
+
+# the per-event loop is timed on this many events and scaled up
+LOOP_SAMPLE = 20000
+
+
+def main():
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7
+    now = np.datetime64('2017-06-16T19:37:22', 's')
+    seconds = np.random.randint(0, 365 * 86400, events)
+    values = (now - seconds).astype('datetime64[ns]')
+    sample = values[:LOOP_SAMPLE].astype('datetime64[us]').tolist()
+
+    print('%d events' % events)
+    for unit in ('hour', 'day', 'week'):
+        for tz in (None, 'US/Eastern'):
+            started = time.perf_counter()
+            buckets = floor(values, unit, tz=tz)
+            vectorized = time.perf_counter() - started
+            print('floor %-5s tz=%-10s %8.3fs' % (unit, tz, vectorized))
+
+        started = time.perf_counter()
+        loop = [Range('this %s' % unit, now=Date(value)).start.date for value in sample]
+        looped = (time.perf_counter() - started) * events / len(sample)
+        assert loop == floor(values[:LOOP_SAMPLE], unit).astype('datetime64[us]').tolist()
+        print('Range("this %s") loop  %8.3fs (estimated from %d events)' % (unit, looped, len(sample)))
+
+
+if __name__ == '__main__':
+    main()
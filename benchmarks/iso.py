@@ -0,0 +1,36 @@
+"""Time machine-generated ISO-8601 strings against `datetime.fromisoformat`.
+
+    python benchmarks/iso.py [repeat]
+"""
+import sys
+import timeit
+from datetime import datetime
+
+from timestring import Date, Range
+
+SAMPLES = [
+    '2024-03-05',
+    '2024-03-05T12:30:00',
+    '2024-03-05T12:30:00.123456',
+    '2024-03-05T12:30:00+02:00',
+    '2024-03-05T12:30:00Z',
+]
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for text in SAMPLES:
+        row = []
+        for fn in (datetime.fromisoformat, Date, Range):
+            try:
+                fn(text)
+            except ValueError:
+                row.append('%8s' % '-')
+                continue
+            usec = min(timeit.repeat(lambda: fn(text), number=number, repeat=3)) / number * 1e6
+            row.append('%6.1fus' % usec)
+        print('%-28s fromisoformat %s  Date %s  Range %s' % (text, *row))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Match timestrings: `matcher.search` against one `TIMESTRING_RE.search`,
+for each kind of component and for text without dates.
+
+    python benchmarks/matcher.py [rounds]
+"""
+import sys
+import time
+
+from timestring import matcher
+from timestring.timestring_re import TIMESTRING_RE
+
+CATEGORIES = [
+    ('relative day', ['today', 'yesterday at noon', 'the day after tomorrow', 'since yesterday']),
+    ('weekday', ['tuesday', 'next monday', 'last fri at 5pm', 'this sunday']),
+    ('duration', ['7 days', 'sixty minutes ago', 'in 2 weeks', 'last 3 months']),
+    ('month name date', ['june 16th', '16 june 2017', 'jan 5, 2018', 'september 1st']),
+    ('numeric date', ['2017-06-16', '6/16/2017', '05/2012', '2017/12/11']),
+    ('time', ['7am', '10:30 pm', '19:37:22', 'noon']),
+    ('sentence', ['lunch next tuesday at noon with the team',
+                  'meeting notes from the call, moved to 6/16/2017 10:30']),
+    ('no date', ['nothing to see here, move along',
+                 'the quick brown fox jumps over the lazy dog ' * 4]),
+]
+
+
+def timed(function, texts, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            function(text)
+    return time.perf_counter() - started
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    print('%-16s %12s %12s' % ('', 'TIMESTRING_RE', 'matcher'))
+    for name, texts in CATEGORIES:
+        for text in texts:
+            expected, found = TIMESTRING_RE.search(text), matcher.search(text)
+            assert (expected and expected.span()) == (found and found.span()), text
+        calls = rounds * len(texts)
+        monolith = timed(TIMESTRING_RE.search, texts, rounds)
+        split = timed(matcher.search, texts, rounds)
+        print('%-16s %10.2fus %10.2fus (%.1fx)' % (name, monolith / calls * 1e6, split / calls * 1e6,
+                                                 monolith / split))
+
+
+if __name__ == '__main__':
+    main()
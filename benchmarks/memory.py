@@ -0,0 +1,37 @@
+"""Bytes allocated per Date and Range instance, measured with tracemalloc.
+
+    python benchmarks/memory.py [count]
+"""
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+from timestring import Date, Range
+
+
+def per_instance(label, build, count):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = build(count)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    print('%-34s %6.1f bytes/instance' % (label, float(size - sys.getsizeof(objects)) / count))
+    return objects
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    # datetimes are built up front so only the Date wrappers are counted
+    moments = [datetime(2017, 1, 1) + timedelta(minutes=i) for i in range(count)]
+    texts = ['2017-06-%02d %02d:%02d' % (i % 28 + 1, i % 24, i % 60) for i in range(count)]
+
+    per_instance('Date(datetime)', lambda n: [Date(m) for m in moments[:n]], count)
+    per_instance('Date(str) (datetime included)', lambda n: [Date(t) for t in texts[:n]], count)
+    per_instance('Date("infinity")', lambda n: [Date('infinity') for _ in range(n)], count)
+    per_instance('Range(Date, Date)',
+                 lambda n: [Range(m, m) for m in moments[:n]], count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Compare `timestring.parse_many` with a plain `Date(s)` loop.
+
+    python benchmarks/parse_many.py [rows] [distinct] [workers]
+
+The column mimics an import of user-entered dates: `rows` values drawn
+from `distinct` different strings.
+"""
+import random
+import sys
+import time
+
+import timestring
+from timestring import Date
+
+SAMPLES = [
+    'today', 'tomorrow', 'yesterday', 'next tuesday', 'last friday',
+    '3 days ago', 'in 2 weeks', 'jan 5th 2017', '2017-06-16 19:37:22',
+    '06/16/2017', 'june 16th at 7:37pm', 'noon', '10:30 am', 'may of 2014',
+    'nov 11 at 11:11', 'tuesday at 10pm', 'fri 3pm', '1 hour ago',
+]
+
+
+def column(rows, distinct):
+    random.seed(0)
+    values = list(SAMPLES)
+    while len(values) < distinct:
+        values.append('%04d-%02d-%02d' % (random.randint(1990, 2030),
+                                          random.randint(1, 12),
+                                          random.randint(1, 28)))
+    values = values[:distinct]
+    return [random.choice(values) for _ in range(rows)]
+
+
+def bench(label, fn, rows):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print('%-20s %8.2fs %10.0f rows/s' % (label, elapsed, rows / elapsed))
+    return elapsed
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    data = column(rows, distinct)
+    print('%d rows, %d distinct' % (rows, len(set(data))))
+
+    loop = bench('Date() loop', lambda: [Date(s, tz='US/Eastern') for s in data], rows)
+    many = bench('parse_many()', lambda: list(timestring.parse_many(data, tz='US/Eastern')), rows)
+    print('speedup %.1fx' % (loop / many))
+    if workers is not None:
+        pool = bench('parse_many(workers)',
+                     lambda: list(timestring.parse_many(data, tz='US/Eastern', workers=workers)),
+                     rows)
+        print('speedup %.1fx' % (loop / pool))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Search adversarial text: `findall` over inputs built to make a regex
+backtrack, at doubling sizes.  Time per character should stay flat as the
+input grows; a column that doubles with it is quadratic.
+
+    python benchmarks/pathological.py [largest size]
+"""
+import sys
+import time
+
+import timestring
+
+INPUTS = [
+    ('years', lambda n: '2017 ' * n),
+    ('numbers', lambda n: '1 ' * n + 'x'),
+    ('decimals', lambda n: '1.1 ' * n + 'x'),
+    ('number words', lambda n: 'one ' * n + 'x'),
+    ('run-on words', lambda n: 'four' * n + 'x'),
+    ('lead words', lambda n: 'the last ' * n + '5'),
+    ('separators', lambda n: '12' + ' ' * n + 'x'),
+    ('padding', lambda n: 'x' + ' ' * n + '5pm'),
+    ('of', lambda n: '5th' + ' ' * n + 'of' + ' ' * n + 'x'),
+    ('prefixes', lambda n: 'greater than ' * n),
+    ('conjunctions', lambda n: '5pm, and ' * n + 'x'),
+    ('times', lambda n: '12:3' * n),
+    ('dates', lambda n: '6/16/' * n),
+]
+
+
+def timed(text):
+    best = None
+    for _ in range(3):
+        started = time.perf_counter()
+        timestring.findall(text)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    sizes = []
+    size = largest
+    while size >= largest // 8:
+        sizes.insert(0, size)
+        size //= 2
+
+    print('%-14s' % 'us/char' + ''.join('%10d' % size for size in sizes) + '    growth')
+    for name, build in INPUTS:
+        row = []
+        for size in sizes:
+            text = build(size)
+            row.append(timed(text) / len(text) * 1e6)
+        print('%-14s' % name + ''.join('%10.3f' % cost for cost in row) +
+              '%9.1fx' % (row[-1] / row[0]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Probe events against saved Ranges: `RangeIndex.stab` against a linear
+scan with `date in range`.
+
+    python benchmarks/range_index.py [ranges] [events]
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from timestring import Date, Range, RangeIndex
+
+
+def main():
+    n_ranges = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    n_events = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    rng = random.Random(0)
+    base = datetime(2017, 1, 1)
+
+    ranges = []
+    for _ in range(n_ranges):
+        start = base + timedelta(minutes=rng.randrange(365 * 24 * 60))
+        ranges.append(Range(start, start + timedelta(minutes=rng.randrange(10, 3 * 24 * 60))))
+    events = [Date(base + timedelta(minutes=rng.randrange(365 * 24 * 60))) for _ in range(n_events)]
+
+    started = time.perf_counter()
+    index = RangeIndex(ranges)
+    built = time.perf_counter() - started
+
+    started = time.perf_counter()
+    found = [index.stab(event) for event in events]
+    indexed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scanned = [[r for r in ranges if event in r] for event in events]
+    linear = time.perf_counter() - started
+
+    assert [sorted(map(id, f)) for f in found] == [sorted(map(id, s)) for s in scanned]
+    print('%d ranges, %d events, %.1f matches per event'
+          % (n_ranges, n_events, sum(map(len, found)) / n_events))
+    print('build index %8.3fs' % built)
+    print('stab        %8.3fs  %8.1fus per event' % (indexed, indexed / n_events * 1e6))
+    print('linear scan %8.3fs  %8.1fus per event' % (linear, linear / n_events * 1e6))
+
+
+if __name__ == '__main__':
+    main()
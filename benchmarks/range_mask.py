@@ -0,0 +1,40 @@
+"""Filter an event stream of epoch seconds by a Range: `Range.mask` against
+`Date(seconds) in Range` one event at a time.
+
+    python benchmarks/range_mask.py [events]
+"""
+import sys
+import time
+
+import numpy as np
+
+from timestring import Date, Range
+
+# the per-event loop is timed on this many events and scaled up
+LOOP_SAMPLE = 100000
+
+
+def main():
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7
+    now = time.time()
+    seconds = np.random.uniform(now - 365 * 86400, now, events)
+    _range = Range('last 30 days')
+
+    started = time.perf_counter()
+    mask = _range.mask(seconds)
+    vectorized = time.perf_counter() - started
+
+    sample = seconds[:LOOP_SAMPLE]
+    started = time.perf_counter()
+    loop = [Date(second) in _range for second in sample.tolist()]
+    looped = (time.perf_counter() - started) * events / len(sample)
+
+    # Date(seconds) drops the fraction, so seconds are compared whole
+    assert loop == _range.mask(np.floor(sample)).tolist()
+    print('%d events, %d in %s' % (events, mask.sum(), _range))
+    print('Range.mask   %8.3fs' % vectorized)
+    print('loop of `in` %8.3fs (estimated from %d events)' % (looped, len(sample)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+"""Time the hot paths of timestring on realistic inputs.
+
+Every benchmark applies one operation (a parse, a comparison, a shift, ...)
+to each item of a small corpus and reports operations per second, the best
+of a few rounds, and the memory that one operation allocates at its peak,
+measured with tracemalloc after the timing has warmed every cache.  A
+benchmark the timestring under test cannot run is reported as n/a.
+
+    python benchmarks/suite.py [-k NAME] [--seconds S] [--json FILE]
+    python benchmarks/suite.py --compare REV [REV]
+
+``--compare`` runs this suite against the timestring of each git revision,
+or of the working tree when only one is given, and prints the speed of the
+second relative to the first.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from functools import lru_cache
+
+import pytz
+
+import timestring
+from timestring import Date, Range
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+NOW = datetime(2017, 6, 16, 19, 37, 22)
+
+RELATIVE = ['today', 'tomorrow at noon', 'yesterday', 'next tuesday', 'last friday',
+            '3 days ago', 'in 2 weeks', 'in 10 minutes', 'day before yesterday',
+            'next friday at 5pm', '1 hour ago', 'this morning']
+ABSOLUTE = ['jan 5th 2017', 'june 16th at 7:37pm', '06/16/2017', 'may of 2014',
+            'nov 11 at 11:11', "sep 5th '12 at 7:35:00 am", '2017/12/11', '10:30 am']
+ISO = ['2024-03-05', '2024-03-05T12:30:00', '2024-03-05T12:30:00.123456',
+       '2024-03-05T12:30:00+02:00', '2024-03-05T12:30:00Z', '2024-W10-2']
+RANGES = ['next 2 weeks', 'this month', 'last year', 'since monday', 'today',
+          'between jan 1 and feb 2', 'last 10 years', 'next 30 minutes']
+POSTGRES = ['["2014-03-06 15:33:43.764419-05","2014-03-07 15:33:43.764419-05")',
+            '["2017-06-16 00:00:00+00",infinity)',
+            '("2013-01-01 00:00:00-08","2014-01-01 00:00:00-08"]']
+ZONES = [None, 'UTC', 'US/Eastern', 'Europe/Paris', 'Asia/Kolkata']
+
+
+@lru_cache()
+def moments(count):
+    """:return: `count` Dates an hour and a bit apart, naive and in several zones"""
+    dates = []
+    for i in range(count):
+        naive = datetime(2017, 1, 1 + i % 28, i % 24, i * 7 % 60)
+        zone = ZONES[i % len(ZONES)]
+        dates.append(Date(naive if zone is None else pytz.timezone(zone).localize(naive)))
+    return dates
+
+
+@lru_cache()
+def ranges(count):
+    dates = moments(count)
+    return [Range(date, date.plus_(1 + i % 48, 'hours')) for i, date in enumerate(dates)]
+
+
+def same(count):
+    return [Date(datetime(2017, 1, 1 + i % 28, i % 24)) for i in range(count)]
+
+
+def chat(messages):
+    # imported here, so that an older timestring fails this benchmark alone
+    from findall import corpus
+    return list(corpus(messages, 0.3))
+
+
+def pairs(items):
+    return list(zip(items, items[1:]))
+
+
+def benchmarks():
+    """:return: [(name, operation, a function building the items)]"""
+    return [
+        ('Date relative', lambda text: Date(text, now=NOW), lambda: RELATIVE),
+        ('Date absolute', lambda text: Date(text, now=NOW), lambda: ABSOLUTE),
+        ('Date iso', Date, lambda: ISO),
+        ('Range relative', lambda text: Range(text, now=NOW), lambda: RANGES),
+        ('Range postgres', Range, lambda: POSTGRES),
+        ('parse', lambda text: timestring.parse(text), lambda: RELATIVE + ABSOLUTE),
+        ('findall', lambda text: timestring.findall(text), lambda: chat(50)),
+        ('Date < Date', lambda pair: pair[0] < pair[1], lambda: pairs(same(200))),
+        ('Date < Date mixed tz', lambda pair: pair[0] < pair[1], lambda: pairs(moments(200))),
+        ('Date == Date mixed tz', lambda pair: pair[0] == pair[1], lambda: pairs(moments(200))),
+        ('sort 1000 Dates mixed tz', sorted, lambda: [moments(1000)]),
+        ('sort 1000 Ranges', sorted, lambda: [ranges(1000)]),
+        ('Date in Range', lambda pair: pair[0] in pair[1],
+         lambda: list(zip(moments(200), ranges(200)[1:]))),
+        ('Range in Range', lambda pair: pair[0] in pair[1], lambda: pairs(ranges(200))),
+        ('Date.plus', lambda date: date.plus('3 days'), lambda: moments(200)),
+        ('Date.plus_', lambda date: date.plus_(3, 'days'), lambda: moments(200)),
+        ('Range.plus_', lambda span: span.plus_(90, 'minutes'), lambda: ranges(200)),
+        ('Range.elapse', lambda span: span.elapse, lambda: ranges(200)),
+    ]
+
+
+def passes_of(operation, items, passes):
+    started = time.perf_counter()
+    for _ in range(passes):
+        for item in items:
+            operation(item)
+    return time.perf_counter() - started
+
+
+def ops_per_second(operation, items, seconds, rounds=3):
+    # as many passes over `items` as fill a round of `seconds` / `rounds`
+    passes = 1
+    while passes_of(operation, items, passes) < seconds / rounds / 4:
+        passes *= 4
+    best = min(passes_of(operation, items, passes) for _ in range(rounds))
+    return passes * len(items) / best
+
+
+def bytes_per_op(operation, items):
+    tracemalloc.start()
+    total = 0
+    for item in items:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        operation(item)
+        total += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return total / len(items)
+
+
+def run(pattern: str, seconds: float):
+    """:return: {name: {'ops': operations per second, 'bytes': peak bytes per op}}"""
+    results = {}
+    for name, operation, build in benchmarks():
+        if pattern and pattern.lower() not in name.lower():
+            continue
+        try:
+            items = build()
+            ops = ops_per_second(operation, items, seconds)
+        except Exception as e:
+            # a revision without the feature, or without a module it needs
+            print('%-26s %12s        %s: %s' % (name, 'n/a', type(e).__name__, e))
+            sys.stdout.flush()
+            continue
+        results[name] = dict(ops=ops, bytes=bytes_per_op(operation, items))
+        print('%-26s %12.0f ops/s %10.0f B/op' % (name, ops, results[name]['bytes']))
+        sys.stdout.flush()
+    return results
+
+
+def run_at(revision, args):
+    """:return: the results of this suite against the timestring of `revision`,
+        or of the working tree for None"""
+    with tempfile.TemporaryDirectory() as tree:
+        if revision is None:
+            path = ROOT
+        else:
+            archive = subprocess.run(['git', 'archive', revision], cwd=ROOT,
+                                     stdout=subprocess.PIPE, check=True).stdout
+            subprocess.run(['tar', '-x', '-C', tree], input=archive, check=True)
+            path = tree
+        output = os.path.join(tree, 'results.json')
+        print('== %s' % (revision or 'working tree'))
+        sys.stdout.flush()
+        subprocess.run([sys.executable, os.path.abspath(__file__), '-k', args.k,
+                        '--seconds', str(args.seconds), '--json', output],
+                       env=dict(os.environ, PYTHONPATH=path), check=True)
+        with open(output) as f:
+            return json.load(f)
+
+
+def compare(revisions, args):
+    if len(revisions) == 1:
+        revisions = revisions + [None]
+    before, after = [run_at(revision, args) for revision in revisions]
+    print('\n%-26s %12s %12s %8s' % ('', revisions[0], revisions[1] or 'working tree', 'speed'))
+    for name, _, _ in benchmarks():
+        if name in before and name in after:
+            print('%-26s %12.0f %12.0f %7.2fx' % (name, before[name]['ops'], after[name]['ops'],
+                                                  after[name]['ops'] / before[name]['ops']))
+        elif name in before or name in after:
+            ops = ['%12.0f' % side[name]['ops'] if name in side else '%12s' % 'n/a'
+                   for side in (before, after)]
+            print('%-26s %s %s %8s' % (name, ops[0], ops[1], 'n/a'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-k', default='', help='only the benchmarks whose name contains this')
+    parser.add_argument('--seconds', type=float, default=1.0, help='time spent on each benchmark')
+    parser.add_argument('--json', help='also write the results to this file')
+    parser.add_argument('--compare', nargs='+', metavar='REV', help='git revisions to compare')
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(args.compare[:2], args)
+        return
+    results = run(args.k, args.seconds)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
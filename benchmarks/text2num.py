@@ -0,0 +1,49 @@
+"""Read the number words `TIMESTRING_RE` matches: `text2num` against
+word2number's `w2n.word_to_num`, when it is installed.
+
+    python benchmarks/text2num.py [rounds]
+"""
+import sys
+import time
+
+from timestring.text2num import text2num
+
+WORDS = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine',
+         'ten', 'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 'sixteen',
+         'seventeen', 'eighteen', 'nineteen', 'twenty', 'thirty', 'forty', 'fifty',
+         'sixty', 'seventy', 'eighty', 'ninety', 'hundred', 'twenty four',
+         'thirty six', 'ninety nine', 'two hundred', 'one hundred twenty',
+         'twelve hundred']
+
+
+def timed(function, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for word in WORDS:
+            function(word)
+    return time.perf_counter() - started
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    calls = rounds * len(WORDS)
+
+    print('%d calls' % calls)
+    cached = timed(text2num, rounds)
+    print('text2num          %8.3fs %6.2fus/call' % (cached, cached / calls * 1e6))
+    uncached = timed(text2num.__wrapped__, rounds)
+    print('text2num uncached %8.3fs %6.2fus/call' % (uncached, uncached / calls * 1e6))
+
+    try:
+        from word2number import w2n
+    except ImportError:
+        print('word2number is not installed')
+        return
+    assert [w2n.word_to_num(word) for word in WORDS] == [text2num(word) for word in WORDS]
+    w2n_time = timed(w2n.word_to_num, rounds)
+    print('w2n.word_to_num   %8.3fs %6.2fus/call (%.0fx)' % (w2n_time, w2n_time / calls * 1e6,
+                                                       w2n_time / cached))
+
+
+if __name__ == '__main__':
+    main()
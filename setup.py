@@ -37,4 +37,5 @@ code.
       include_package_data=True,
       zip_safe=True,
       install_requires=["pytz"],
+      extras_require={'numpy': ["numpy"]},
       entry_points={'console_scripts': ['timestring=timestring:main']})
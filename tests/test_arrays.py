@@ -0,0 +1,134 @@
+import os
+import time
+import unittest
+from array import array
+from datetime import datetime, timedelta
+
+import pytz
+from freezegun import freeze_time
+
+from timestring import Date, Range, DateArray, RangeArray, INFINITY, TimestringInvalid
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    def test_storage(self):
+        dates = DateArray.parse(['today', 'bogus', 'infinity', '2017-06-01'], errors='coerce')
+        self.assertEqual(dates.ns.dtype, np.int64)
+        self.assertEqual(dates.valid.tolist(), [True, False, True, True])
+        self.assertEqual(dates.infinite.tolist(), [False, False, True, False])
+        self.assertEqual(list(dates)[:2], [Date('today'), None])
+        self.assertIs(dates[2].date, INFINITY)
+        self.assertEqual(dates[3], datetime(2017, 6, 1))
+
+        values = dates.to_datetime64()
+        self.assertEqual(values[0], np.datetime64('2017-06-16T00:00'))
+        self.assertTrue(np.isnat(values[1]))
+        np.testing.assert_array_equal(DateArray.from_datetime64(values).ns, dates.ns)
+
+    def test_aware(self):
+        dates = DateArray([datetime(2017, 1, 5, 9), Date('2017-06-16T12:00Z')], tz='US/Eastern')
+        self.assertEqual(dates.tz.zone, 'US/Eastern')
+        self.assertEqual(dates.to_datetime64()[0], np.datetime64('2017-01-05T14:00'))
+        self.assertEqual(dates[1].hour, 8)
+        # a naive value is read in the zone of the array
+        self.assertEqual((dates == datetime(2017, 1, 5, 9)).tolist(), [True, False])
+        with self.assertRaises(TypeError):
+            dates < DateArray([datetime(2017, 1, 5)])
+
+    def test_compare(self):
+        dates = DateArray([datetime(2017, 6, 15), datetime(2017, 6, 17), None, 'infinity'])
+        self.assertEqual((dates < Date('today')).tolist(), [True, False, False, False])
+        self.assertEqual((dates > datetime(2017, 6, 16)).tolist(), [False, True, False, True])
+        self.assertEqual((dates == 'infinity').tolist(), [False, False, False, True])
+        self.assertEqual((Date('today') < dates).tolist(), [False, True, False, True])
+        self.assertEqual((dates >= dates).tolist(), [True, True, False, True])
+
+    def test_plus_minus(self):
+        dates = DateArray([datetime(2017, 6, 16), None, 'infinity'])
+        self.assertEqual(dates.plus(1, 'day')[0], datetime(2017, 6, 17))
+        self.assertEqual(dates.minus('90 minutes')[0], datetime(2017, 6, 15, 22, 30))
+        self.assertEqual((dates + timedelta(seconds=1))[0], datetime(2017, 6, 16, 0, 0, 1))
+        self.assertEqual(dates.plus(np.array([1, 2, 3]), 'hours')[0], datetime(2017, 6, 16, 1))
+        self.assertIsNone(dates.plus(1, 'day')[1])
+        self.assertIs(dates.plus(1, 'day')[2].date, INFINITY)
+        with self.assertRaises(TimestringInvalid):
+            dates.plus(1, 'month')
+
+        delta = dates.plus(1, 'hour') - dates
+        self.assertEqual(delta[0], np.timedelta64(1, 'h'))
+        self.assertTrue(np.isnat(delta[1]) and np.isnat(delta[2]))
+
+    def test_within(self):
+        dates = DateArray.parse(['yesterday', 'today 9am', 'june 30', 'infinity'])
+        for _range in Range('today'), Range('today', 'infinity'), Range('infinity'):
+            self.assertEqual(dates.within(_range).tolist(), [date in _range for date in dates])
+        self.assertEqual(dates.within(Range('today')).tolist(), [False, True, False, False])
+        self.assertIn(Range('today'), dates)
+        self.assertNotIn(Range('next year'), dates)
+        self.assertIn(Date('today 9am'), dates)
+
+        # a naive range is read in the zone of the array
+        eastern = DateArray.parse(['today'], tz='US/Eastern')
+        self.assertEqual(eastern.within(Range(datetime(2017, 6, 16), datetime(2017, 6, 17))).tolist(), [True])
+
+    def test_range_mask(self):
+        _range = Range('today')
+        dates = [Date('yesterday'), Date('today 9am'), Date('tomorrow'), Date('june 30')]
+        expected = [date in _range for date in dates]
+
+        seconds = np.array([date.to_unixtime() for date in dates])
+        self.assertEqual(_range.mask(seconds).tolist(), expected)
+        self.assertEqual(_range.contains_many(seconds.astype(np.int64)).tolist(), expected)
+        self.assertEqual(_range.mask(array('d', seconds)).tolist(), expected)
+        self.assertEqual(_range.mask(DateArray(dates)).tolist(), expected)
+        values = np.array([date.date for date in dates], dtype='datetime64[ns]')
+        self.assertEqual(_range.mask(values).tolist(), expected)
+
+        self.assertEqual(_range.mask([np.nan, np.inf]).tolist(), [False, False])
+        self.assertEqual(Range('today', 'infinity').mask([np.nan, np.inf, 0]).tolist(), [False, True, False])
+        self.assertEqual(Range('infinity').mask(np.array(['NaT', '1970-01-01'], dtype='datetime64[ns]')).tolist(),
+                         [False, True])
+
+        # seconds are instants; datetime64 values are wall times
+        eastern = Range('today', tz='US/Eastern')
+        self.assertEqual(eastern.mask([1497585600, 1497585599]).tolist(), [True, False])
+        self.assertEqual(eastern.mask(np.array(['2017-06-16T00:00'], dtype='datetime64[ns]')).tolist(), [True])
+
+        with self.assertRaises(TypeError):
+            _range.mask(['today'])
+
+    def test_ranges(self):
+        ranges = RangeArray.parse(['this week', 'next week', 'bogus', 'infinity'], errors='coerce')
+        self.assertEqual(ranges[0], Range('this week'))
+        self.assertIsNone(ranges[2])
+        self.assertIs(ranges[3].start.date, INFINITY)
+        self.assertEqual(ranges.start[1], datetime(2017, 6, 19))
+        self.assertEqual(ranges.contains(Date('today')).tolist(), [True, False, False, True])
+        self.assertEqual(ranges.contains(DateArray.parse(['today', 'today', 'today', 'today'])).tolist(),
+                         [True, False, False, True])
+        self.assertIn(Date('june 20'), ranges)
+
+        later = ranges.plus(1, 'week')
+        self.assertEqual(later[0], Range('next week'))
+        self.assertIs(later[3].end.date, INFINITY)
+
+        start, end = ranges.to_datetime64()
+        ranges = RangeArray.from_datetime64(start, end, tz='UTC')
+        self.assertEqual(ranges[1].start, pytz.utc.localize(datetime(2017, 6, 19)))
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+import os
+import time
+import unittest
+from datetime import datetime
+
+from freezegun import freeze_time
+
+import timestring
+from timestring import Date, Range, TimestringInvalid
+
+
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    def test_dates(self):
+        dates = list(timestring.parse_many(['today', 'tomorrow', 'today', None]))
+        self.assertEqual(dates, [datetime(2017, 6, 16), datetime(2017, 6, 17),
+                                 datetime(2017, 6, 16), datetime(2017, 6, 16, 19, 37, 22)])
+
+        # repeated inputs are independent objects
+        self.assertIsNot(dates[0], dates[2])
+        dates[0].day = 1
+        self.assertEqual(dates[2].day, 16)
+
+    def test_ranges(self):
+        ranges = list(timestring.parse_many(['next week', 'next week'], kind='range'))
+        self.assertEqual(ranges[0].start, datetime(2017, 6, 19))
+        self.assertEqual(ranges[1].end, datetime(2017, 6, 26))
+        self.assertIsNot(ranges[0].start, ranges[1].start)
+
+    def test_pinned(self):
+        now = datetime(2017, 1, 1)
+        dates = timestring.parse_many(['yesterday', '1 hour ago'], now=now)
+        self.assertEqual(list(dates), [datetime(2016, 12, 31), datetime(2016, 12, 31, 23)])
+
+        date, = timestring.parse_many(['today'], tz='US/Central')
+        self.assertEqual(date.tz.zone, 'US/Central')
+        self.assertEqual(date, Date('today', tz='US/Central'))
+
+        # the same as a Date/Range per item, also for a naive now
+        now = datetime(2017, 6, 16, 12)
+        data = ['2017-06-16 10:00', 'noon', 'today']
+        for kind, parse in (('date', Date), ('range', Range)):
+            results = timestring.parse_many(data, tz='US/Eastern', now=now, kind=kind)
+            for text, result in zip(data, results):
+                expected = parse(text, tz='US/Eastern', now=now)
+                self.assertEqual(str(result), str(expected), text)
+                self.assertEqual(repr(result.tz if kind == 'date' else result.start.tz),
+                                 repr(expected.tz if kind == 'date' else expected.start.tz), text)
+
+    def test_errors(self):
+        data = ['today', 'santa monica', 'tomorrow', 'santa monica']
+        with self.assertRaises(TimestringInvalid):
+            list(timestring.parse_many(data))
+        self.assertEqual(list(timestring.parse_many(data, errors='coerce')),
+                         [datetime(2017, 6, 16), None, datetime(2017, 6, 17), None])
+        self.assertEqual(list(timestring.parse_many(data, errors='skip')),
+                         [datetime(2017, 6, 16), datetime(2017, 6, 17)])
+
+        with self.assertRaises(ValueError):
+            timestring.parse_many(data, kind='month')
+
+        # failures deep in the date arithmetic are invalid inputs too
+        data = ["'17 99 1497571200 days", '99999999999999 6:35 pm from', 'tomorrow']
+        for kind in ('date', 'range'):
+            results = list(timestring.parse_many(data, kind=kind, errors='coerce'))
+            self.assertEqual(len(results), 3)
+            self.assertEqual(len(list(timestring.parse_many(data, kind=kind, errors='skip'))),
+                             len([result for result in results if result is not None]))
+        self.assertEqual(list(timestring.parse_many(data, kind='range', errors='skip')),
+                         [Range('tomorrow')])
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
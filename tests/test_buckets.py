@@ -0,0 +1,109 @@
+import os
+import time
+import unittest
+from datetime import datetime
+
+import pytz
+from freezegun import freeze_time
+
+from timestring import Date, DateArray, INFINITY, TimestringInvalid, floor, ceil
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    def test_scalar(self):
+        self.assertEqual(floor(Date('now'), 'hour'), Date('today 19:00'))
+        self.assertIsInstance(floor(Date('now'), 'hour'), Date)
+        self.assertEqual(ceil(datetime(2017, 6, 16, 19, 37), 'hour'), datetime(2017, 6, 16, 20))
+        self.assertEqual(floor('now', '15 minutes'), Date('today 19:30'))
+        self.assertEqual(floor(datetime(2017, 6, 16, 19, 37), 'month'), datetime(2017, 6, 1))
+        self.assertEqual(floor(datetime(2017, 8, 16), '3 months'), datetime(2017, 7, 1))
+        self.assertEqual(ceil(datetime(2017, 8, 16), 'year'), datetime(2018, 1, 1))
+        # a boundary is its own ceiling
+        self.assertEqual(ceil(datetime(2017, 6, 16), 'day'), datetime(2017, 6, 16))
+        self.assertIs(floor(Date('infinity'), 'day').date, INFINITY)
+
+        # Friday the 16th
+        self.assertEqual(floor(datetime(2017, 6, 16), 'week'), datetime(2017, 6, 12))
+        self.assertEqual(floor(datetime(2017, 6, 16), 'week', week_start=7), datetime(2017, 6, 11))
+        self.assertEqual(ceil(datetime(2017, 6, 16), 'week', week_start=5), datetime(2017, 6, 16))
+
+        self.assertEqual(floor([Date('now'), Date('yesterday 8:20')], 'day'),
+                         [Date('today'), Date('yesterday')])
+
+        with self.assertRaises(TimestringInvalid):
+            floor(Date('now'), 'weekend')
+
+    def test_tz(self):
+        eastern = pytz.timezone('US/Eastern')
+        # 19:37 UTC is 15:37 in New York
+        self.assertEqual(floor(Date('now'), 'day', tz='US/Eastern'),
+                         eastern.localize(datetime(2017, 6, 16)))
+        # the day clocks go forward is 23 hours long
+        day = eastern.localize(datetime(2017, 3, 12, 12))
+        self.assertEqual(floor(day, 'day'), eastern.localize(datetime(2017, 3, 12)))
+        self.assertEqual(ceil(day, 'day'), eastern.localize(datetime(2017, 3, 13)))
+        self.assertEqual(ceil(eastern.localize(datetime(2017, 3, 12, 1, 30)), 'hour'),
+                         eastern.localize(datetime(2017, 3, 12, 3)))
+        # the repeated hour has a boundary at each of its starts
+        first = eastern.localize(datetime(2017, 11, 5, 1, 30), is_dst=True)
+        self.assertEqual(floor(first, 'hour'), eastern.localize(datetime(2017, 11, 5, 1), is_dst=True))
+        self.assertEqual(ceil(first, 'hour'), eastern.localize(datetime(2017, 11, 5, 1), is_dst=False))
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_datetime64(self):
+        values = np.array(['2017-06-16T19:37:22', '2017-06-18T23:59', 'NaT', '2017-06-16'],
+                          dtype='datetime64[s]')
+        self.assertEqual(floor(values, 'day').tolist(),
+                         [datetime(2017, 6, 16), datetime(2017, 6, 18), None, datetime(2017, 6, 16)])
+        self.assertEqual(ceil(values, 'day').tolist(),
+                         [datetime(2017, 6, 17), datetime(2017, 6, 19), None, datetime(2017, 6, 16)])
+        self.assertEqual(floor(values, 'week', week_start=7)[:2].tolist(),
+                         [datetime(2017, 6, 11), datetime(2017, 6, 18)])
+        # UTC instants bucketed by their day in New York
+        self.assertEqual(floor(values, 'day', tz='US/Eastern')[:2].tolist(),
+                         [datetime(2017, 6, 16, 4), datetime(2017, 6, 18, 4)])
+
+        with self.assertRaises(TypeError):
+            floor(np.arange(3), 'day')
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_date_array(self):
+        dates = DateArray.parse(['now', 'infinity', 'bogus', 'yesterday 8:20'], errors='coerce')
+        hours = floor(dates, 'hour')
+        self.assertIsInstance(hours, DateArray)
+        self.assertEqual(hours[0], Date('today 19:00'))
+        self.assertIs(hours[1].date, INFINITY)
+        self.assertIsNone(hours[2])
+        self.assertEqual(hours[3], Date('yesterday 8:00'))
+
+        dates = DateArray([datetime(2017, 6, 16, 1)], tz='UTC')
+        # 9pm the day before in New York
+        self.assertEqual(floor(dates, 'day', tz='US/Eastern')[0], Date('2017-06-15 04:00Z'))
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_consistent(self):
+        values = np.arange(np.datetime64('2017-11-04'), np.datetime64('2017-11-06'),
+                           np.timedelta64(13, 'm')).astype('datetime64[ns]')
+        for unit in ('hour', '2 hours', 'day', 'week', 'month'):
+            for bucket in (floor, ceil):
+                vectorized = bucket(values, unit, tz='US/Eastern')
+                scalar = [bucket(pytz.utc.localize(value), unit, tz='US/Eastern')
+                          for value in values.astype('datetime64[us]').tolist()]
+                self.assertEqual(vectorized.astype('datetime64[us]').tolist(),
+                                 [date.astimezone(pytz.utc).replace(tzinfo=None) for date in scalar])
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+import os
+import time
+import unittest
+from datetime import datetime
+
+from freezegun import freeze_time
+
+import timestring
+from timestring import Date, Range
+
+
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    def setUp(self):
+        timestring.enable_cache(2)
+
+    def tearDown(self):
+        timestring.disable_cache()
+
+    def test_counters(self):
+        Date('yesterday')
+        Date(' Yesterday ')
+        info = timestring.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+        Date('today')
+        Date('tomorrow')
+        info = timestring.cache_info()
+        self.assertEqual((info.evictions, info.currsize), (1, 2))
+
+        timestring.cache_clear()
+        self.assertEqual(timestring.cache_info(), (0, 0, 0, 2, 0))
+
+    def test_now_independent(self):
+        self.assertEqual(Date('yesterday'), datetime(2017, 6, 15))
+        self.assertEqual(Date('yesterday', now=datetime(2017, 1, 2)),
+                         datetime(2017, 1, 1))
+        self.assertEqual(timestring.cache_info().hits, 1)
+
+        start, end = Range('last 7 days')
+        with freeze_time('2018-01-01'):
+            self.assertEqual(Range('last 7 days').end, datetime(2018, 1, 1))
+        self.assertEqual(Range('last 7 days').start, start)
+
+    def test_range_parses_once(self):
+        timestring.enable_cache(64)
+        for text in ('next week', 'last month', 'next weekend', '1 hour ago',
+                     'jan 5th 2017 at 3pm', 'fri 3pm'):
+            timestring.cache_clear()
+            Range(text)
+            info = timestring.cache_info()
+            self.assertEqual((info.misses, info.currsize), (1, 1), text)
+
+        # ISO-8601 never reaches the natural language parser
+        timestring.cache_clear()
+        Range('2014-03-06 15:33:43-05')
+        Date('2024-03-05T12:30:00Z')
+        self.assertEqual(timestring.cache_info().misses, 0)
+
+    def test_disabled(self):
+        timestring.disable_cache()
+        Date('yesterday')
+        Date('yesterday')
+        self.assertEqual(timestring.cache_info(), (0, 0, 0, 0, 0))
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
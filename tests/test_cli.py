@@ -0,0 +1,125 @@
+import io
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from freezegun import freeze_time
+
+import timestring
+from timestring import cli
+
+NOW = datetime(2017, 6, 16, 19, 37, 22)
+
+
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    def batch(self, text, **kwargs):
+        out = io.StringIO()
+        cli.batch(io.StringIO(text), out, **kwargs)
+        return out.getvalue().splitlines()
+
+    def test_batch_tsv(self):
+        self.assertEqual(self.batch('today\nbogus\nnext week\ntoday\n'), [
+            'today\t2017-06-16T00:00:00\t2017-06-17T00:00:00',
+            'bogus\t',
+            'next week\t2017-06-19T00:00:00\t2017-06-26T00:00:00',
+            'today\t2017-06-16T00:00:00\t2017-06-17T00:00:00'])
+        self.assertEqual(self.batch('tomorrow 5pm\r\n', kind='date'),
+                         ['tomorrow 5pm\t2017-06-17T17:00:00'])
+        self.assertEqual(self.batch('since monday\n', kind='range'),
+                         ['since monday\t2017-06-12T00:00:00\t2017-06-16T19:37:22'])
+        self.assertEqual(self.batch(''), [])
+
+        # a line the date arithmetic cannot hold fails alone
+        self.assertEqual(self.batch("today\n'17 99 1497571200 days\ntomorrow\n", kind='date'), [
+            'today\t2017-06-16T00:00:00',
+            "'17 99 1497571200 days\t",
+            'tomorrow\t2017-06-17T00:00:00'])
+
+    def test_batch_jsonl(self):
+        lines = [json.loads(line) for line in self.batch('today\nbogus\nnoon\n', format='jsonl')]
+        self.assertEqual(lines[0], dict(input='today', start='2017-06-16T00:00:00',
+                                        end='2017-06-17T00:00:00'))
+        self.assertEqual(lines[1], dict(input='bogus', error='Invalid timestring: bogus'))
+        lines = [json.loads(line) for line in self.batch('noon\n', format='jsonl', kind='date')]
+        self.assertEqual(lines, [dict(input='noon', date='2017-06-16T12:00:00')])
+
+    def test_batch_options(self):
+        # the reference time is the one given, not the clock
+        self.assertEqual(self.batch('tomorrow\n', kind='date', now=datetime(2020, 1, 31)),
+                         ['tomorrow\t2020-02-01T00:00:00'])
+        eastern = timestring.Date('2017-06-16 10:00', tz='US/Eastern')
+        self.assertEqual(self.batch('noon\n', kind='date', tz='US/Eastern', now=eastern),
+                         ['noon\t2017-06-16T12:00:00-04:00'])
+        self.assertEqual(self.batch('today\nbogus\n', verbose=True), [
+            'today\t2017-06-16T00:00:00\t2017-06-17T00:00:00\trelative_day=today',
+            'bogus\t\t'])
+        line = json.loads(self.batch('today\n', format='jsonl', verbose=True)[0])
+        self.assertEqual(line['matches'], dict(relative_day='today'))
+
+    def test_main(self):
+        with mock.patch('sys.stdin', io.StringIO('today\nnoon\n')), \
+                mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            timestring.main(['--batch', '-d', '--now', '2017-01-01 08:00', '-z', 'UTC'])
+        self.assertEqual(out.getvalue().splitlines(), ['today\t2017-01-01T00:00:00+00:00',
+                                                       'noon\t2017-01-01T12:00:00+00:00'])
+
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            timestring.main(['-d', 'tomorrow'])
+        self.assertEqual(out.getvalue().strip(), str(timestring.Date('tomorrow')))
+
+        with mock.patch('sys.stderr', new_callable=io.StringIO):
+            self.assertRaises(SystemExit, timestring.main, ['--format', 'xml', '--batch'])
+            self.assertRaises(SystemExit, timestring.main, ['-v'])
+
+    def test_serve(self):
+        path = os.path.join(tempfile.mkdtemp(), 'timestring.sock')
+        server = cli.make_server(path, kind='date', format='jsonl', now=NOW)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            client = socket.socket(socket.AF_UNIX)
+            client.connect(path)
+            with client, client.makefile('rwb') as f:
+                f.write(b"tomorrow 5pm\nbogus\n'17 99 1497571200 days\n")
+                f.flush()
+                self.assertEqual(json.loads(f.readline()),
+                                 dict(input='tomorrow 5pm', date='2017-06-17T17:00:00'))
+                self.assertEqual(json.loads(f.readline())['input'], 'bogus')
+                self.assertIn('error', json.loads(f.readline()))
+            # building a server does not touch the process-wide cache
+            self.assertEqual(timestring.cache_info().maxsize, 0)
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+            os.unlink(path)
+
+    def test_main_serve(self):
+        try:
+            with mock.patch.object(cli, 'make_server') as make_server:
+                server = make_server.return_value
+                server.serve_forever.side_effect = KeyboardInterrupt
+                server.server_address = ('127.0.0.1', 8000)
+                timestring.main(['--serve', '127.0.0.1:8000', '-d', '--format', 'jsonl'])
+            make_server.assert_called_once_with('127.0.0.1:8000', 'date', 'jsonl', None, None, False)
+            server.server_close.assert_called_once_with()
+            self.assertEqual(timestring.cache_info().maxsize, cli.SERVE_CACHE_SIZE)
+        finally:
+            timestring.disable_cache()
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,15 @@
 import os
+import pickle
 import time
 import unittest
+from copy import copy
 from datetime import datetime, timedelta
 
 from ddt import ddt
 from freezegun import freeze_time
 
-from timestring import Date, TimestringInvalid
+from timestring import Date, INFINITY, TimestringInvalid
+from timestring.timezones import localize
 
 
 @freeze_time('2017-06-16 19:37:22')
@@ -85,6 +88,9 @@ class T(unittest.TestCase):
         for x in ['yestserday', 'Satruday', Exception]:
             with self.assertRaises(TimestringInvalid):
                 Date(x)
+        with self.assertRaises(TimestringInvalid):
+            Date('next tuesday at noon', max_input_length=10)
+        self.assertEqual(Date('tuesday', max_input_length=10), Date('tuesday'))
 
     def test_weekdays(self):
         now = datetime.now()
@@ -238,6 +244,64 @@ class T(unittest.TestCase):
         self.assert_date('in 45 minutes', datetime(2017, 6, 16, 20, 22, 22))
         self.assert_date('in 45 seconds', datetime(2017, 6, 16, 19, 38, 7))
 
+    def test_compact(self):
+        date = Date('today')
+        self.assertFalse(hasattr(date, '__dict__'))
+        self.assertFalse(hasattr(date, '_original'))
+        try:
+            Date.debug = True
+            self.assertEqual(Date('today')._original, 'today')
+        finally:
+            Date.debug = False
+
+        infinity = Date('infinity')
+        self.assertIs(infinity.date, INFINITY)
+        self.assertEqual(infinity.date, 'infinity')
+        self.assertIs(pickle.loads(pickle.dumps(infinity)).date, INFINITY)
+        self.assertIs(copy(infinity).date, INFINITY)
+
+    def test_compare(self):
+        date = Date(datetime(2017, 6, 16, 12))
+        infinity = Date('infinity')
+
+        self.assertTrue(date < Date(datetime(2017, 6, 17)))
+        self.assertTrue(date < datetime(2017, 6, 17))
+        self.assertTrue(date == datetime(2017, 6, 16, 12))
+        self.assertTrue(date > 1497571200)  # 2017-06-16 00:00 UTC
+        self.assertTrue(date < 'infinity')
+        self.assertTrue(infinity == 'infinity')
+        self.assertTrue(infinity > date)
+        self.assertTrue(infinity > 'now')
+        self.assertFalse(date == 'infinity')
+
+        # aware and naive values compare in the zone of the aware one
+        aware = Date(localize(datetime(2017, 6, 16, 12), 'US/Eastern'))
+        self.assertIsNotNone(aware.date.tzinfo)
+        self.assertTrue(aware == datetime(2017, 6, 16, 12))
+        self.assertTrue(Date(datetime(2017, 6, 16, 12)) == aware)
+        self.assertFalse(aware == Date(datetime(2017, 6, 16, 16)))
+        self.assertFalse(Date(datetime(2017, 6, 16, 16)) == aware)
+        self.assertTrue(aware < Date(datetime(2017, 6, 16, 13)))
+        self.assertTrue(Date(datetime(2017, 6, 16, 13)) > aware)
+        self.assertTrue(Date(datetime(2017, 6, 16, 11)) < aware)
+        self.assertTrue(aware > datetime(2017, 6, 16, 11))
+        self.assertTrue(aware == Date(localize(datetime(2017, 6, 16, 16), 'UTC')))
+
+        self.assertFalse(date == 'today')
+        with self.assertRaises(TypeError):
+            date < 'tomorrow'
+        try:
+            Date.coerce_strings = True
+            self.assertTrue(date < 'tomorrow')
+            self.assertTrue(date >= 'today')
+        finally:
+            Date.coerce_strings = False
+
+        dates = [infinity, Date(datetime(2017, 6, 17)), date,
+                 Date(localize(datetime(2017, 6, 16, 21), 'US/Eastern'))]
+        # naive Dates read as UTC: 12:00, then 21:00 EDT (01:00 UTC on the 17th)
+        self.assertEqual(sorted(dates, key=Date.sort_key), [date, dates[1], dates[3], infinity])
+
 
 def main():
     os.environ['TZ'] = 'UTC'
@@ -0,0 +1,69 @@
+import os
+import pickle
+import time
+import unittest
+from copy import copy
+from datetime import datetime
+
+import pytz
+from freezegun import freeze_time
+
+from timestring import Date, Range, FrozenDate, FrozenRange
+
+
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    def test_date(self):
+        date = Date('today').freeze()
+        self.assertIsInstance(date, FrozenDate)
+        self.assertEqual(date, datetime(2017, 6, 16))
+        self.assertEqual(len({date, FrozenDate('today'), FrozenDate('tomorrow')}), 2)
+        self.assertEqual({date: 1}[FrozenDate(datetime(2017, 6, 16))], 1)
+
+        with self.assertRaises(AttributeError):
+            date.year = 2000
+        with self.assertRaises(AttributeError):
+            date.tz = 'UTC'
+        self.assertEqual(date + '1 day', datetime(2017, 6, 17))
+
+        self.assertEqual(pickle.loads(pickle.dumps(date)), date)
+        self.assertEqual(hash(copy(date)), hash(date))
+
+    def test_hash_instant(self):
+        utc = FrozenDate(pytz.utc.localize(datetime(2017, 6, 16, 12)))
+        eastern = FrozenDate(pytz.timezone('US/Eastern').localize(datetime(2017, 6, 16, 8)))
+        naive = FrozenDate(datetime(2017, 6, 16, 12))
+        self.assertEqual(utc, eastern)
+        self.assertEqual(len({utc, eastern}), 1)
+        self.assertEqual(len({naive, FrozenDate('2017-06-16 12:00')}), 1)
+        # naive == aware compares wall times in the aware zone, so they
+        # equal different instants and are kept apart
+        self.assertEqual(naive, utc)
+        self.assertEqual(FrozenDate(datetime(2017, 6, 16, 8)), eastern)
+        self.assertEqual(len({utc, eastern, naive}), 2)
+
+        infinity = FrozenDate('infinity')
+        self.assertEqual(hash(infinity), hash(Date('infinity').freeze()))
+        self.assertNotEqual(hash(infinity), hash(naive))
+
+    def test_range(self):
+        r = Range('next week').freeze()
+        self.assertIsInstance(r, FrozenRange)
+        self.assertIsInstance(r.start, FrozenDate)
+        self.assertEqual(len({r, FrozenRange('next week'), FrozenRange('this week')}), 2)
+        with self.assertRaises(AttributeError):
+            r.tz = 'UTC'
+        with self.assertRaises(AttributeError):
+            r.start.day = 1
+        self.assertEqual(pickle.loads(pickle.dumps(r)), r)
+        self.assertEqual(r.start, datetime(2017, 6, 19))
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+# A budget in milliseconds for `import timestring`, measured with
+# `python -X importtime` and bytecode cached, e.g. 120 (it takes about 50ms;
+# numpy alone would add 100ms).  Wall time depends on the machine, so the
+# check only runs when a budget is given.
+IMPORT_BUDGET_MS = os.environ.get('TIMESTRING_IMPORT_BUDGET_MS')
+
+# loaded on first use, never by `import timestring`
+DEFERRED = ('numpy', 'pytz', 'argparse', 'psycopg2', 'timestring.arrays', 'timestring.buckets')
+
+
+class T(unittest.TestCase):
+    def run_python(self, code, *options):
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=self.cache)
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        return subprocess.run([sys.executable] + list(options) + ['-c', code], env=env,
+                              cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              capture_output=True, text=True, check=True)
+
+    def setUp(self):
+        self.cache = tempfile.mkdtemp()
+
+    def test_deferred(self):
+        loaded = self.run_python('import sys, timestring; print(" ".join(sys.modules))').stdout.split()
+        self.assertEqual([name for name in DEFERRED if name in loaded], [])
+        # and still there when asked for
+        self.run_python('import timestring; timestring.DateArray; timestring.floor; timestring.TIMESTRING_RE')
+
+    @unittest.skipUnless(IMPORT_BUDGET_MS, 'TIMESTRING_IMPORT_BUDGET_MS is not set')
+    def test_budget(self):
+        # write the bytecode
+        self.run_python('import timestring; timestring.Date("now"); timestring.floor("now", "day")')
+        best = None
+        for _ in range(3):
+            report = self.run_python('import timestring', '-X', 'importtime').stderr
+            cumulative = int(report.strip().splitlines()[-1].split('|')[1]) / 1000.
+            best = cumulative if best is None else min(best, cumulative)
+        self.assertLess(best, float(IMPORT_BUDGET_MS))
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+import os
+import random
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from freezegun import freeze_time
+
+from timestring import Date, Range, RangeIndex
+
+
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        base = datetime(2017, 1, 1)
+        self.ranges = []
+        for _ in range(500):
+            start = base + timedelta(hours=rng.randrange(24 * 365))
+            self.ranges.append(Range(start, start + timedelta(hours=rng.randrange(1, 24 * 30))))
+        self.ranges += [Range('infinity'),
+                        Range(Date('infinity'), Date('feb 10 2017')),
+                        Range(Date('jul 20 2017'), Date('infinity'))]
+        self.index = RangeIndex(self.ranges)
+
+    def assert_same(self, found, expected):
+        self.assertEqual(sorted(map(id, found)), sorted(map(id, expected)))
+
+    def test_stab(self):
+        for date in [Date('jan 1 2017'), Date('feb 10 2017'), Date('today'),
+                     Date('dec 31 2017'), Date('2019-01-01'), Date('infinity')]:
+            self.assert_same(self.index.stab(date), [r for r in self.ranges if date in r])
+        self.assert_same(self.index.stab(datetime(2016, 1, 1)), self.ranges[-3:-1])
+
+    def test_containing(self):
+        for _range in self.ranges[:50] + [Range('this week'), Range('next year')]:
+            self.assert_same(self.index.containing(_range), [r for r in self.ranges if _range in r])
+
+    def test_overlapping(self):
+        _range = Range('this week')
+        found = self.index.overlapping(_range)
+        self.assert_same(found, [r for r in self.ranges
+                                 if r.start.date == 'infinity' or r.start <= _range.end
+                                 if r.end.date == 'infinity' or r.end >= _range.start])
+        self.assertEqual(found, sorted(found, key=lambda r: r.start.sort_key() if r.start.date != 'infinity' else (False, 0)))
+
+    def test_add_remove(self):
+        index = RangeIndex()
+        this_week = Range('this week')
+        index.add(this_week)
+        index.add(Range('this week'))
+        index.add(Range('today'))
+        self.assertEqual(len(index), 3)
+
+        index.remove(this_week)
+        self.assertEqual(len(index), 2)
+        self.assertFalse(any(r is this_week for r in index))
+        self.assertEqual(len(index.stab(Date('today'))), 2)
+
+        index.remove(Range('this week'))
+        with self.assertRaises(ValueError):
+            index.remove(Range('this week'))
+        self.assertEqual(list(index), [Range('today')])
+
+        for _range in self.ranges:
+            self.index.remove(_range)
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.stab(Date('today')), [])
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import os
+import time
+import unittest
+from datetime import datetime, timedelta
+
+import pytz
+from ddt import ddt, data, unpack
+from freezegun import freeze_time
+
+from timestring import Date, Range
+from timestring.iso import parse_iso
+
+
+@ddt
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    @data(
+        ('2024-03-05', datetime(2024, 3, 5)),
+        ('2024-03', datetime(2024, 3, 1)),
+        ('2024-065', datetime(2024, 3, 5)),
+        ('2024-W10-2', datetime(2024, 3, 5)),
+        ('2024W102', datetime(2024, 3, 5)),
+        ('2024-03-05 12:30', datetime(2024, 3, 5, 12, 30)),
+        ('2024-03-05T12:30:45.5', datetime(2024, 3, 5, 12, 30, 45, 500000)),
+        ('2024-03-05t12:30:45,123456789', datetime(2024, 3, 5, 12, 30, 45, 123456)),
+        ('2024-03-05T12:30:00Z', datetime(2024, 3, 5, 12, 30, tzinfo=pytz.utc)),
+        ('20240305T123000Z', datetime(2024, 3, 5, 12, 30, tzinfo=pytz.utc)),
+        ('2024-03-05T12:30:00+02:00', datetime(2024, 3, 5, 10, 30, tzinfo=pytz.utc)),
+        ('2024-03-05T12:30:00-0530', datetime(2024, 3, 5, 18, 0, tzinfo=pytz.utc)),
+        # postgresql timestamptz text is naive UTC
+        ('2014-03-06 15:33:43.764419-05', datetime(2014, 3, 6, 20, 33, 43, 764419)),
+        ('2013-12-09 06:57:46-05', datetime(2013, 12, 9, 11, 57, 46)),
+    )
+    @unpack
+    def test_date(self, text, expected):
+        date = Date(text)
+        self.assertEqual(date.date, expected)
+        self.assertEqual(date.tz is None, expected.tzinfo is None)
+
+    def test_offset(self):
+        self.assertEqual(Date('2024-03-05T12:30:00+02:00').date.utcoffset(), timedelta(hours=2))
+
+    def test_tz(self):
+        date = Date('2024-03-05 12:30', tz='US/Central')
+        self.assertEqual(date.date, pytz.timezone('US/Central').localize(datetime(2024, 3, 5, 12, 30)))
+        self.assertEqual(Date('2024-07-05', tz='US/Central').date.utcoffset(), timedelta(hours=-5))
+        self.assertEqual(Date('2024-03-05T12:30:00Z', tz='US/Central').tz, pytz.utc)
+
+    @data(
+        ('2024-03-05', datetime(2024, 3, 5), datetime(2024, 3, 6)),
+        ('2024-03', datetime(2024, 3, 1), datetime(2024, 4, 1)),
+        ('2024-W10', datetime(2024, 3, 4), datetime(2024, 3, 11)),
+        ('2024-03-05T12', datetime(2024, 3, 5, 12), datetime(2024, 3, 5, 13)),
+        ('2024-03-05 12:30', datetime(2024, 3, 5, 12, 30), datetime(2024, 3, 5, 12, 31)),
+        ('2024-03-05 12:30:01.5', datetime(2024, 3, 5, 12, 30, 1, 500000),
+         datetime(2024, 3, 5, 12, 30, 2, 500000)),
+    )
+    @unpack
+    def test_range(self, text, start, end):
+        r = Range(text)
+        self.assertEqual(r.start, start)
+        self.assertEqual(r.end, end)
+
+    @data('2024-13-01', '2023-366', '2024-03-05T25:00', '2024-03-05T12:00+25:00')
+    def test_fallback(self, text):
+        # not valid ISO-8601, left to the natural language parser
+        self.assertIsNone(parse_iso(text))
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
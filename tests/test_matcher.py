@@ -0,0 +1,118 @@
+import os
+import random
+import time
+import unittest
+
+from datetime import datetime
+
+from freezegun import freeze_time
+
+from timestring import Range, matcher
+from timestring.timestring_re import TIMESTRING_RE, LEAD_RE, COMPONENT_RES, MAX_NUMBER_WORDS
+
+WORDS = '''the of in a by mid after near about than greater since until this last next
+monday tues sunny novel octopus mayor hourglass weekly it's s h d m y q T am pm noon
+12 2017 '15 7:35 5th 06/16 - / . , < > = @ twentyone fifteen ninety one couple'''.split()
+
+SAMPLES = ['last 10 years', 'eighteen hours ago', 'since last Thursday', 'may of 2014',
+           '2012-09-5T monday', 'day before yesterday', 'next 2.5 months', 'afternoon',
+           'around this time', 'midnight', 'greater than a week', "sep 5th '12 at 7:35:00 am",
+           '1374681560', 'between jan 1 and feb 2', 'in 3 d', 'the next hour', 'the day',
+           'until 6/16/2017', 'by this time', 'from now', 'tues at 5pm', '16 june, 2017']
+
+
+def texts(count, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        parts = [rng.choice(SAMPLES) if rng.random() < 0.3 else rng.choice(WORDS)
+                 for _ in range(rng.randint(1, 12))]
+        text = ''.join(part + rng.choice([' ', '', '  ', ', ', '\n']) for part in parts)
+        yield text
+        yield text.upper()
+
+
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    def assertSameMatch(self, expected, found, text):
+        if expected is None:
+            self.assertIsNone(found, text)
+            return
+        self.assertIsNotNone(found, text)
+        self.assertEqual(found.span(), expected.span(), text)
+        self.assertEqual(found.group(1), expected.group(1), text)
+        self.assertEqual(found.groupdict(), expected.groupdict(), text)
+
+    def test_same_matches(self):
+        for text in texts(80):
+            for pos in range(len(text) + 1):
+                self.assertSameMatch(TIMESTRING_RE.match(text, pos), matcher.match(text, pos), text)
+            self.assertSameMatch(TIMESTRING_RE.search(text), matcher.search(text), text)
+            self.assertEqual([m.span() for m in matcher.scan(text)],
+                             [m.span() for m in TIMESTRING_RE.finditer(text)], text)
+
+    def test_first_chars(self):
+        # every component found starts with a character it is dispatched on
+        for text in texts(40, seed=1):
+            for pos in range(len(text)):
+                char = text[pos].lower()
+                lead = LEAD_RE.match(text, pos) is not None
+                for kind, full, bare in COMPONENT_RES:
+                    if bare.match(text, pos):
+                        self.assertIn(char, matcher.FIRST_CHARS[kind], (kind, text, pos))
+                    if lead and full.match(text, pos):
+                        self.assertIn(char, matcher.FIRST_CHARS[kind] + matcher.LEAD_CHARS[kind],
+                                      (kind, text, pos))
+                    elif not lead:
+                        self.assertEqual(bool(full.match(text, pos)), bool(bare.match(text, pos)))
+
+    def test_match(self):
+        match = matcher.search('lunch next tuesday at noon')
+        self.assertEqual(match.span(), (6, 26))
+        self.assertEqual(match.group(), 'next tuesday at noon')
+        self.assertEqual(set(match.groupdict()), set(TIMESTRING_RE.groupindex))
+        self.assertEqual(match.group('next'), 'next')
+        self.assertEqual(match.group('daytime'), 'noon')
+        self.assertIsNone(match.group('month'))
+        with self.assertRaises(IndexError):
+            match.group('bogus')
+        self.assertEqual(matcher.match('after 1374681560').groupdict()['unixtime'], '1374681560')
+        self.assertIsNone(matcher.match('nothing here'))
+        self.assertIsNone(matcher.search('nothing here'))
+
+    def test_pathological(self):
+        # each took from seconds to hours while the number of a duration
+        # could be given back, or a run of separators was tried at every offset
+        self.assertEqual(len(list(matcher.scan('2017 ' * 2000))), 1)
+        self.assertEqual(matcher.search('2017 ' * 30 + 'x').span(), (0, 150))
+        self.assertIsNone(matcher.search('one ' * 2000 + 'x'))
+        self.assertEqual(matcher.search('x' + ' ' * 20000 + '5pm').span(), (20001, 20004))
+        self.assertIsNone(matcher.search('5th' + ' ' * 20000 + 'x'))
+        self.assertEqual(matcher.search('5th' + ' ' * 20000 + 'of june').span(), (0, 20010))
+        # a number of more than MAX_NUMBER_WORDS words is read from its end
+        match = matcher.search('one ' * (MAX_NUMBER_WORDS + 4) + 'days')
+        self.assertEqual(match.group('num'), 'one ' * MAX_NUMBER_WORDS)
+
+        # and TIMESTRING_RE, whole: a timestring does not start inside a run
+        # of separators
+        self.assertIsNone(TIMESTRING_RE.search(' -/' * 7000 + 'x'))
+        self.assertIsNone(TIMESTRING_RE.search('12' + ' ' * 20000 + 'x'))
+        self.assertEqual(TIMESTRING_RE.search('x' + ' ' * 20000 + '5th june').span(), (1, 20009))
+
+    def test_separator_runs(self):
+        # a run of separators inside a timestring is still part of it
+        for text in ('tuesday - 3 jan', 'monday / 5 june', 'days -2-jan', 'last  -5 jan'):
+            self.assertEqual([m.span() for m in TIMESTRING_RE.finditer(text)], [(0, len(text))], text)
+            self.assertEqual([m.span() for m in matcher.scan(text)], [(0, len(text))], text)
+        self.assertEqual(Range('tuesday - 3 jan').start, datetime(2018, 1, 3))
+        self.assertEqual(Range('at 10am - 5th june').start, datetime(2017, 6, 5, 10))
+        self.assertEqual(Range('since friday - 12 march').start, datetime(2017, 3, 12))
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+import os
+import time
+import unittest
+from datetime import datetime
+
+from freezegun import freeze_time
+
+import timestring
+from timestring import TimestringInvalid
+from timestring.parallel import parse_parallel
+
+
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    now = datetime(2017, 1, 1)
+
+    def parse(self, data, errors='raise', kind='date'):
+        return list(parse_parallel(data, self.now, kind, errors, None, None, 1,
+                                   workers=2, chunksize=3, threshold=4))
+
+    def test_ordered(self):
+        data = ['%d days ago' % (i % 7) for i in range(40)] + ['today', 'tomorrow']
+        expected = list(timestring.parse_many(data, now=self.now))
+        self.assertEqual(self.parse(data), expected)
+        self.assertEqual(self.parse(iter(data)), expected)
+
+        ranges = self.parse(['next week', 'this year', 'next week', 'today', 'today'], kind='range')
+        self.assertEqual([r.start for r in ranges],
+                         [datetime(2017, 1, 2), datetime(2017, 1, 1), datetime(2017, 1, 2),
+                          datetime(2017, 1, 1), datetime(2017, 1, 1)])
+        self.assertIsNot(ranges[3].start, ranges[4].start)
+
+    def test_errors(self):
+        data = ['today', 'santa monica', 'tomorrow', 'santa monica', 'today']
+        with self.assertRaises(TimestringInvalid):
+            self.parse(data)
+        self.assertEqual(self.parse(data, errors='coerce'),
+                         [datetime(2017, 1, 1), None, datetime(2017, 1, 2), None,
+                          datetime(2017, 1, 1)])
+        self.assertEqual(len(self.parse(data, errors='skip')), 3)
+
+    def test_serial_fallback(self):
+        data = ['today', 'yesterday']
+        self.assertEqual(list(timestring.parse_many(data, workers=4)),
+                         [datetime(2017, 6, 16), datetime(2017, 6, 15)])
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
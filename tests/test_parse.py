@@ -0,0 +1,61 @@
+import os
+import pickle
+import time
+import unittest
+from datetime import datetime
+
+from freezegun import freeze_time
+
+import timestring
+from timestring import Date, Range, TimestringInvalid
+
+
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    def test_compile(self):
+        plan = timestring.compile('Last 7 Days')
+        self.assertEqual(plan.text, 'last 7 days')
+        self.assertEqual(plan.number, 7)
+        self.assertEqual(plan.delta, 'days')
+        self.assertTrue(plan.prev)
+
+        with self.assertRaises(TimestringInvalid):
+            timestring.compile('santa monica')
+
+    def test_evaluate(self):
+        plan = timestring.compile('tuesday at 10pm')
+        self.assertEqual(plan.to_date(), Date('tuesday at 10pm'))
+        self.assertEqual(plan.to_date(now=datetime(2017, 1, 1)),
+                         datetime(2017, 1, 3, 22))
+
+        plan = timestring.compile('next week')
+        for now in (datetime(2017, 6, 16), datetime(2020, 2, 29, 12)):
+            expected = Range('next week', now=now)
+            actual = plan.to_range(now=now)
+            self.assertEqual(actual.start, expected.start)
+            self.assertEqual(actual.end, expected.end)
+
+        start, end = timestring.compile('this week').to_range(week_start=7)
+        self.assertEqual(start, datetime(2017, 6, 11))
+        self.assertEqual(end, datetime(2017, 6, 18))
+
+        self.assertEqual(timestring.compile('today').to_date(tz='US/Central').tz.zone,
+                         'US/Central')
+
+    def test_immutable(self):
+        plan = timestring.compile('3 days ago')
+        with self.assertRaises(AttributeError):
+            plan.num = '4'
+        self.assertEqual(pickle.loads(pickle.dumps(plan)), plan)
+        self.assertEqual(pickle.loads(pickle.dumps(plan)).to_date(),
+                         datetime(2017, 6, 13, 19, 37, 22))
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -72,6 +72,10 @@ class T(unittest.TestCase):
         for date_str in ['yestserday', 'Satruday', Exception]:
             with self.assertRaises(TimestringInvalid):
                 Range(date_str)
+        with self.assertRaises(TimestringInvalid):
+            Range('last 10 years', max_input_length=10)
+        with self.assertRaises(TimestringInvalid):
+            Range('today', 'next tuesday', max_input_length=10)
 
     def test_explicit_end(self):
         self.assert_range('2012 feb 2 1:13PM to 6:41 am on sept 8 2012',
@@ -245,6 +249,13 @@ class T(unittest.TestCase):
             offset=dict(day=5, hour=4, minute=3, second=2, microsecond=1)
         )
 
+    def test_postgres_offset(self):
+        # the offset is undone on the parsed side, never on now
+        for text in ('since 2014-03-06 15:33:43-05', 'by 2014-03-06 15:33:43-05'):
+            r = Range(text)
+            self.assertEqual(r.start.date, datetime(2014, 3, 6, 20, 33, 43), text)
+            self.assertEqual(r.end.date, datetime(2017, 6, 16, 19, 37, 22), text)
+
     def test_lengths(self):
         day = 24 * 60 * 60
         week = 7 * day
@@ -262,6 +273,33 @@ class T(unittest.TestCase):
         self.assertEqual(len(Range('10 s')), 10)
         self.assertEqual(len(Range('10s')), 10)
 
+    def test_duration(self):
+        _range = Range(datetime(2017, 6, 16, 9), datetime(2017, 6, 16, 10, 30, 0, 500000))
+        self.assertEqual(_range.duration(), timedelta(hours=1, minutes=30, microseconds=500000))
+        self.assertEqual(_range.total_seconds(), 5400.5)
+        self.assertEqual(len(_range), 5400)
+        self.assertEqual(_range.elapse_parts(), (0, 0, 0, 1, 30, 0))
+        self.assertEqual(_range.elapse, '1 hours 30 minutes ')
+
+        # by the instants, not the wall times, across a change of offset
+        _range = Range('2017-03-11 12:00', '2017-03-12 12:00', tz='US/Eastern')
+        self.assertEqual(_range.total_seconds(), 23 * 3600)
+        self.assertEqual(len(_range), 23 * 3600)
+
+        parts = Range(datetime(2016, 1, 1), datetime(2017, 2, 15, 6)).elapse_parts()
+        self.assertEqual((parts.years, parts.months, parts.days, parts.hours), (1, 1, 16, 6))
+        self.assertEqual(Range(datetime(2016, 1, 1), datetime(2017, 2, 15, 6)).elapse,
+                         '1 years 1 months 16 days 6 hours ')
+
+        _range = Range(Date('today'), Date('infinity'))
+        self.assertEqual(_range.total_seconds(), float('inf'))
+        self.assertIsNone(_range.duration())
+        self.assertIsNone(_range.elapse_parts())
+        self.assertEqual(_range.elapse, 'infinity')
+        self.assertTrue(_range)
+        with self.assertRaises(OverflowError):
+            len(_range)
+
     def test_contains(self):
         self.assertTrue(Date('yesterday') in Range('last 7 days'))
         self.assertTrue(Date('today') in Range('this month'))
@@ -1288,6 +1326,42 @@ class T(unittest.TestCase):
                               datetime(2017, 6, 19, WEEKEND_END_HOUR),
                               week_start=0)
 
+    def test_each(self):
+        self.assertEqual([d.hour for d in Range('today').each('6 hours')], [0, 6, 12, 18])
+        self.assertEqual([d.month for d in Range('this year').each('quarter')], [1, 4, 7, 10])
+        self.assertEqual([d.day for d in Range('this month').each('week', week_start=7)], [4, 11, 18, 25])
+        self.assertEqual(len(list(Range('this month').each('15 minutes'))), 30 * 24 * 4)
+        self.assertEqual([d.day for d in Range(Date('jan 31 2017'), Date('may 1 2017')).each('month', align=False)],
+                         [31, 28, 31, 30])
+
+        buckets = list(Range(Date('today 10:20'), Date('today 13:50')).each('1 hour', ranges=True))
+        self.assertEqual([(r.start.hour, r.start.minute) for r in buckets], [(10, 20), (11, 0), (12, 0), (13, 0)])
+        self.assertEqual(buckets[-1].end, datetime(2017, 6, 16, 13, 50))
+        self.assertEqual([d.minute for d in Range(Date('today 10:20'), Date('today 11:00')).each(600, align=False)],
+                         [20, 30, 40, 50])
+
+        # days keep their wall time across DST, hours are exact
+        days = list(Range('2017-03-11', '2017-03-14', tz='US/Eastern').each('day'))
+        self.assertEqual([d.hour for d in days], [0, 0, 0])
+        self.assertEqual(days[2].date.utcoffset(), timedelta(hours=-4))
+        hours = Range('2017-03-12T00:00', '2017-03-12T04:00', tz='US/Eastern').each(timedelta(hours=1))
+        self.assertEqual([d.hour for d in hours], [0, 1, 3])
+
+        forever = Range(Date('today'), Date('infinity')).each('minute')
+        self.assertEqual(next(forever), datetime(2017, 6, 16))
+        with self.assertRaises(TimestringInvalid):
+            Range('today').each('1.5 months')
+        with self.assertRaises(TimestringInvalid):
+            Range('infinity').each('day')
+
+    def test_next_prev(self):
+        self.assertEqual(Range('today').next(), Range('tomorrow'))
+        self.assertEqual(Range('today').prev(2), Range('2 days ago'))
+        self.assertEqual(tuple(Range('this month').next()), (datetime(2017, 7, 1), datetime(2017, 8, 1)))
+        self.assertEqual(tuple(Range('this month').prev(2)), (datetime(2017, 4, 1), datetime(2017, 5, 1)))
+        self.assertEqual(tuple(Range('this week').next(3)), (datetime(2017, 7, 3), datetime(2017, 7, 10)))
+        self.assertEqual(tuple(Range('this year').prev()), (datetime(2016, 1, 1), datetime(2017, 1, 1)))
+
 
 def main():
     os.environ['TZ'] = 'UTC'
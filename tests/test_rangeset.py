@@ -0,0 +1,66 @@
+import os
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from freezegun import freeze_time
+
+from timestring import Date, Range, RangeSet, INFINITY
+
+
+def hours(*pairs):
+    base = datetime(2017, 6, 16)
+    return RangeSet(Range(base + timedelta(hours=a), base + timedelta(hours=b)) for a, b in pairs)
+
+
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    def test_normalize(self):
+        ranges = hours((5, 8), (0, 2), (1, 3), (3, 4), (6, 7), (9, 9))
+        self.assertEqual(ranges, hours((0, 4), (5, 8)))
+        self.assertEqual(len(ranges), 2)
+        self.assertEqual(list(ranges)[0], Range(datetime(2017, 6, 16), datetime(2017, 6, 16, 4)))
+        self.assertEqual(RangeSet(['today', 'tomorrow']), RangeSet([Range('today', 'jun 18')]))
+
+    def test_algebra(self):
+        a = hours((0, 4), (6, 10))
+        b = hours((2, 7), (9, 12))
+        self.assertEqual(a | b, hours((0, 12)))
+        self.assertEqual(a & b, hours((2, 4), (6, 7), (9, 10)))
+        self.assertEqual(a - b, hours((0, 2), (7, 9)))
+        self.assertEqual(b - a, hours((4, 6), (10, 12)))
+        self.assertEqual(a.complement(next(iter(hours((0, 12))))), hours((4, 6), (10, 12)))
+        self.assertEqual(a - hours((1, 2), (3, 7)), hours((0, 1), (2, 3), (7, 10)))
+        self.assertEqual(a | Range('tomorrow'), hours((0, 4), (6, 10), (24, 48)))
+
+    def test_infinity(self):
+        ranges = RangeSet([Range(Date('infinity'), Date('jun 1 2017')), Range('tomorrow')])
+        self.assertEqual(ranges.total_seconds(), float('inf'))
+        self.assertIsNone(ranges.duration())
+        self.assertIn(Date('infinity'), ranges)
+        self.assertIn(Date('2000-01-01'), ranges)
+        rest = ranges.complement()
+        self.assertEqual(len(rest), 2)
+        self.assertIs(list(rest)[-1].end.date, INFINITY)
+        self.assertEqual(rest | ranges, RangeSet([Range('infinity')]))
+
+    def test_contains_and_duration(self):
+        ranges = hours((0, 4), (6, 10))
+        self.assertIn(Date('today 3am'), ranges)
+        self.assertNotIn(Date('today 4am'), ranges)
+        self.assertNotIn(Date('yesterday'), ranges)
+        self.assertIn(Range(datetime(2017, 6, 16, 7), datetime(2017, 6, 16, 10)), ranges)
+        self.assertNotIn(Range(datetime(2017, 6, 16, 3), datetime(2017, 6, 16, 7)), ranges)
+        self.assertEqual(ranges.total_seconds(), 8 * 3600)
+        self.assertEqual(ranges.duration(), timedelta(hours=8))
+        self.assertEqual(RangeSet().duration(), timedelta(0))
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+import io
+import os
+import random
+import time
+import unittest
+
+from freezegun import freeze_time
+
+import timestring
+from timestring.search import scan
+from timestring.timestring_re import TIMESTRING_RE
+
+WORDS = '''the of in a by mid after near about than greater since money monday
+decide novel separate sunny wedding market octopus mayor hourglass secondly
+weekly quarterly it's s h d m y q T 12 2017 '15 - / . , < > = @ ( ) twentyone
+fifteen ninety one'''.split()
+
+SAMPLES = ['last 10 years', 'eighteen hours ago', 'since last Thursday', 'may of 2014',
+           '2012-09-5T monday', 'day before yesterday', 'next 2.5 months', 'afternoon',
+           'around this time', 'midnight', 'greater than a week', "sep 5th '12 at 7:35:00 am",
+           '1374681560', 'between jan 1 and feb 2', 'in 3 d', 'the next hour']
+
+
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    def test_same_matches(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            parts = [rng.choice(SAMPLES) if rng.random() < 0.2 else rng.choice(WORDS)
+                     for _ in range(rng.randint(1, 25))]
+            text = ''.join(part + rng.choice([' ', '', '  ', ', ', '\n']) for part in parts)
+            for text in (text, text.upper()):
+                self.assertEqual([m.span() for m in scan(text)],
+                                 [m.span() for m in TIMESTRING_RE.finditer(text)], text)
+
+    def test_findall(self):
+        self.assertEqual(timestring.findall('nothing to see here'), [])
+        found = timestring.findall('lunch with Ann: tomorrow at noon, then   next 2 weeks!')
+        self.assertEqual([text for text, _ in found], ['tomorrow at noon,', 'next 2 weeks'])
+        self.assertEqual(found[0][1], timestring.Date('tomorrow at noon'))
+        with self.assertRaises(timestring.TimestringInvalid):
+            timestring.findall('tomorrow at noon', max_input_length=10)
+
+    def test_finditer(self):
+        text = 'lunch with Ann: tomorrow at noon, then   next 2 weeks!\n' * 50
+        matches = list(timestring.finditer(text))
+        self.assertEqual(len(matches), 100)
+        for match in matches:
+            self.assertEqual(text[match.start:match.end], match.text)
+        self.assertEqual(matches[1].text, 'next 2 weeks')
+        self.assertIsInstance(matches[1].value, timestring.Range)
+        self.assertEqual(matches[2].value, timestring.Date('tomorrow at noon'))
+
+        for chunk_size in (1, 7, 64, 1000):
+            streamed = timestring.finditer(io.StringIO(text), chunk_size=chunk_size, overlap=32)
+            self.assertEqual([m.span() for m in streamed], [m.span() for m in matches])
+
+    def test_finditer_boundaries(self):
+        rng = random.Random(1)
+        text = ' '.join(rng.choice(SAMPLES + WORDS) for _ in range(2000))
+        expected = [m.span() for m in timestring.finditer(text)]
+        for chunk_size in (3, 50, 333):
+            streamed = timestring.finditer(io.StringIO(text), chunk_size=chunk_size, overlap=64)
+            self.assertEqual([m.span() for m in streamed], expected)
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
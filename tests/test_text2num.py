@@ -0,0 +1,60 @@
+import os
+import time
+import unittest
+
+from freezegun import freeze_time
+
+from timestring import Date, Range, TimestringInvalid
+from timestring.text2num import text2num
+from timestring.utils import get_num
+
+
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    def test_words(self):
+        self.assertEqual(text2num('sixty '), 60)
+        self.assertEqual(text2num('twenty-one'), 21)
+        self.assertEqual(text2num('one hundred and five'), 105)
+        self.assertEqual(text2num('a hundred'), 100)
+        self.assertEqual(text2num('million'), 1000000)
+        self.assertEqual(text2num('couple of'), 2)
+        self.assertEqual(text2num('Twelve Hundred'), 1200)
+        # digits and words mixed, as TIMESTRING_RE matches them
+        self.assertEqual(text2num('2 hundred'), 200)
+        self.assertEqual(text2num('1.5 thousand'), 1500)
+        self.assertIsInstance(text2num('twelve'), int)
+
+    def test_fractions(self):
+        self.assertEqual(text2num('half'), 0.5)
+        self.assertEqual(text2num('a half'), 0.5)
+        self.assertEqual(text2num('one and a half'), 1.5)
+        self.assertEqual(text2num('two and three quarters'), 2.75)
+        self.assertEqual(text2num('one point two five'), 1.25)
+
+    def test_invalid(self):
+        for text in ('', 'and', 'of', 'bogus', 'one bogus', 'one point twenty'):
+            with self.assertRaises(TimestringInvalid):
+                text2num(text)
+
+    def test_get_num(self):
+        self.assertEqual(get_num(3), 3)
+        self.assertEqual(get_num('3.5'), 3.5)
+        self.assertEqual(get_num('couple'), 2)
+        self.assertEqual(get_num(''), 1)
+        with self.assertRaises(TimestringInvalid):
+            get_num('bogus')
+
+    def test_parse(self):
+        self.assertEqual(Date('in two hundred days'), Date('now').plus('200 days'))
+        self.assertEqual(len(Range('couple of hours')), 2 * 60 * 60)
+        self.assertEqual(len(Range('next sixty minutes')), 60 * 60)
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
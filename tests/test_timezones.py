@@ -0,0 +1,84 @@
+import os
+import time
+import unittest
+from datetime import datetime, timedelta
+
+import pytz
+from freezegun import freeze_time
+
+import timestring
+from timestring import Date, Range, timezones
+
+
+@freeze_time('2017-06-16 19:37:22')
+class T(unittest.TestCase):
+    def tearDown(self):
+        timestring.set_backend('pytz')
+
+    def test_get_timezone(self):
+        eastern = timestring.get_timezone('US/Eastern')
+        self.assertIs(timestring.get_timezone('US/Eastern'), eastern)
+        self.assertIs(timestring.get_timezone(eastern), eastern)
+        self.assertIsNone(timestring.get_timezone(None))
+        with self.assertRaises(KeyError):
+            timestring.get_timezone('Mars/Olympus_Mons')
+
+    def test_tz_setter(self):
+        date = Date(datetime(2017, 1, 5, 9))
+        date.tz = 'US/Eastern'
+        # not the -04:56 local mean time of replace(tzinfo=...)
+        self.assertEqual(date.date.utcoffset(), timedelta(hours=-5))
+        self.assertEqual(date.hour, 9)
+
+        date.tz = 'Europe/Paris'
+        self.assertEqual(date.date.utcoffset(), timedelta(hours=1))
+        self.assertEqual(date.hour, 9)
+
+        date.tz = None
+        self.assertIsNone(date.tz)
+
+    def test_normalize(self):
+        date = Date('2017-03-11T12:00', tz='US/Eastern') + timedelta(days=1)
+        self.assertEqual(date.date.utcoffset(), timedelta(hours=-4))
+        self.assertEqual(date.hour, 13)
+
+    def test_normalize_gap(self):
+        # 02:00 to 03:00 does not exist on 2017-03-12 in US/Eastern
+        for backend in timezones.BACKENDS:
+            timestring.set_backend(backend)
+            for date in (Date('2017-03-12 01:30', tz='US/Eastern') + 3600,
+                         Date('2017-03-12 01:30', tz='US/Eastern') + timedelta(hours=1)):
+                self.assertEqual((date.hour, date.minute), (3, 30), backend)
+                self.assertEqual(date.date.utcoffset(), timedelta(hours=-4), backend)
+                self.assertEqual(date, pytz.utc.localize(datetime(2017, 3, 12, 7, 30)), backend)
+
+    def test_zoneinfo(self):
+        from zoneinfo import ZoneInfo
+        timestring.set_backend('zoneinfo')
+        self.assertEqual(timezones.get_backend(), 'zoneinfo')
+
+        self.assertEqual(Date('today', tz='Europe/Paris').tz, ZoneInfo('Europe/Paris'))
+        self.assertEqual(Date('today', tz='utc').tz, ZoneInfo('UTC'))
+        self.assertEqual(Date('2017-01-05T09:00', tz='US/Eastern'),
+                         pytz.utc.localize(datetime(2017, 1, 5, 14)))
+
+        _range = Range('2017-03-26', tz='Europe/Paris')
+        self.assertEqual(_range.start.date.utcoffset(), timedelta(hours=1))
+        self.assertEqual(_range.end.date.utcoffset(), timedelta(hours=2))
+
+        date = Date(datetime(2017, 1, 5, 9))
+        date.tz = 'US/Eastern'
+        self.assertEqual(date.date.utcoffset(), timedelta(hours=-5))
+
+        with self.assertRaises(ValueError):
+            timestring.set_backend('dateutil')
+
+
+def main():
+    os.environ['TZ'] = 'UTC'
+    time.tzset()
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -16,7 +16,8 @@ from timestring.timestring_re import TIMESTRING_RE as ts
 class T(unittest.TestCase):
     def test_parse(self):
         self.assertEqual(parse('tuesday at 10pm')['hour'], 22)
-        self.assertEqual(parse('tuesday at 10pm')['weekday'], 2)
+        # Date.weekday counts from monday = 0
+        self.assertEqual(parse('tuesday at 10pm')['weekday'], 1)
         self.assertEqual(parse('may of 2014')['year'], 2014)
 
     @data((1, 'one'),
@@ -1,14 +1,15 @@
 import re
 import time
 from copy import copy
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Union
 
-import pytz
-
 from timestring import TimestringInvalid, Context
-from .timestring_re import TIMESTRING_RE
-from .utils import get_num
+from .Plan import Plan, _compile, CLEAN_NUMBER, MONTH_ORDINALS, \
+    WEEKDAY_ORDINALS, RELATIVE_DAYS, DAYTIMES
+from . import timezones
+from .iso import parse_iso, localize
+from .utils import get_num, check_length
 
 try:
     unicode
@@ -16,35 +17,6 @@ except NameError:
     unicode = str
     long = int
 
-CLEAN_NUMBER = re.compile(r"[\D]")
-MONTH_ORDINALS = dict(
-    january=1, february=2, march=3, april=4, june=6,
-    july=7, august=8, september=9, october=10, november=11, december=12,
-    jan=1, feb=2, mar=3, apr=4, may=5, jun=6,
-    jul=7, aug=8, sep=9, sept=9, oct=10, nov=11, dec=12,
-)
-WEEKDAY_ORDINALS = dict(
-    monday=1, tuesday=2, wednesday=3, thursday=4, friday=5, saturday=6, sunday=7,
-    mon=1, tue=2, tues=2, wed=3, wedn=3, thu=4, thur=4, fri=5, sat=6, sun=7,
-    mo=1, tu=2, we=3, th=4, fr=5, sa=6, su=7,
-)
-RELATIVE_DAYS = {
-    'now': 0,
-    'today': 0,
-    'yesterday': -1,
-    'tomorrow': 1,
-    'day before yesterday': -2,
-    'day after tomorrow': 2,
-}
-DAYTIMES = dict(
-    morning=9,
-    noon=12,
-    afternoon=15,
-    evening=18,
-    night=21,
-    nighttime=21,
-    midnight=24
-)
 TIMEDELTA_UNITS = dict(
     w='weeks',
     d='days',
@@ -55,17 +27,43 @@ TIMEDELTA_UNITS = dict(
 )
 
 
+class _Infinity(str):
+    """The `date` of an infinite Date, a singleton equal to the string 'infinity'."""
+    __slots__ = ()
+
+    def __new__(cls):
+        return str.__new__(cls, 'infinity')
+
+    def __reduce__(self):
+        return 'INFINITY'
+
+
+INFINITY = _Infinity()
+
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
 class Date(object):
+    __slots__ = ('date', '_original')
+
+    # keep the input of every Date in `_original`, for debugging parses
+    debug = False
+    # parse strings other than 'infinity' when comparing against them
+    coerce_strings = False
+
     def __init__(self, date=None, offset: dict = None, tz: str = None,
-                 now: datetime = None, verbose=False, context=None):
-        self._original = date
-        if tz:
-            tz = pytz.timezone(str(tz))
-        else:
-            tz = None
+                 now: datetime = None, verbose=False, context=None, max_input_length: int = None):
+        if self.debug:
+            self._original = date
+        if isinstance(date, (str, unicode)):
+            check_length(date, max_input_length)
 
-        if not now:
-            now = datetime.now(tz)
+        if isinstance(now, Date):
+            now = now.date
+        iso = parse_iso(date) if isinstance(date, (str, unicode)) else None
 
         if isinstance(date, Date):
             self.date = copy(date.date)
@@ -79,156 +77,35 @@ class Date(object):
             self.date = datetime.fromtimestamp(int(date))
 
         elif date == 'now' or date is None:
-            self.date = datetime.now(tz)
+            self.date = now or timezones.now(tz)
 
         elif date == 'infinity':
-            self.date = 'infinity'
+            self.date = INFINITY
 
-        elif isinstance(date, (str, unicode)) and re.match(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+-\d{2}", date):
-            self.date = datetime.strptime(date[:-3], "%Y-%m-%d %H:%M:%S.%f") - timedelta(hours=int(date[-3:]))
+        elif iso:
+            self.date, unit, has_offset = iso
+            if not has_offset:
+                self.date = localize(self.date, tz, now)
+            if unit not in ('month', 'week', 'day'):
+                # No offset because the hour was set.
+                offset = False
 
-        elif isinstance(date, (str, unicode, dict)):
+        elif isinstance(date, (str, unicode, dict, Plan)):
             if type(date) in (str, unicode):
-                # Convert the string to a dict
-                _date = date.lower()
-                res = TIMESTRING_RE.search(_date.strip())
-
-                if res:
-                    date = res.groupdict()
-                    if verbose:
-                        print("Matches:\n", ''.join(["\t%s: %s\n" % (k, v) for k, v in date.items() if v]))
-                else:
+                plan = _compile(date)
+                if plan is None:
                     raise TimestringInvalid('Invalid date string: %s' % date)
+                if verbose:
+                    print("Matches:\n", ''.join(["\t%s: %s\n" % (k, v) for k, v in plan.groups if v]))
+            elif isinstance(date, dict):
+                plan = Plan.from_groups(date)
+            else:
+                plan = date
 
-                date = dict((k, v if type(v) is str else v) for k, v in date.items() if v)
-
-            new_date = copy(now)
-
-            # TODO Refactor
-            if isinstance(date, dict):  # This will always be True
-                unit = date.get('delta') or date.get('delta')
-                num = date.get('num')
-
-                if date.get('unixtime'):
-                    new_date = datetime.fromtimestamp(int(date.get('unixtime')))
-
-                # Number of (days|...) [ago]
-                elif num and unit:
-                    unit = unit.lower()
-                    if date.get('ago') or context == Context.PREV or date.get('prev'):
-                        sign = -1
-                    elif date.get('in') or date.get('from_now') or context == Context.NEXT or date.get('next'):
-                        sign = 1
-                    else:
-                        raise TimestringInvalid('Missing relationship such as "ago" or "from now"')
-
-                    new_date = Date(new_date).plus_(num, unit, sign).date
-
-                weekday = date.get('weekday')
-                relative_day = date.get('relative_day')
-                if weekday:
-                    new_date = new_date.replace(hour=0, minute=0, second=0, microsecond=0)
-                    iso = WEEKDAY_ORDINALS.get(weekday)
-                    if iso is not None:
-                        days = iso - new_date.isoweekday()
-                        if date.get('prev') or context == Context.PREV:
-                            if iso >= new_date.isoweekday():
-                                days -= 7
-                        elif not (days == 0 and context in [Context.PAST, Context.FUTURE]):
-                            if iso <= new_date.isoweekday():
-                                days += 7
-                        new_date += timedelta(days=days)
-                elif relative_day:
-                    days = RELATIVE_DAYS.get(re.sub(r'\s+', ' ', relative_day))
-                    if days:
-                        new_date += timedelta(days=days)
-                    new_date = new_date.replace(hour=0, minute=0, second=0, microsecond=0)
-
-                # !year
-                year = [int(CLEAN_NUMBER.sub('', date[key])) for key in ('year', 'year_2', 'year_3', 'year_4', 'year_5', 'year_6') if date.get(key)]
-                if year:
-                    if date.get('recurrence'):
-                        TimestringInvalid('"next" %s'% year)
-                    year = max(year)
-                    if len(str(year)) != 4:
-                        year += 2000 if year <= 40 else 1900
-                    new_date = new_date.replace(year=year)
-
-                # !month
-                month = [date.get(key) for key in ('month', 'month_1', 'month_2', 'month_3', 'month_4', 'month_5') if date.get(key)]
-                if month:
-                    month_ = max(month)
-                    if month_.isdigit():
-                        month_ord = int(month_)
-                        if not 1 <= month_ord <= 12:
-                            raise TimestringInvalid('Month not in range 1..12:' + month_)
-                    else:
-                        month_ord = MONTH_ORDINALS.get(month_, new_date.month)
-
-                    new_date = new_date.replace(month=int(month_ord))
-
-                    if year == []:
-                        if date.get('next') or context == Context.NEXT:
-                            if month_ord <= now.month:
-                                new_date = new_date.replace(year=new_date.year + 1)
-                        elif date.get('prev') or context == Context.PREV:
-                            if month_ord >= now.month:
-                                new_date = new_date.replace(year=new_date.year - 1)
-                        elif month_ord < now.month and not year:
-                            new_date = new_date.replace(year=new_date.year + 1)
-
-                # !day
-                day = [date.get(key) for key in ('date', 'date_2', 'date_3', 'date_4') if date.get(key)]
-                if day:
-                    if date.get('recurrence'):
-                        TimestringInvalid('"next" %s'% day)
-                    new_date = new_date.replace(day=int(max(day)))
-
-                # !daytime
-                daytime = date.get('daytime')
-                if daytime:
-                    if 'this time' not in daytime:
-                        _hour = DAYTIMES.get(date.get('daytime'), 12)
-                        new_date = new_date.replace(hour=_hour,
-                                                    minute=0,
-                                                    second=0,
-                                                    microsecond=0)
-                    # No offset because the hour was set.
-                    offset = False
-
-                # !hour
-                hour = [date.get(key) for key in ('hour', 'hour_2', 'hour_3') if date.get(key)]
-                if hour:
-                    new_date = new_date.replace(hour=int(max(hour)), minute=0, second=0)
-                    am = [date.get(key) for key in ('am', 'am_1') if date.get(key)]
-                    if am and max(am) in ('p', 'pm'):
-                        h = int(max(hour))
-                        if h < 12:
-                            new_date = new_date.replace(hour=h+12)
-                    # No offset because the hour was set.
-                    offset = False
-
-                    minute = [date.get(key) for key in ('minute', 'minute_2') if date.get(key)]
-                    if minute:
-                        new_date = new_date.replace(minute=int(max(minute)))
-
-                    seconds = date.get('seconds', 0)
-                    if seconds:
-                        new_date = new_date.replace(second=int(seconds))
-
-                    new_date = new_date.replace(microsecond=0)
-
-                    if not day and not relative_day and new_date < now:
-                        new_date += timedelta(days=1)
-
-                if year != [] and not month and weekday is None and not day:
-                    new_date = new_date.replace(month=1)
-                if (year != [] or month) and weekday is None and not (day or hour):
-                    new_date = new_date.replace(day=1)
-                if not hour and daytime is None and not unit:
-                    new_date = new_date.replace(hour=0, minute=0, second=0)
-
-            self.date = new_date
+            self.date, keep_offset = plan._resolve(now or timezones.now(tz), context)
+            if not keep_offset:
+                # No offset because the hour was set.
+                offset = False
 
         else:
             raise TimestringInvalid('Invalid type for constructing Date')
@@ -239,9 +116,14 @@ class Date(object):
     def __repr__(self):
         return "<timestring.Date %s %s>" % (str(self), id(self))
 
+    def __conform__(self, protocol):
+        """Adapt to psycopg2, see `timestring.adapt_date`."""
+        from timestring import adapt_date
+        return adapt_date(self)
+
     @property
     def year(self):
-        if self.date != 'infinity':
+        if self.date is not INFINITY:
             return self.date.year
 
     @year.setter
@@ -250,7 +132,7 @@ class Date(object):
 
     @property
     def month(self):
-        if self.date != 'infinity':
+        if self.date is not INFINITY:
             return self.date.month
 
     @month.setter
@@ -259,7 +141,7 @@ class Date(object):
 
     @property
     def day(self):
-        if self.date != 'infinity':
+        if self.date is not INFINITY:
             return self.date.day
 
     @day.setter
@@ -268,7 +150,7 @@ class Date(object):
 
     @property
     def hour(self):
-        if self.date != 'infinity':
+        if self.date is not INFINITY:
             return self.date.hour
 
     @hour.setter
@@ -277,7 +159,7 @@ class Date(object):
 
     @property
     def minute(self):
-        if self.date != 'infinity':
+        if self.date is not INFINITY:
             return self.date.minute
 
     @minute.setter
@@ -286,7 +168,7 @@ class Date(object):
 
     @property
     def second(self):
-        if self.date != 'infinity':
+        if self.date is not INFINITY:
             return self.date.second
 
     @second.setter
@@ -295,7 +177,7 @@ class Date(object):
 
     @property
     def microsecond(self):
-        if self.date != 'infinity':
+        if self.date is not INFINITY:
             return self.date.microsecond
 
     @microsecond.setter
@@ -304,30 +186,28 @@ class Date(object):
 
     @property
     def isoweekday(self):
-        if self.date != 'infinity':
+        if self.date is not INFINITY:
             return self.date.isoweekday()
 
     @property
     def weekday(self):
-        if self.date != 'infinity':
+        if self.date is not INFINITY:
             return self.date.weekday()
 
     @property
     def tz(self):
-        if self.date != 'infinity':
+        if self.date is not INFINITY:
             return self.date.tzinfo
 
     @tz.setter
     def tz(self, tz: str):
-        if self.date != 'infinity':
-            if tz is None:
-                self.date = self.date.replace(tzinfo=None)
-            else:
-                self.date = self.date.replace(tzinfo=pytz.timezone(tz))
+        if self.date is not INFINITY:
+            # keep the wall time, in the new zone
+            self.date = timezones.localize(self.date.replace(tzinfo=None), tz)
 
     def replace(self, **k):
         """Note returns a new Date obj"""
-        if self.date != 'infinity':
+        if self.date is not INFINITY:
             return Date(self.date.replace(**k))
         else:
             return Date('infinity')
@@ -392,23 +272,21 @@ class Date(object):
         :param duration: int or float number of seconds or string of number and
          time unit. The number can begin with '-' to indicate subtraction
         """
-        if self.date == 'infinity':
+        if self.date is INFINITY:
             return
         if isinstance(duration, timedelta):
-            return Date(self.date + duration)
+            return Date(timezones.normalize(self.date + duration))
         if isinstance(duration, (str, unicode)):
             duration = duration.lower().strip()
-            res = TIMESTRING_RE.search(duration)
-            if res:
-                res = res.groupdict()
+            plan = _compile(duration)
+            if plan is None:
+                raise TimestringInvalid('Invalid duration: %s' % duration)
             sign = -1 if duration.startswith('-') else 1
-            num = res.get('num')
-            unit = res.get('delta') or res.get('delta_2')
+            num = plan._number()
+            unit = plan.delta or plan.delta_2
             return self.plus_(num, unit, sign)
         elif isinstance(duration, (float, int)):
-            new = copy(self)
-            new.date = new.date + timedelta(seconds=duration)
-            return new
+            return Date(timezones.normalize(self.date + timedelta(seconds=duration)))
 
         raise TimestringInvalid('Invalid type for plus(): %s'
                                 % (type(duration)))
@@ -417,14 +295,14 @@ class Date(object):
         return True
 
     def __add__(self, duration: Union[str, int, float, timedelta]):
-        if self.date == 'infinity':
+        if self.date is INFINITY:
             return copy(self)
         return self.plus(duration)
 
     def __sub__(self, other):
         if isinstance(other, timedelta):
             return Date(self.date - other)
-        if self.date == 'infinity':
+        if self.date is INFINITY:
             return copy(self)
         if isinstance(other, (str, unicode)):
             other = other[1:] if other.startswith('-') else ('-' + other)
@@ -433,7 +311,7 @@ class Date(object):
         return self.plus(other)
 
     def __format__(self, _):
-        if self.date != 'infinity':
+        if self.date is not INFINITY:
             return self.date.strftime('%x %X')
         else:
             return 'infinity'
@@ -442,99 +320,151 @@ class Date(object):
         """Returns date in representation of `%x %X` ie `2013-02-17 00:00:00`"""
         return str(self.date)
 
-    def __gt__(self, other):
-        if self.date == 'infinity':
-            if isinstance(other, Date):
-                return other.date != 'infinity'
-            else:
-                from .Range import Range
-                if isinstance(other, Range):
-                    return other.end != 'infinity'
-                return other != 'infinity'
-        else:
-            if isinstance(other, Date):
-                if other.date == 'infinity':
-                    return False
-                elif other.tz and self.tz is None:
-                    return self.date.replace(tzinfo=other.tz) > other.date
-                elif self.tz and other.tz is None:
-                    return self.date > other.date.replace(tzinfo=self.tz)
-                return self.date > other.date
-            else:
-                from .Range import Range
-                if isinstance(other, Range):
-                    if other.end.date == 'infinity':
-                        return False
-                    if other.end.tz and self.tz is None:
-                        return self.date.replace(tzinfo=other.end.tz) > other.end.date
-                    elif self.tz and other.end.tz is None:
-                        return self.date > other.end.date.replace(tzinfo=self.tz)
-                    return self.date > other.end.date
-                else:
-                    return self.__gt__(Date(other, tz=self.tz))
+    def _pair(self, other):
+        """Bring `other` (a Date, datetime, epoch number or 'infinity') into
+        a form comparable with this Date.
 
-    def __lt__(self, other):
-        if self.date == 'infinity':
-            # infinity can never by less then a date
-            return False
+        A naive datetime compared with an aware one is read in the zone of
+        the aware one.  Other strings are only parsed when
+        `Date.coerce_strings` is set.
 
+        :return: (mine, theirs) ordered like the two Dates, or None when
+            `other` cannot be compared
+        """
+        date = self.date
         if isinstance(other, Date):
-            if other.date == 'infinity':
-                return True
-            elif other.tz and self.tz is None:
-                return self.date.replace(tzinfo=other.tz) < other.date
-            elif self.tz and other.tz is None:
-                return self.date < other.date.replace(tzinfo=self.tz)
-            return self.date < other.date
-        else:
-            from .Range import Range
-            if isinstance(other, Range):
-                if other.end.tz and self.tz is None:
-                    return self.date.replace(tzinfo=other.end.tz) < other.end.date
-                elif self.tz and other.end.tz is None:
-                    return self.date < other.end.date.replace(tzinfo=self.tz)
-                return self.date < other.end.date
+            other = other.date
+        elif isinstance(other, datetime):
+            pass
+        elif isinstance(other, (int, long, float)) and not isinstance(other, bool):
+            other = datetime.fromtimestamp(other)
+        elif isinstance(other, (str, unicode)):
+            if other == 'infinity':
+                other = INFINITY
+            elif date is INFINITY:
+                return 1, 0
+            elif self.coerce_strings:
+                other = Date(other, tz=self.tz).date
             else:
-                return self.__lt__(Date(other, tz=self.tz))
+                return None
+        else:
+            return None
 
-    def __ge__(self, other):
-        return self > other or self == other
+        if date is INFINITY or other is INFINITY:
+            return date is INFINITY, other is INFINITY
+        if other.tzinfo is None:
+            if date.tzinfo is not None:
+                other = other.replace(tzinfo=date.tzinfo)
+        elif date.tzinfo is None:
+            date = date.replace(tzinfo=other.tzinfo)
+        return date, other
 
-    def __le__(self, other):
-        return self < other or self == other
+    def sort_key(self):
+        """:return: (infinity flag, UTC epoch in microseconds), naive Dates read as UTC
 
-    def __eq__(self, other):
-        if isinstance(other, datetime):
-            other = Date(other)
-        if isinstance(other, Date):
-            if other.date == 'infinity':
-                return self.date == 'infinity'
+        >>> sorted(dates, key=Date.sort_key)
+        """
+        date = self.date
+        if date is INFINITY:
+            return True, 0
+        if date.tzinfo is None:
+            return False, (date - _EPOCH) // _MICROSECOND
+        return False, (date - _EPOCH_UTC) // _MICROSECOND
 
-            elif other.tz and self.tz is None:
-                return self.date.replace(tzinfo=other.tz) == other.date
+    def __gt__(self, other):
+        if isinstance(other, Range):
+            if other.end.date is INFINITY:
+                return False
+            other = other.end
+        pair = self._pair(other)
+        return NotImplemented if pair is None else pair[0] > pair[1]
 
-            elif self.tz and other.tz is None:
-                return self.date == other.date.replace(tzinfo=self.tz)
+    def __lt__(self, other):
+        if type(other) is Date:
+            # the common case, and the one sorted() leans on
+            a, b = self.date, other.date
+            if a is not INFINITY and b is not INFINITY and \
+                    (a.tzinfo is None) is (b.tzinfo is None):
+                return a < b
+        elif isinstance(other, Range):
+            other = other.end
+        pair = self._pair(other)
+        return NotImplemented if pair is None else pair[0] < pair[1]
 
-            return self.date == other.date
-        else:
-            from .Range import Range
-            if isinstance(other, Range):
-                return False
-            else:
-                return self.__eq__(Date(other, tz=self.tz))
+    def __ge__(self, other):
+        if isinstance(other, Range):
+            return self > other
+        pair = self._pair(other)
+        return NotImplemented if pair is None else pair[0] >= pair[1]
+
+    def __le__(self, other):
+        if isinstance(other, Range):
+            return self < other
+        pair = self._pair(other)
+        return NotImplemented if pair is None else pair[0] <= pair[1]
+
+    def __eq__(self, other):
+        if isinstance(other, Range):
+            return False
+        pair = self._pair(other)
+        return NotImplemented if pair is None else pair[0] == pair[1]
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
 
     def format(self, format_string='%x %X'):
-        if self.date != 'infinity':
+        if self.date is not INFINITY:
             return self.date.strftime(format_string)
         else:
             return 'infinity'
 
     def to_unixtime(self):
-        if self.date != 'infinity':
+        if self.date is not INFINITY:
             return time.mktime(self.date.timetuple())
         else:
             return -1
+
+    def freeze(self):
+        """:return: an immutable, hashable copy of this Date"""
+        return FrozenDate(self.date)
+
+
+class FrozenDate(Date):
+    """An immutable Date that can be used in sets and as a dict key.
+
+    The hash is the UTC instant in microseconds (or the infinity flag), so
+    aware Dates that compare equal hash equal, as do naive Dates with the
+    same wall time.  Naive and aware Dates never share a hash: `==` reads a
+    naive Date in the zone of the aware one, which matches it with a
+    different instant in each zone, so no hash could agree with it.  A set
+    keeps a naive Date and an aware one apart even when they compare equal.
+    """
+    __slots__ = ('_hash',)
+
+    def __init__(self, *args, **kwargs):
+        object.__setattr__(self, 'date', Date(*args, **kwargs).date)
+        date = self.date
+        naive = date is not INFINITY and date.tzinfo is None
+        object.__setattr__(self, '_hash', hash((naive, self.sort_key())))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('FrozenDate is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('FrozenDate is immutable')
+
+    def __reduce__(self):
+        return FrozenDate, (self.date,)
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return "<timestring.FrozenDate %s %s>" % (str(self), id(self))
+
+    def freeze(self):
+        return self
+
+
+from .Range import Range  # noqa: E402 (Range builds on Date)
@@ -0,0 +1,323 @@
+import re
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from timestring import TimestringInvalid, Context
+from .cache import PARSE_CACHE
+from . import matcher
+from .utils import get_num
+
+CLEAN_NUMBER = re.compile(r"[\D]")
+MONTH_ORDINALS = dict(
+    january=1, february=2, march=3, april=4, june=6,
+    july=7, august=8, september=9, october=10, november=11, december=12,
+    jan=1, feb=2, mar=3, apr=4, may=5, jun=6,
+    jul=7, aug=8, sep=9, sept=9, oct=10, nov=11, dec=12,
+)
+WEEKDAY_ORDINALS = dict(
+    monday=1, tuesday=2, wednesday=3, thursday=4, friday=5, saturday=6, sunday=7,
+    mon=1, tue=2, tues=2, wed=3, wedn=3, thu=4, thur=4, fri=5, sat=6, sun=7,
+    mo=1, tu=2, we=3, th=4, fr=5, sa=6, su=7,
+)
+RELATIVE_DAYS = {
+    'now': 0,
+    'today': 0,
+    'yesterday': -1,
+    'tomorrow': 1,
+    'day before yesterday': -2,
+    'day after tomorrow': 2,
+}
+DAYTIMES = dict(
+    morning=9,
+    noon=12,
+    afternoon=15,
+    evening=18,
+    night=21,
+    nighttime=21,
+    midnight=24
+)
+
+_MISSING = object()
+
+PLAN_FIELDS = (
+    'text', 'groups',
+    'unixtime',
+    # duration
+    'num', 'number', 'delta', 'delta_2', 'ago', 'from_now', 'in_',
+    # references
+    'recurrence', 'this', 'prev', 'next', 'article', 'since', 'until', 'by',
+    # days
+    'weekday', 'weekday_iso', 'relative_day', 'relative_days',
+    # calendar
+    'year', 'month', 'has_month', 'day',
+    # time of day
+    'daytime', 'daytime_hour', 'hour', 'am', 'minute', 'second',
+    # which alternative of TIMESTRING_RE matched
+    'month_1', 'date_5', 'date_6', 'time_2',
+)
+
+
+class Plan(namedtuple('Plan', PLAN_FIELDS)):
+    """The analysis of a timestring, independent of `now` and `tz`.
+
+    A Plan holds everything `TIMESTRING_RE` extracted from a string with
+    the numbers, months and weekdays already resolved, so evaluating it
+    against a reference time is datetime arithmetic only.  Plans are
+    immutable and picklable.
+
+    >>> plan = timestring.compile('last 7 days')
+    >>> plan.to_range(now=datetime(2017, 6, 16))
+    <timestring.Range From 06/09/17 00:00:00 to 06/16/17 00:00:00 4483019280>
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_groups(cls, groups: dict, text: str = None):
+        """:param groups: the groupdict of a `TIMESTRING_RE` match"""
+        get = groups.get
+
+        def first(*keys):
+            return [groups[key] for key in keys if get(key)]
+
+        num = get('num')
+        number = None
+        if num is not None:
+            try:
+                number = get_num(num)
+            except TimestringInvalid:
+                pass
+
+        weekday = get('weekday')
+        relative_day = get('relative_day')
+
+        year = [int(CLEAN_NUMBER.sub('', y)) for y in
+                first('year', 'year_2', 'year_3', 'year_4', 'year_5', 'year_6')]
+        if year:
+            year = max(year)
+            if len(str(year)) != 4:
+                year += 2000 if year <= 40 else 1900
+        else:
+            year = None
+
+        month = first('month', 'month_1', 'month_2', 'month_3', 'month_4', 'month_5')
+        has_month = bool(month)
+        if month:
+            month = max(month)
+            month = int(month) if month.isdigit() else MONTH_ORDINALS.get(month)
+        else:
+            month = None
+
+        day = first('date', 'date_2', 'date_3', 'date_4')
+        hour = first('hour', 'hour_2', 'hour_3')
+        am = first('am', 'am_1')
+        minute = first('minute', 'minute_2')
+        seconds = get('seconds')
+
+        daytime = get('daytime')
+        daytime_hour = None
+        if daytime and 'this time' not in daytime:
+            daytime_hour = DAYTIMES.get(daytime, 12)
+
+        return cls(
+            text=text,
+            groups=tuple(sorted((k, v) for k, v in groups.items() if v is not None)),
+            unixtime=int(get('unixtime')) if get('unixtime') else None,
+            num=num,
+            number=number,
+            delta=get('delta'),
+            delta_2=get('delta_2'),
+            ago=bool(get('ago')),
+            from_now=bool(get('from_now')),
+            in_=bool(get('in')),
+            recurrence=bool(get('recurrence')),
+            this=bool(get('this')),
+            prev=bool(get('prev')),
+            next=bool(get('next')),
+            article=bool(get('article')),
+            since=bool(get('since')),
+            until=bool(get('until')),
+            by=bool(get('by')),
+            weekday=weekday,
+            weekday_iso=WEEKDAY_ORDINALS.get(weekday) if weekday else None,
+            relative_day=relative_day,
+            relative_days=RELATIVE_DAYS.get(re.sub(r'\s+', ' ', relative_day))
+            if relative_day else None,
+            year=year,
+            month=month,
+            has_month=has_month,
+            day=int(max(day)) if day else None,
+            daytime=daytime,
+            daytime_hour=daytime_hour,
+            hour=int(max(hour)) if hour else None,
+            am=max(am) if am else None,
+            minute=int(max(minute)) if minute else None,
+            second=int(seconds) if seconds else None,
+            month_1=bool(get('month_1')),
+            date_5=bool(get('date_5')),
+            date_6=bool(get('date_6')),
+            time_2=bool(get('time_2')),
+        )
+
+    def __repr__(self):
+        return "<timestring.Plan %r>" % (self.text,)
+
+    def groupdict(self):
+        return dict(self.groups)
+
+    def to_date(self, now: datetime = None, tz: str = None,
+                offset: dict = None, context: Context = None):
+        """:return: a new Date for this plan evaluated at `now`"""
+        from .Date import Date
+        return Date(self, now=now, tz=tz, offset=offset, context=context)
+
+    def to_range(self, now: datetime = None, tz: str = None,
+                 offset: dict = None, week_start: int = 1,
+                 context: Context = None):
+        """:return: a new Range for this plan evaluated at `now`"""
+        from .Range import Range
+        return Range(self, now=now, tz=tz, offset=offset,
+                     week_start=week_start, context=context)
+
+    def _number(self):
+        return self.number if self.number is not None else self.num
+
+    def _this(self):
+        """:return: the Plan of "this <unit>" for this plan's unit, built without a parse"""
+        key = 'delta' if self.delta else 'delta_2'
+        unit = getattr(self, key)
+        return Plan.from_groups({'recurrence': 'this', 'this': 'this', 'num': '', key: unit},
+                                'this ' + unit)
+
+    def _resolve(self, now: datetime, context: Context = None):
+        """Evaluate the plan as a single point in time.
+
+        :return: (datetime, whether an offset may still be applied)
+        """
+        from .Date import Date
+
+        if self.text == 'now':
+            # Date('now') is the reference time itself, not midnight
+            return now, True
+
+        offset = True
+        new_date = now
+        unit = self.delta
+
+        if self.unixtime:
+            new_date = datetime.fromtimestamp(self.unixtime)
+
+        # Number of (days|...) [ago]
+        elif self.num and unit:
+            if self.ago or context == Context.PREV or self.prev:
+                sign = -1
+            elif self.in_ or self.from_now or context == Context.NEXT or self.next:
+                sign = 1
+            else:
+                raise TimestringInvalid('Missing relationship such as "ago" or "from now"')
+
+            new_date = Date(new_date).plus_(self._number(), unit, sign).date
+
+        if self.weekday:
+            new_date = new_date.replace(hour=0, minute=0, second=0, microsecond=0)
+            iso = self.weekday_iso
+            if iso is not None:
+                days = iso - new_date.isoweekday()
+                if self.prev or context == Context.PREV:
+                    if iso >= new_date.isoweekday():
+                        days -= 7
+                elif not (days == 0 and context in [Context.PAST, Context.FUTURE]):
+                    if iso <= new_date.isoweekday():
+                        days += 7
+                new_date += timedelta(days=days)
+        elif self.relative_day:
+            if self.relative_days:
+                new_date += timedelta(days=self.relative_days)
+            new_date = new_date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        # !year
+        if self.year is not None:
+            new_date = new_date.replace(year=self.year)
+
+        # !month
+        if self.has_month:
+            month_ord = self.month if self.month is not None else new_date.month
+            if not 1 <= month_ord <= 12:
+                raise TimestringInvalid('Month not in range 1..12:' + str(month_ord))
+
+            new_date = new_date.replace(month=month_ord)
+
+            if self.year is None:
+                if self.next or context == Context.NEXT:
+                    if month_ord <= now.month:
+                        new_date = new_date.replace(year=new_date.year + 1)
+                elif self.prev or context == Context.PREV:
+                    if month_ord >= now.month:
+                        new_date = new_date.replace(year=new_date.year - 1)
+                elif month_ord < now.month:
+                    new_date = new_date.replace(year=new_date.year + 1)
+
+        # !day
+        if self.day is not None:
+            new_date = new_date.replace(day=self.day)
+
+        # !daytime
+        if self.daytime:
+            if self.daytime_hour is not None:
+                new_date = new_date.replace(hour=self.daytime_hour,
+                                            minute=0,
+                                            second=0,
+                                            microsecond=0)
+            # No offset because the hour was set.
+            offset = False
+
+        # !hour
+        if self.hour is not None:
+            new_date = new_date.replace(hour=self.hour, minute=0, second=0)
+            if self.am in ('p', 'pm') and self.hour < 12:
+                new_date = new_date.replace(hour=self.hour + 12)
+            # No offset because the hour was set.
+            offset = False
+
+            if self.minute is not None:
+                new_date = new_date.replace(minute=self.minute)
+
+            if self.second is not None:
+                new_date = new_date.replace(second=self.second)
+
+            new_date = new_date.replace(microsecond=0)
+
+            if self.day is None and not self.relative_day and new_date < now:
+                new_date += timedelta(days=1)
+
+        if self.year is not None and not self.has_month and self.weekday is None and self.day is None:
+            new_date = new_date.replace(month=1)
+        if (self.year is not None or self.has_month) and self.weekday is None \
+                and self.day is None and self.hour is None:
+            new_date = new_date.replace(day=1)
+        if self.hour is None and self.daytime is None and not unit:
+            new_date = new_date.replace(hour=0, minute=0, second=0)
+
+        return new_date, offset
+
+
+def _compile(text: str):
+    """:return: the (cached) Plan for `text`, or None when it does not parse"""
+    key = text.lower().strip()
+    plan = PARSE_CACHE.get(key, _MISSING)
+    if plan is _MISSING:
+        res = matcher.search(key)
+        plan = Plan.from_groups(res.groupdict(), key) if res else None
+        PARSE_CACHE.put(key, plan)
+    return plan
+
+
+def compile(text: str):
+    """Analyse `text` once so it can be evaluated against many reference times.
+
+    >>> plan = timestring.compile('next week')
+    >>> [plan.to_range(now=now) for now in reference_times]
+    """
+    plan = _compile(text)
+    if plan is None:
+        raise TimestringInvalid('Invalid timestring: %s' % text)
+    return plan
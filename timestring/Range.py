@@ -1,15 +1,17 @@
 import re
+from calendar import monthrange
+from collections import namedtuple
 from copy import copy
 from datetime import datetime, timedelta
 from typing import Union
 
-import pytz
-
 from timestring import TimestringInvalid, Context, \
     WEEKEND_START_DAY, WEEKEND_START_HOUR, WEEKEND_END_DAY, WEEKEND_END_HOUR
-from .Date import Date
-from .timestring_re import TIMESTRING_RE
-from .utils import get_num
+from .Date import Date, FrozenDate, INFINITY, _EPOCH, _EPOCH_UTC, _MICROSECOND
+from . import timezones
+from .iso import parse_iso, localize
+from .Plan import Plan, _compile
+from .utils import check_length
 
 try:
     unicode
@@ -22,30 +24,177 @@ pg_pat_ext = r'((\"' + POSTGRES_DATE_PATTERN + '\")|infinity)'
 POSTGRES_RANGE_RE = re.compile(
     r'(\[|\()' + pg_pat_ext + r',' + pg_pat_ext + r'(\]|\))'
 )
+PGOFFSET_RE = re.compile(r"(\+|\-)\d{2}$")
+
+
+def _epoch_ns(date: datetime, tz=None, wall: bool = False):
+    """:return: nanoseconds since the epoch of `date`
+
+    A naive `date` is read in `tz`, or else in local time as
+    `datetime.fromtimestamp` does.  With `wall` the wall time of `date` is
+    counted as if it were UTC.
+    """
+    if wall:
+        return (date.replace(tzinfo=None) - _EPOCH) // _MICROSECOND * 1000
+    if date.tzinfo is None:
+        date = timezones.localize(date, tz) if tz else date.astimezone()
+    return (date - _EPOCH_UTC) // _MICROSECOND * 1000
+
+
+# the length of a Range in calendar terms, see `Range.elapse_parts`
+ElapseParts = namedtuple('ElapseParts', 'years months days hours minutes seconds')
+
+# the units Range.each steps by, from the first letter of a unit
+STEP_UNITS = dict(
+    y='years',
+    q='quarters',
+    w='weeks',
+    d='days',
+    h='hours',
+    m='minutes',
+    s='seconds',
+    u='microseconds',
+)
+# months in a step of each calendar unit
+CALENDAR_MONTHS = dict(years=12, quarters=3, months=1)
+
+
+def _parse_step(step):
+    """:return: (number, unit) of a step such as '15 minutes', a timedelta
+        or a number of seconds"""
+    if isinstance(step, timedelta):
+        number, unit = step // _MICROSECOND, 'microseconds'
+    elif isinstance(step, (int, long, float)):
+        number, unit = step, 'seconds'
+    else:
+        step = str(step).lower().strip()
+        plan = _compile(step)
+        unit = plan and (plan.delta or plan.delta_2)
+        if not unit or unit.lower().startswith('weekend'):
+            raise TimestringInvalid('Invalid step: %s' % step)
+        unit = unit.lower().strip()
+        number = plan._number()
+        unit = 'months' if unit.startswith('mo') else STEP_UNITS[unit[0]]
+        if unit in CALENDAR_MONTHS and number != int(number):
+            raise TimestringInvalid('Step must be a whole number of %s: %s' % (unit, step))
+    if number <= 0:
+        raise TimestringInvalid('Step must be positive: %s' % step)
+    return number, unit
+
+
+def _add_months(date: datetime, months: int):
+    """:return: `date` moved by `months`, on the last day of the month where
+        its day does not exist"""
+    year, month = divmod(date.month - 1 + months, 12)
+    year += date.year
+    return date.replace(year=year, month=month + 1,
+                        day=min(date.day, monthrange(year, month + 1)[1]))
+
+
+def _relocalize(wall: datetime, tz):
+    return wall if tz is None else timezones.localize(wall, tz)
+
+
+def _align(date: datetime, number, unit: str, week_start: int):
+    """:return: the step boundary at or before `date`
+
+    Calendar steps align to the start of their unit (a step of 3 months to
+    the quarter), weeks to `week_start` (1 is Monday, 7 Sunday) and shorter
+    steps to multiples of the step counted from midnight.
+    """
+    wall = date.replace(tzinfo=None)
+    midnight = wall.replace(hour=0, minute=0, second=0, microsecond=0)
+    if unit in CALENDAR_MONTHS:
+        months = int(number) * CALENDAR_MONTHS[unit]
+        if unit == 'years':
+            month = 1
+        else:
+            month = (wall.month - 1) // months * months + 1
+        wall = midnight.replace(month=month, day=1)
+    elif unit == 'weeks':
+        wall = midnight - timedelta(days=(wall.isoweekday() - week_start) % 7)
+    elif unit == 'days':
+        wall = midnight
+    else:
+        size = timedelta(**{unit: number})
+        wall = midnight + (wall - midnight) // size * size
+        if date.tzinfo is not None:
+            # read the boundary with the offset of `date`, so that in a
+            # repeated hour it is not moved past `date`
+            utc = timezones.get_timezone('UTC')
+            guess = (wall - date.utcoffset()).replace(tzinfo=utc)
+            aligned = (wall - guess.astimezone(date.tzinfo).utcoffset()).replace(tzinfo=utc)
+            if aligned.astimezone(date.tzinfo).replace(tzinfo=None) != wall:
+                # skipped when clocks went forward
+                aligned = max(guess, aligned)
+            return aligned.astimezone(date.tzinfo)
+    return _relocalize(wall, date.tzinfo)
+
+
+def _steps(origin: datetime, number, unit: str):
+    """Yield `origin` and every step after it.
+
+    Steps of a day or longer keep the wall time across DST changes, shorter
+    steps are exact durations.  Each point is counted from `origin`, so
+    month ends do not drift.
+    """
+    tz = origin.tzinfo
+    wall = origin.replace(tzinfo=None)
+    k = 0
+    if unit in CALENDAR_MONTHS:
+        months = int(number) * CALENDAR_MONTHS[unit]
+        while True:
+            yield _relocalize(_add_months(wall, k * months), tz)
+            k += 1
+    delta = timedelta(**{unit: number})
+    if unit in ('weeks', 'days'):
+        while True:
+            yield _relocalize(wall + k * delta, tz)
+            k += 1
+    if tz is None:
+        while True:
+            yield origin + k * delta
+            k += 1
+    utc = origin.astimezone(timezones.get_timezone('UTC'))
+    while True:
+        yield (utc + k * delta).astimezone(tz)
+        k += 1
 
 
 class Range(object):
-    def __init__(self, start: Union[int, str, long, float, datetime, Date],
+    __slots__ = ('_dates',)
+
+    def __init__(self, start: Union[int, str, long, float, datetime, Date, Plan],
                  end: Union[datetime, Date] = None, offset: dict = None,
                  week_start: int = 1, tz: str = None,
-                 verbose=False, context: Context = None):
+                 verbose=False, context: Context = None, now: datetime = None,
+                 max_input_length: int = None):
         """`start` can be type <class timestring.Date> or <type str>
         """
         self._dates = []
         pgoffset = None
-        if tz:
-            tz = pytz.timezone(str(tz))
+        tz = timezones.get_timezone(tz)
 
         if start is None:
             raise TimestringInvalid("Range object requires a start value")
 
-        if not isinstance(start, (Date, datetime)):
+        if not isinstance(start, (Date, datetime, Plan)):
             start = str(start)
         if end and not isinstance(end, (Date, datetime)):
             end = str(end)
+        if isinstance(start, str):
+            check_length(start, max_input_length)
+        if isinstance(end, str):
+            check_length(end, max_input_length)
+
+        iso = parse_iso(start) if isinstance(start, str) else None
 
         if start and end:
-            self._dates = (Date(start, tz=tz), Date(end, tz=tz))
+            self._dates = (Date(start, tz=tz, now=now), Date(end, tz=tz, now=now))
+
+        elif isinstance(start, Plan):
+            self._dates = self._resolve(start, now, offset, week_start, tz,
+                                        verbose, context)
 
         elif start == 'infinity':
             self._dates = (Date('infinity'), Date('infinity'))
@@ -54,270 +203,293 @@ class Range(object):
                     or (isinstance(start, (str, unicode)) and start.isdigit()) \
                 and len(str(int(float(start)))) > 4:
             start = Date(start, tz=tz)
-            end = start + '1 second'
+            end = start.plus_(1, 'second')
             self._dates = start, end
 
+        elif iso:
+            start, unit, has_offset = iso
+            start = Date(start if has_offset else localize(start, tz, now))
+            self._dates = start, start.plus_(1, unit)
+
         elif re.search(r'(\s(and|to)\s)', start):
             # Both sides are provided in string "start"
             start = re.sub('^(between|from)\s', '', start.lower())
             r = tuple(re.split(r'(\s(and|to)\s)', start.strip()))
-            start = Date(r[0], tz=tz)
+            start = Date(r[0], tz=tz, now=now)
             self._dates = start, Date(r[-1], now=start.date, tz=tz)
 
         elif POSTGRES_RANGE_RE.match(start):
             # Postgresql tsrange and tstzranges support
             start, end = re.sub('[^\w\s\-\:\.\+\,]', '', start).split(',')
-            self._dates = Date(start, tz=tz), Date(end, tz=tz)
+            self._dates = Date(start, tz=tz, now=now), Date(end, tz=tz, now=now)
 
         else:
-            now = datetime.now(tz)
+            pgoffset = PGOFFSET_RE.search(start)
 
-            if re.search(r"(\+|\-)\d{2}$", start):
+            # Parse
+            plan = _compile(start)
+            if plan is None:
+                raise TimestringInvalid('Invalid range: %s' % start)
+
+            start, end = self._resolve(plan, now, offset, week_start, tz,
+                                       verbose, context)
+
+            if pgoffset:
                 # postgresql tsrange and tstzranges
-                pgoffset = re.search(r"(\+|\-)\d{2}$", start).group() + " hours"
+                pgoffset = int(pgoffset.group())
+                # with since/until/by one side is the `now` datetime, which
+                # has no offset to undo
+                if isinstance(start, Date):
+                    start = start.plus_(pgoffset, 'hours', -1)
+                else:
+                    start = Date(start)
+                if not isinstance(end, Date):
+                    end = Date(end)
+                elif end.date is not INFINITY:
+                    end = end.plus_(pgoffset, 'hours', -1)
 
-            # Parse
-            res = TIMESTRING_RE.search(start)
-            if res:
-                group = res.groupdict()
+            self._dates = (start, end)
+
+        if self._dates[0] > self._dates[1]:
+            self._dates = (self._dates[0], self._dates[1].plus_(1, 'day'))
 
-                def g(*keys):
-                    return next((group.get(k) for k in keys
-                                 if group.get(k) is not None),
-                                None)
+    @classmethod
+    def _from_dates(cls, start: Date, end: Date):
+        """Internal constructor for two Dates that are already in order"""
+        self = cls.__new__(cls)
+        self._dates = (start, end)
+        return self
 
+    @staticmethod
+    def _resolve(plan: Plan, now: datetime, offset: dict, week_start: int, tz,
+                 verbose=False, context: Context = None):
+        """:return: the (start, end) of `plan` evaluated at `now`"""
+        if now is None:
+            now = datetime.now(tz)
+        elif isinstance(now, Date):
+            now = now.date
+        start = end = None
+
+        if verbose:
+            print(dict((k, v) for k, v in plan.groups if v))
+
+        if not plan.this:
+            if plan.since:
+                context = Context.PREV
+            if plan.until or plan.by:
+                context = Context.NEXT
+
+        delta = plan.delta or plan.delta_2
+        if delta:
+            delta = delta.lower().strip()
+            num = plan.num
+            number = plan._number()
+            start = Date(now, offset=offset)
+
+            # ago                               [     ](     )x
+            # from now                         x(     )[     ]
+            # in                               x(     )[     ]
+            if plan.ago or plan.from_now or plan.in_:
+                n = number if num else 1
+                whole = int(n)
+                fraction = n - whole
                 if verbose:
-                    print(dict(map(lambda a: (a, group.get(a)), filter(lambda a: group.get(a), group))))
-
-                if not group['this']:
-                    if group['since']:
-                        context = Context.PREV
-                    if group['until'] or group['by']:
-                        context = Context.NEXT
-
-                delta = group.get('delta') or group.get('delta_2')
-                if delta:
-                    delta = delta.lower().strip()
-                    num = group['num']
-                    start = Date("now", offset=offset, tz=tz)
-                    end = None
-
-                    # ago                               [     ](     )x
-                    # from now                         x(     )[     ]
-                    # in                               x(     )[     ]
-                    if group['ago'] or group['from_now'] or group['in']:
-                        n = get_num(num or 1)
-                        whole = int(n)
-                        fraction = n - whole
-                        if verbose:
-                            print('ago or from_now or in')
-                        start = Date(res.string, tz=tz)
-                        if not re.match('(hour|minute|second)s?', delta):
-                            if not fraction:
-                                start = start.replace(hour=0, minute=0, second=0, microsecond=0)
-                            end = start.plus_(1, 'day')
-                        elif delta.startswith('hour'):
-                            if not fraction:
-                                start = start.replace(minute=0, second=0, microsecond=0)
-                            end = start + '1 hour'
-                        elif delta.startswith('minute'):
-                            if not fraction:
-                                start = start.replace(second=0, microsecond=0)
-                            end = start + '1 minute'
-                        else:
-                            end = start + '1 second'
-
-                    # "next 2 weeks", "the next hour"   x[     ][     ]
-                    elif group['next'] and (group['num'] or group['article']):
-                        if verbose:
-                            print('next and (num or article)')
-                        end = start.plus_(num, delta)
-
-                    # "next week"                       (  x  )[      ]
-                    elif group['next'] or (not group['this'] and context == Context.NEXT):
-                        if verbose:
-                            print('next or (not this and Context.NEXT)')
-                        this = Range('this ' + delta,
-                                     offset=offset,
-                                     tz=tz,
-                                     week_start=week_start)
-                        if delta.startswith('weekend'):
-                            if 'now' in this:
-                                start, end = this.plus_(num, delta)
-                            else:
-                                start, end = this
-                        else:
-                            start = this.end
-                            end = start.plus_(num, delta)
-
-                    # "last 2 weeks", "the last hour"   [     ][     ]x
-                    elif group['prev'] and (group['num'] or group['article']):
-                        if verbose:
-                            print('prev and (num or article)')
-
-                        end = start.plus_(num, delta, -1)
-
-                    # "last week"                       [     ](  x  )
-                    elif group['prev']:
-                        if verbose:
-                            print('prev')
-                        this = Range('this ' + delta,
-                                     offset=offset,
-                                     tz=tz,
-                                     week_start=week_start)
-
-                        start = this.start.plus_(num, delta, -1)
-                        end = this.end.plus_(num, delta, -1)
-
-                    # "1 year", "10 days" till now
-                    elif num:
-                        if verbose:
-                            print('num')
-
-                        end = start.plus_(num, delta, -1)
-
-                    # this                             [   x  ]
-                    elif group['this'] or not group['recurrence']:
-                        if verbose:
-                            print('this or not recurrence')
-                        start = Date(res.string, tz=tz)
-
-                        if delta.startswith('y'):
-                            start = start.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
-
-                        elif delta.startswith('mo'):
-                            start = start.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-                        # weekend
-                        elif delta.startswith('weekend'):
-                            days = (WEEKEND_START_DAY - start.isoweekday + 7) % 7
-                            start = Date(now + timedelta(days=days), tz=tz)
-                            start = start.replace(hour=WEEKEND_START_HOUR,
-                                                  minute=0,
-                                                  second=0,
-                                                  microsecond=0)
-                            days = (WEEKEND_END_DAY + 7 - WEEKEND_START_DAY) % 7
-                            end = Date(start.date + timedelta(days=days), tz=tz)
-                            end = end.replace(hour=WEEKEND_END_HOUR)
-                            start = start.replace(**offset or {})
-                            end = end.replace(**offset or {})
-
-                        # week
-                        elif delta.startswith('w'):
-                            start.date -= timedelta(days=start.isoweekday - week_start % 7)
-                            start = start.replace(hour=0, minute=0, second=0, microsecond=0)
-
-                        elif delta.startswith('d'):
-                            start = start.replace(hour=0, minute=0, second=0, microsecond=0)
-
-                        elif delta.startswith('h'):
-                            start = start.replace(minute=0, second=0, microsecond=0)
-
-                        elif delta.startswith('m'):
-                            start = start.replace(second=0, microsecond=0)
-
-                        elif delta.startswith('s'):
-                            start = start.replace(microsecond=0)
-
-                        else:
-                            raise TimestringInvalid("Not a valid time reference")
-
-                        if offset:
-                            start = start.replace(**offset)
-                        if not end:
-                            end = start.plus_(num, delta)
-
-                elif group['relative_day'] or group['weekday']:
-                    if verbose:
-                        print('relative_day or weekday')
-                    start = Date(res.string, offset=offset, tz=tz, context=context)
-                    end = start + '1 day'
-
-                elif group.get('month_1'):
-                    if verbose:
-                        print('month_1')
-                    start = Date(res.string, offset=offset, tz=tz, context=context)
-                    start = start.replace(hour=0, minute=0, second=0)
-                    end = start + '1 month'
-
-                elif group['date_5'] or group['date_6']:
-                    if verbose:
-                        print('date_5 or date_6')
-                    start = Date(res.string, offset=offset, tz=tz)
-                    year = g('year', 'year_2', 'year_3', 'year_4', 'year_5', 'year_6')
-                    month = g('month', 'month_2', 'month_3', 'month_4', 'month_5')
-                    day = g('date', 'date_2', 'date_3', 'date_4')
-
-                    if day:
-                        end = start + '1 day'
-                    elif month:
-                        end = start + '1 month'
-                    elif year is not None:
-                        end = start + '1 year'
-                    else:
-                        end = start
-
-                if not isinstance(start, Date):
-                    start = Date(now, tz=tz)
-
-                if group['time_2']:
-                    if verbose:
-                        print('time_2')
-                    temp = Date(res.string, offset=offset, now=start, tz=tz).date
-                    start = start.replace(hour=temp.hour,
-                                          minute=temp.minute,
-                                          second=temp.second)
-
-                    hour = g('hour', 'hour_2', 'hour_3')
-                    minute = g('minute', 'minute_2')
-                    second = g('seconds')
-
-                    if second:
-                        end = start + '1 second'
-                    elif minute:
-                        end = start + '1 minute'
-                    elif hour:
-                        end = start + '1 hour'
+                    print('ago or from_now or in')
+                start = Date(plan, now=now, tz=tz)
+                if not re.match('(hour|minute|second)s?', delta):
+                    if not fraction:
+                        start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+                    end = start.plus_(1, 'day')
+                elif delta.startswith('hour'):
+                    if not fraction:
+                        start = start.replace(minute=0, second=0, microsecond=0)
+                    end = start.plus_(1, 'hour')
+                elif delta.startswith('minute'):
+                    if not fraction:
+                        start = start.replace(second=0, microsecond=0)
+                    end = start.plus_(1, 'minute')
+                else:
+                    end = start.plus_(1, 'second')
+
+            # "next 2 weeks", "the next hour"   x[     ][     ]
+            elif plan.next and (plan.num or plan.article):
+                if verbose:
+                    print('next and (num or article)')
+                end = start.plus_(number, delta)
+
+            # "next week"                       (  x  )[      ]
+            elif plan.next or (not plan.this and context == Context.NEXT):
+                if verbose:
+                    print('next or (not this and Context.NEXT)')
+                this = Range(plan._this(),
+                             offset=offset,
+                             tz=tz,
+                             now=now,
+                             week_start=week_start)
+                if delta.startswith('weekend'):
+                    today = Date(now)
+                    if Range._from_dates(today, today.plus_(1, 'day')) in this:
+                        start, end = this.plus_(number, delta)
                     else:
-                        end = start
+                        start, end = this
+                else:
+                    start = this.end
+                    end = start.plus_(number, delta)
 
-                if group['since']:
-                    end = now
-                elif group['until'] or group['by']:
-                    end = start
-                    start = now
+            # "last 2 weeks", "the last hour"   [     ][     ]x
+            elif plan.prev and (plan.num or plan.article):
+                if verbose:
+                    print('prev and (num or article)')
 
-                if start <= now <= end:
-                    if context == Context.PAST:
-                        end = now
-                    elif context == Context.FUTURE:
-                        start = now
+                end = start.plus_(number, delta, -1)
 
+            # "last week"                       [     ](  x  )
+            elif plan.prev:
+                if verbose:
+                    print('prev')
+                this = Range(plan._this(),
+                             offset=offset,
+                             tz=tz,
+                             now=now,
+                             week_start=week_start)
+
+                start = this.start.plus_(number, delta, -1)
+                end = this.end.plus_(number, delta, -1)
+
+            # "1 year", "10 days" till now
+            elif num:
+                if verbose:
+                    print('num')
+
+                end = start.plus_(number, delta, -1)
+
+            # this                             [   x  ]
+            elif plan.this or not plan.recurrence:
+                if verbose:
+                    print('this or not recurrence')
+                start = Date(plan, now=now, tz=tz)
+
+                if delta.startswith('y'):
+                    start = start.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+
+                elif delta.startswith('mo'):
+                    start = start.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+                # weekend
+                elif delta.startswith('weekend'):
+                    days = (WEEKEND_START_DAY - start.isoweekday + 7) % 7
+                    start = Date(now + timedelta(days=days), tz=tz)
+                    start = start.replace(hour=WEEKEND_START_HOUR,
+                                          minute=0,
+                                          second=0,
+                                          microsecond=0)
+                    days = (WEEKEND_END_DAY + 7 - WEEKEND_START_DAY) % 7
+                    end = Date(start.date + timedelta(days=days), tz=tz)
+                    end = end.replace(hour=WEEKEND_END_HOUR)
+                    start = start.replace(**offset or {})
+                    end = end.replace(**offset or {})
+
+                # week
+                elif delta.startswith('w'):
+                    start.date -= timedelta(days=start.isoweekday - week_start % 7)
+                    start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+
+                elif delta.startswith('d'):
+                    start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+
+                elif delta.startswith('h'):
+                    start = start.replace(minute=0, second=0, microsecond=0)
+
+                elif delta.startswith('m'):
+                    start = start.replace(second=0, microsecond=0)
+
+                elif delta.startswith('s'):
+                    start = start.replace(microsecond=0)
+
+                else:
+                    raise TimestringInvalid("Not a valid time reference")
+
+                if offset:
+                    start = start.replace(**offset)
+                if not end:
+                    end = start.plus_(number, delta)
+
+        elif plan.relative_day or plan.weekday:
+            if verbose:
+                print('relative_day or weekday')
+            start = Date(plan, now=now, offset=offset, tz=tz, context=context)
+            end = start.plus_(1, 'day')
+
+        elif plan.month_1:
+            if verbose:
+                print('month_1')
+            start = Date(plan, now=now, offset=offset, tz=tz, context=context)
+            start = start.replace(hour=0, minute=0, second=0)
+            end = start.plus_(1, 'month')
+
+        elif plan.date_5 or plan.date_6:
+            if verbose:
+                print('date_5 or date_6')
+            start = Date(plan, now=now, offset=offset, tz=tz)
+
+            if plan.day is not None:
+                end = start.plus_(1, 'day')
+            elif plan.has_month:
+                end = start.plus_(1, 'month')
+            elif plan.year is not None:
+                end = start.plus_(1, 'year')
             else:
-                raise TimestringInvalid('Invalid range: %s' % start)
+                end = start
+
+        if not isinstance(start, Date):
+            start = Date(now, tz=tz)
+
+        if plan.time_2:
+            if verbose:
+                print('time_2')
+            temp = Date(plan, offset=offset, now=start, tz=tz).date
+            start = start.replace(hour=temp.hour,
+                                  minute=temp.minute,
+                                  second=temp.second)
+
+            if plan.second is not None:
+                end = start.plus_(1, 'second')
+            elif plan.minute is not None:
+                end = start.plus_(1, 'minute')
+            elif plan.hour is not None:
+                end = start.plus_(1, 'hour')
+            else:
+                end = start
 
-            if end is None:
-                # no end provided, so assume 24 hours
-                if isinstance(start, str):
-                    start = Date(start, tz=tz)
-                end = start + '24 hours'
+        if plan.since:
+            end = now
+        elif plan.until or plan.by:
+            end = start
+            start = now
 
-            if start > end:
-                start, end = copy(end), copy(start)
+        if start <= now <= end:
+            if context == Context.PAST:
+                end = now
+            elif context == Context.FUTURE:
+                start = now
 
-            if pgoffset:
-                start = start - pgoffset
-                if end != 'infinity':
-                    end = end - pgoffset
+        if end is None:
+            # no end provided, so assume 24 hours
+            end = start.plus_(24, 'hours')
 
-            self._dates = (start, end)
+        if start > end:
+            start, end = copy(end), copy(start)
 
-        if self._dates[0] > self._dates[1]:
-            self._dates = (self._dates[0], self._dates[1] + '1 day')
+        return start, end
 
     def __repr__(self):
         return "<timestring.Range %s %s>" % (str(self), id(self))
 
+    def __conform__(self, protocol):
+        """Adapt to psycopg2, see `timestring.adapt_date`."""
+        from timestring import adapt_range
+        return adapt_range(self)
+
     def __getitem__(self, index: int):
         return self._dates[index]
 
@@ -328,6 +500,8 @@ class Range(object):
         # Ranges are natuarally always true in statments link: if Range
         return True
 
+    __bool__ = __nonzero__
+
     def format(self, format_string='%x %X'):
         return "From %s to %s" % (self[0].format(format_string) if isinstance(self[0], Date) else str(self[0]),
                                   self[1].format(format_string) if isinstance(self[1], Date) else str(self[1]))
@@ -340,26 +514,53 @@ class Range(object):
     def end(self):
         return self[1]
 
+    def _microseconds(self):
+        """:return: the length in microseconds, None if the Range is infinite"""
+        start, end = self
+        if start.date is INFINITY or end.date is INFINITY:
+            return None
+        return end.sort_key()[1] - start.sort_key()[1]
+
+    def total_seconds(self):
+        """:return: how many seconds the Range lasts, inf if it is infinite"""
+        microseconds = self._microseconds()
+        if microseconds is None:
+            return float('inf')
+        return microseconds / 1e6
+
+    def duration(self):
+        """:return: how long the Range lasts as a timedelta, None if it is infinite"""
+        microseconds = self._microseconds()
+        if microseconds is None:
+            return None
+        return timedelta(microseconds=microseconds)
+
+    def elapse_parts(self):
+        """:return: the `ElapseParts` of the Range, None if it is infinite
+
+        Years count 365 days and months 30, as in `elapse`.
+        """
+        microseconds = self._microseconds()
+        if microseconds is None:
+            return None
+        seconds = abs(microseconds) // 1000000
+        days, seconds = divmod(seconds, 86400)
+        years = months = 0
+        if days > 365:
+            years, days = divmod(days, 365)
+        if days > 30:
+            months, days = divmod(days, 30)
+        hours, seconds = divmod(seconds, 3600)
+        minutes, seconds = divmod(seconds, 60)
+        return ElapseParts(years, months, days, hours, minutes, seconds)
+
     @property
     def elapse(self, short=False, format=True, min=None, round=None):
-        if self.start == 'infinity' or self.end == 'infinity':
+        parts = self.elapse_parts()
+        if parts is None:
             return "infinity"
         # years, months, days, hours, minutes, seconds
-        full = [0, 0, 0, 0, 0, 0]
-        elapse = self[1].date - self[0].date
-        days = elapse.days
-        if days > 365:
-            years = days / 365
-            full[0] = years
-            days = elapse.days - (years*365)
-        if days > 30:
-            months = days / 30
-            full[1] = months
-            days = days - (days / 30)
-
-        full[2] = days
-
-        full[3], full[4], full[5] = tuple(map(int, map(float, str(elapse).split(', ')[-1].split(':'))))
+        full = list(parts)
 
         if round:
             r = ['years', 'months', 'days', 'hours', 'minutes', 'seconds']
@@ -384,9 +585,9 @@ class Range(object):
 
     @property
     def tz(self):
-        if self.start != 'infinity':
+        if self.start.date is not INFINITY:
             return self.start.tz
-        if self.end != 'infinity':
+        if self.end.date is not INFINITY:
             return self.end.tz
 
     @tz.setter
@@ -395,9 +596,14 @@ class Range(object):
         self.end.tz = tz
 
     def __len__(self):
-        """Returns how many `seconds` the `Range` lasts.
+        """Returns how many whole `seconds` the `Range` lasts.
+
+        :raises OverflowError: if the Range is infinite
         """
-        return abs(int(self[1].to_unixtime() - self[0].to_unixtime()))
+        microseconds = self._microseconds()
+        if microseconds is None:
+            raise OverflowError('Range is infinite: %s' % self)
+        return abs(microseconds) // 1000000
 
     def __lt__(self, other):
         return self.cmp(other) == -1
@@ -444,16 +650,16 @@ class Range(object):
         if isinstance(other, Date):
 
             # ~ .... |
-            if self.start == 'infinity' and self.end >= other:
+            if self.start.date is INFINITY and self.end >= other:
                 return True
 
             # | .... ~
-            elif self.end == 'infinity' and self.start <= other:
+            elif self.end.date is INFINITY and self.start <= other:
                 return True
 
-            elif other == 'infinity':
+            elif other.date is INFINITY:
                 # infinitys cannot be contained, unless I'm infinity
-                return self.start == 'infinity' or self.end == 'infinity'
+                return self.start.date is INFINITY or self.end.date is INFINITY
 
             elif other.tz and self.start.tz is None:
                 # we can safely update tzinfo
@@ -463,12 +669,12 @@ class Range(object):
 
         elif isinstance(other, Range):
             # ~ .... |
-            if self.start == 'infinity':
+            if self.start.date is INFINITY:
                 # ~ <-- |
                 return other.end <= self.end
 
             # | .... ~
-            elif self.end == 'infinity':
+            elif self.end.date is INFINITY:
                 # | --> ~
                 return self.start <= other.start
 
@@ -481,6 +687,30 @@ class Range(object):
         else:
             return self.__contains__(Range(other, tz=self.start.tz))
 
+    def _epoch_bounds(self, tz=None, wall: bool = False):
+        """:return: (start, end) in nanoseconds since the epoch, None for an
+            infinite end, see `_epoch_ns`"""
+        return tuple(None if date.date is INFINITY else _epoch_ns(date.date, tz, wall)
+                     for date in self._dates)
+
+    def mask(self, values):
+        """:return: a numpy boolean mask of the `values` inside this Range, by
+            the rules of `__contains__`, in one vectorized pass
+
+        `values` is a DateArray, an array or buffer of epoch seconds, or an
+        array of datetime64.  Epoch seconds are instants, against which a
+        naive Range is read in local time, as ``Date(seconds)`` is.
+        datetime64 values are naive, so they are compared with the wall
+        time of an aware Range.  NaN and NaT are never inside, and an
+        infinite value only in a Range with an infinite end.
+
+        >>> recent = events[Range('last 30 days').mask(events['ts'])]
+        """
+        from .arrays import range_mask
+        return range_mask(self, values)
+
+    contains_many = mask
+
     def plus_(self, num, unit: str, sign: int = 1):
         return Range(self.start.plus_(num, unit, sign),
                      self.end.plus_(num, unit, sign))
@@ -490,15 +720,71 @@ class Range(object):
         return Range(self.start.plus(duration),
                      self.end.plus(duration),
                      tz=self.start.tz)
-    def prev(self, times=1):
-        """:return: a new instance of self times is not supported yet."""
-        return Range(self.start - self.elapse,
-                     copy(self.start), tz=self.start.tz)
-
-    def next(self, times=1):
-        """:return: a new instance of self times is not supported yet."""
-        return Range(copy(self.end),
-                     self.end + self.elapse, tz=self.start.tz)
+    def prev(self, times: int = 1):
+        """:return: the Range of the same length `times` lengths earlier"""
+        return self._shift(-times)
+
+    def next(self, times: int = 1):
+        """:return: the Range of the same length `times` lengths later"""
+        return self._shift(times)
+
+    def _shift(self, times: int):
+        start, end = self.start.date, self.end.date
+        if start is INFINITY or end is INFINITY:
+            raise TimestringInvalid('Cannot move an infinite Range')
+        wall_start, wall_end = start.replace(tzinfo=None), end.replace(tzinfo=None)
+
+        # whole calendar months move by months, "this month" to next month
+        months = (wall_end.year - wall_start.year) * 12 + wall_end.month - wall_start.month
+        if months and wall_start == _align(wall_start, 1, 'months', 1) \
+                and wall_end == _align(wall_end, 1, 'months', 1):
+            wall_start = _add_months(wall_start, months * times)
+            wall_end = _add_months(wall_end, months * times)
+        else:
+            delta = (wall_end - wall_start) * times
+            wall_start, wall_end = wall_start + delta, wall_end + delta
+
+        return Range._from_dates(Date(_relocalize(wall_start, start.tzinfo)),
+                                 Date(_relocalize(wall_end, end.tzinfo)))
+
+    def each(self, step, align: bool = True, ranges: bool = False, week_start: int = 1):
+        """Step through this Range lazily, yielding a Date at every step, or
+        with `ranges` the sub-Range up to the next step.
+
+        `step` is a duration such as '1 hour', '15 minutes', 'week' or
+        '3 months', a timedelta or a number of seconds.  With `align` the
+        steps fall on the boundaries of their unit (whole hours, quarters,
+        weeks starting on `week_start`), otherwise they count from the
+        start.  Dates are yielded from the start up to, not including, the
+        end; sub-Ranges are cut to this Range.  Days and longer keep their
+        wall time across DST changes.  A Range with an infinite end never
+        stops.
+
+        >>> [str(d) for d in Range('today').each('6 hours')]
+        ['2017-06-16 00:00:00', '2017-06-16 06:00:00', '2017-06-16 12:00:00', '2017-06-16 18:00:00']
+        """
+        if self.start.date is INFINITY:
+            raise TimestringInvalid('Cannot step from an infinite start')
+        number, unit = _parse_step(step)
+        start = self.start.date
+        origin = _align(start, number, unit, week_start) if align else start
+        end = None if self.end.date is INFINITY else self.end.date
+        return self._each(_steps(origin, number, unit), start, end, ranges)
+
+    @staticmethod
+    def _each(points, start: datetime, end: datetime, ranges: bool):
+        previous = None
+        for point in points:
+            if end is not None and point >= end:
+                break
+            if not ranges:
+                if point >= start:
+                    yield Date(point)
+            elif previous is not None and point > start:
+                yield Range._from_dates(Date(max(previous, start)), Date(point))
+            previous = point
+        if ranges and previous is not None:
+            yield Range._from_dates(Date(max(previous, start)), Date(end))
 
     def __add__(self, duration: Union[str, int, float]):
         return self.plus(duration)
@@ -521,3 +807,48 @@ class Range(object):
         else:
             e -= by
         return Range(s, e)
+
+    def freeze(self):
+        """:return: an immutable, hashable copy of this Range"""
+        return FrozenRange._from_dates(self.start, self.end)
+
+
+class FrozenRange(Range):
+    """An immutable Range of two FrozenDates that can be used in sets and as a dict key.
+
+    >>> len({Range('today').freeze(), Range('today').freeze()})
+    1
+    """
+    __slots__ = ('_hash',)
+
+    def __init__(self, *args, **kwargs):
+        self._freeze(*Range(*args, **kwargs))
+
+    @classmethod
+    def _from_dates(cls, start: Date, end: Date):
+        self = cls.__new__(cls)
+        self._freeze(start, end)
+        return self
+
+    def _freeze(self, start: Date, end: Date):
+        start, end = start.freeze(), end.freeze()
+        object.__setattr__(self, '_dates', (start, end))
+        object.__setattr__(self, '_hash', hash((start, end)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('FrozenRange is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('FrozenRange is immutable')
+
+    def __reduce__(self):
+        return FrozenRange._from_dates, self._dates
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return "<timestring.FrozenRange %s %s>" % (str(self), id(self))
+
+    def freeze(self):
+        return self
@@ -1,7 +1,6 @@
 import re
-import sys
-import argparse
 from collections import namedtuple
+from importlib import import_module
 from datetime import datetime
 
 contexts = dict(
@@ -25,68 +24,81 @@ class TimestringInvalid(Exception):
     def __str__(self):
         return self.reason
 
-from .Date import Date
-from .Range import Range
-from .timestring_re import TIMESTRING_RE
+from .Plan import Plan, compile
+from .Date import Date, FrozenDate, INFINITY
+from .Range import Range, FrozenRange
+from .cache import enable_cache, disable_cache, cache_info, cache_clear
+from .batch import parse_many
+from .index import RangeIndex
+from .rangeset import RangeSet
+from .search import finditer
+from .timezones import get_timezone, set_backend
 
+# Imported on first use: the arrays and buckets load numpy, which takes
+# longer than the rest of the package, and TIMESTRING_RE is compiled only
+# when it is asked for.
+_LAZY = dict(DateArray='.arrays', RangeArray='.arrays', floor='.buckets', ceil='.buckets',
+             TIMESTRING_RE='.timestring_re')
 
-try:
-    """Register psycopg2 Adapters
 
-    if psycopg2 is installed then automatically register
-    the adapters for Date and Range.
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+def adapt_date(date):
+    """psycopg2 adapter for Date and Range
+
+    psycopg2 finds them through `Date.__conform__` and `Range.__conform__`,
+    so they work whenever psycopg2 is installed without importing it along
+    with timestring.
 
     >>> db.mogrify("insert into my_table (range) values (%s);",
                    timestring.Range("next week"))
     "insert into my_table (range) values (tstzrange('2014-03-03 00:00:00'::timestamptz, '2014-03-10 00:00:00'::timestamptz));"
     """
-    from psycopg2.extensions import register_adapter
     from psycopg2.extensions import AsIs
+    if date.tz:
+        return AsIs("'%s'::timestamptz" % str(date.date))
+    else:
+        return AsIs("'%s'::timestamp" % str(date.date))
 
-    def adapt_date(date):
-        if date.tz:
-            return AsIs("'%s'::timestamptz" % str(date.date))
-        else:
-            return AsIs("'%s'::timestamp" % str(date.date))
-
-    def adapt_range(_range):
-        if _range.start.tz:
-            return AsIs("tstzrange('%s', '%s')" % (str(_range.start.date), str(_range.end.date)))
-        else:
-            return AsIs("tsrange('%s', '%s')" % (str(_range.start.date), str(_range.end.date)))
-
-    register_adapter(Date, adapt_date)
-    register_adapter(Range, adapt_range)
 
-except ImportError:
-    pass
+def adapt_range(_range):
+    from psycopg2.extensions import AsIs
+    if _range.start.tz:
+        return AsIs("tstzrange('%s', '%s')" % (str(_range.start.date), str(_range.end.date)))
+    else:
+        return AsIs("tsrange('%s', '%s')" % (str(_range.start.date), str(_range.end.date)))
 
 
-def findall(text):
+def findall(text, max_input_length: int = None):
     """Find all the timestrings within a block of text.
 
+    Text longer than `max_input_length` characters raises TimestringInvalid.
+
     >>> timestring.findall("once upon a time, about 3 weeks ago, there was a boy whom was born on august 15th at 7:20 am. epic.")
     [
      ('3 weeks ago,', <timestring.Date 2014-02-09 00:00:00 4483019280>),
      ('august 15th at 7:20 am', <timestring.Date 2014-08-15 07:20:00 4483019344>)
     ]
     """
-    results = TIMESTRING_RE.findall(text)
-    dates = []
-    for date in results:
-        if re.compile('((next|last)\s(\d+|couple(\sof))\s(weeks|months|quarters|years))|(between|from)', re.I).match(date[0]):
-            dates.append((date[0].strip(), Range(date[0])))
-        else:
-            dates.append((date[0].strip(), Date(date[0])))
-    return dates
+    return [(match.text, match.value) for match in finditer(text, max_input_length=max_input_length)]
 
 
 def parse(string):
     try:
-        matches = TIMESTRING_RE.search(string).groupdict()
-        date = Date(string)
+        plan = compile(string)
+        date = Date(plan)
         result = {}
-        for k,v in matches.items():
+        for k, v in plan.groups:
             if v:
                 arg = k.split('_', 1)[0]
                 if arg in ('year', 'month', 'isoweekday', 'weekday', 'hour', 'minute', 'second'):
@@ -101,24 +113,11 @@ def now():
     return Date(datetime.now())
 
 
-def main():
-    parser = argparse.ArgumentParser(prog='timestring',
-                                     add_help=True,
-                                     formatter_class=argparse.RawDescriptionHelpFormatter,
-                                     epilog=""" """)
-    parser.add_argument('-d', '--date', action='store_true')
-    parser.add_argument('-z', '--zone', help="Time zone")
-    parser.add_argument('--verbose', '-v', action="store_true", help="Verbose mode")
-    parser.add_argument('args', nargs="+", help="Time input")
+def main(argv=None):
+    """The `timestring` console script, see `timestring.cli`."""
+    from .cli import main
+    return main(argv)
 
-    if len(sys.argv) == 1:
-        parser.print_help()
-    else:
-        args = parser.parse_args()
-        if args.date:
-            print(Date(" ".join(args.args), verbose=args.verbose, tz=args.zone))
-        else:
-            print(Range(" ".join(args.args), verbose=args.verbose, tz=args.zone))
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,468 @@
+"""Columnar Dates and Ranges for analytics, backed by NumPy.
+
+A `DateArray` holds its values as int64 nanoseconds since the epoch in one
+contiguous array, the layout of ``datetime64[ns]``, with masks for missing
+and infinite entries.  Missing entries are numpy's NaT; infinity is the
+largest int64 (the smallest plus one for the open start of a Range), so
+infinite entries also sort and compare the way `Date('infinity')` does.
+
+Aware values are stored as UTC instants and the array remembers their
+zone in `tz`.  A naive array (``tz is None``) stores wall times as if they
+were UTC.  Comparing a naive and an aware value follows the rules of
+`Date`: the naive side is read in the zone of the aware one.
+
+NumPy is optional: the classes are importable without it, and raise
+ImportError when used.
+
+>>> dates = timestring.DateArray.parse(column, tz='UTC', errors='coerce')
+>>> recent = dates[dates.within(Range('last 30 days', tz='UTC'))]
+>>> recent.to_datetime64()
+"""
+from array import array
+from datetime import datetime, timedelta
+
+from timestring import TimestringInvalid
+from . import timezones
+from .Date import Date, TIMEDELTA_UNITS, _EPOCH, _EPOCH_UTC, _MICROSECOND
+from .Plan import _compile
+from .Range import Range
+from .batch import parse_many
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    unicode
+except NameError:
+    unicode = str
+
+_NAT = -(1 << 63)
+_POS_INF = (1 << 63) - 1
+_NEG_INF = _NAT + 1
+
+_NS = dict(
+    weeks=7 * 86400 * 10 ** 9,
+    days=86400 * 10 ** 9,
+    hours=3600 * 10 ** 9,
+    minutes=60 * 10 ** 9,
+    seconds=10 ** 9,
+    microseconds=10 ** 3,
+)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError('timestring arrays require numpy')
+
+
+def _unit_ns(unit: str):
+    """:return: the nanoseconds in one `unit`, which must have a fixed length"""
+    unit = unit.lower().strip()
+    if unit.startswith(('mo', 'y', 'q')):
+        raise TimestringInvalid('Not a fixed-length unit: %s' % unit)
+    if unit.startswith(('ms', 'milli')):
+        return 10 ** 6
+    if unit.startswith(('ns', 'nano')):
+        return 1
+    _unit = TIMEDELTA_UNITS.get(unit[:1])
+    if _unit is None:
+        raise TimestringInvalid('Unknown time unit: ' + unit)
+    return _NS[_unit]
+
+
+def _step_ns(duration, unit: str = None):
+    """:return: `duration` in nanoseconds, an int or an int64 array
+
+    Without a `unit`, numbers are seconds as in `Date.plus`.
+    """
+    if unit is not None:
+        step = np.asarray(duration) * _unit_ns(unit)
+        if step.dtype.kind == 'f':
+            step = np.round(step)
+        return step.astype(np.int64)
+    if isinstance(duration, timedelta):
+        return (duration // _MICROSECOND) * 1000
+    if isinstance(duration, (str, unicode)):
+        duration = duration.lower().strip()
+        plan = _compile(duration)
+        if plan is None or not (plan.delta or plan.delta_2):
+            raise TimestringInvalid('Invalid duration: %s' % duration)
+        sign = -1 if duration.startswith('-') else 1
+        return _step_ns(sign * plan._number(), plan.delta or plan.delta_2)
+    duration = np.asarray(duration)
+    if duration.dtype.kind == 'm':
+        return duration.astype('timedelta64[ns]').view(np.int64)
+    return _step_ns(duration, 'seconds')
+
+
+def _bounds(_range: Range, tz=None, wall: bool = False):
+    lo, hi = _range._epoch_bounds(tz, wall)
+    return (_NEG_INF if lo is None else lo), (_POS_INF if hi is None else hi)
+
+
+def _between(lo, hi, ns, infinite):
+    """The `Range.__contains__` test: an infinite value is only contained in
+    a range with an open side."""
+    inside = (lo <= ns) & (ns <= hi)
+    return np.where(infinite, (lo == _NEG_INF) | (hi == _POS_INF), inside)
+
+
+class _Encoder(object):
+    """Turns the values given to a DateArray into int64 nanoseconds."""
+    __slots__ = ('tz',)
+
+    def __init__(self, tz):
+        self.tz = timezones.get_timezone(tz)
+
+    def __call__(self, value, infinity: int = _POS_INF):
+        if value is None:
+            return _NAT
+        if isinstance(value, Date):
+            value = value.date
+        elif isinstance(value, (str, unicode)) and value != 'infinity':
+            value = Date(value, tz=self.tz).date
+        elif np is not None and isinstance(value, np.datetime64):
+            return int(value.astype('datetime64[ns]').astype(np.int64))
+
+        if value == 'infinity':
+            return infinity
+        if not isinstance(value, datetime):
+            raise TimestringInvalid('Invalid type for DateArray: %s' % type(value))
+        if value.tzinfo is None:
+            if self.tz is None:
+                return ((value - _EPOCH) // _MICROSECOND) * 1000
+            value = timezones.localize(value, self.tz)
+        elif self.tz is None:
+            self.tz = value.tzinfo
+        return ((value - _EPOCH_UTC) // _MICROSECOND) * 1000
+
+
+def _decode(ns: int, tz):
+    """:return: the Date stored as `ns`, or None if it is missing"""
+    if ns == _NAT:
+        return None
+    if ns in (_POS_INF, _NEG_INF):
+        return Date('infinity')
+    if tz is None:
+        return Date(_EPOCH + timedelta(microseconds=ns // 1000))
+    return Date((_EPOCH_UTC + timedelta(microseconds=ns // 1000)).astimezone(tz))
+
+
+def _scalar_ns(value, tz, infinity: int = _POS_INF):
+    """:return: `value` in nanoseconds, comparable with an array in `tz`
+
+    A naive value is read in `tz`.  An aware value compared with a naive
+    array contributes its wall time.
+    """
+    if isinstance(value, Date):
+        value = value.date
+    if isinstance(value, datetime) and value.tzinfo is not None and tz is None:
+        value = value.replace(tzinfo=None)
+    return _Encoder(tz)(value, infinity)
+
+
+class DateArray(object):
+    """A column of Dates stored as int64 nanoseconds since the epoch.
+
+    `values` is an iterable of Dates, datetimes, timestrings, None (missing)
+    or numpy datetime64.  Naive values are read in `tz` when it is given.
+
+    `ns` holds the values, `valid` is False where a value is missing and
+    `infinite` is True where it is infinity.
+    """
+    __slots__ = ('ns', 'valid', 'infinite', 'tz')
+
+    __hash__ = None
+
+    def __init__(self, values=(), tz: str = None):
+        _require_numpy()
+        if isinstance(values, np.ndarray) and values.dtype.kind == 'M':
+            self._set(values.astype('datetime64[ns]').view(np.int64), timezones.get_timezone(tz))
+            return
+        encode = _Encoder(tz)
+        ns = array('q')
+        for value in values:
+            ns.append(encode(value))
+        self._set(np.frombuffer(ns, dtype=np.int64).copy(), encode.tz)
+
+    def _set(self, ns, tz):
+        self.ns = ns
+        self.valid = ns != _NAT
+        self.infinite = (ns == _POS_INF) | (ns == _NEG_INF)
+        self.tz = tz
+
+    @classmethod
+    def _from_ns(cls, ns, tz):
+        self = cls.__new__(cls)
+        self._set(ns, tz)
+        return self
+
+    @classmethod
+    def parse(cls, iterable, tz: str = None, now: datetime = None, errors: str = 'raise',
+              context=None, offset: dict = None, workers: int = None):
+        """Parse a column of timestrings with `parse_many` straight into a DateArray.
+
+        Invalid items are missing with ``errors='coerce'``.
+        """
+        _require_numpy()
+        return cls(parse_many(iterable, tz=tz, now=now, errors=errors, context=context,
+                              offset=offset, workers=workers), tz=tz)
+
+    @classmethod
+    def from_datetime64(cls, values, tz: str = None):
+        """`values` are UTC instants, or wall times when `tz` is None."""
+        _require_numpy()
+        return cls(np.asarray(values, dtype='datetime64[ns]'), tz=tz)
+
+    def to_datetime64(self):
+        """:return: the values as ``datetime64[ns]``, UTC instants for an aware
+            array.  Missing values are NaT."""
+        return self.ns.view('datetime64[ns]').copy()
+
+    def __len__(self):
+        return len(self.ns)
+
+    def __iter__(self):
+        tz = self.tz
+        for ns in self.ns.tolist():
+            yield _decode(ns, tz)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return _decode(int(self.ns[key]), self.tz)
+        return DateArray._from_ns(self.ns[key], self.tz)
+
+    def __repr__(self):
+        head = ', '.join(str(date) for date in self[:3])
+        if len(self) > 3:
+            head += ', ...'
+        return "<timestring.DateArray [%s] %s>" % (head, id(self))
+
+    def _other_ns(self, other):
+        """:return: (nanoseconds, valid) of `other` for comparing against this array"""
+        if isinstance(other, DateArray):
+            if (other.tz is None) != (self.tz is None):
+                raise TypeError("can't compare naive and aware DateArrays")
+            return other.ns, other.valid
+        if isinstance(other, np.ndarray) and other.dtype.kind == 'M':
+            ns = other.astype('datetime64[ns]').view(np.int64)
+            return ns, ns != _NAT
+        ns = _scalar_ns(other, self.tz)
+        return ns, ns != _NAT
+
+    def _compare(self, op, other):
+        try:
+            ns, valid = self._other_ns(other)
+        except TimestringInvalid:
+            return NotImplemented
+        return op(self.ns, ns) & self.valid & valid
+
+    def __lt__(self, other):
+        return self._compare(np.less, other)
+
+    def __le__(self, other):
+        return self._compare(np.less_equal, other)
+
+    def __gt__(self, other):
+        return self._compare(np.greater, other)
+
+    def __ge__(self, other):
+        return self._compare(np.greater_equal, other)
+
+    def __eq__(self, other):
+        return self._compare(np.equal, other)
+
+    def __ne__(self, other):
+        result = self._compare(np.equal, other)
+        return result if result is NotImplemented else ~result
+
+    def within(self, _range: Range):
+        """:return: a boolean mask of the values inside `_range`, by the rules
+            of `Range.__contains__`"""
+        lo, hi = _bounds(_range, self.tz, wall=self.tz is None)
+        return _between(lo, hi, self.ns, self.infinite) & self.valid
+
+    def __contains__(self, other):
+        if isinstance(other, Range):
+            return bool(self.within(other).any())
+        return bool((self == other).any())
+
+    def plus(self, duration, unit: str = None):
+        """:return: a new DateArray with every finite value moved by `duration`
+
+        `duration` is a number of `unit` (weeks down to nanoseconds), a
+        timedelta, a fixed-length timestring such as '90 minutes', or an
+        array of any of the numeric forms.  Without a `unit` numbers are
+        seconds.  Months and years have no fixed length and are refused.
+        """
+        return self._shift(_step_ns(duration, unit))
+
+    def minus(self, duration, unit: str = None):
+        return self._shift(-_step_ns(duration, unit))
+
+    def _shift(self, step):
+        finite = self.valid & ~self.infinite
+        return DateArray._from_ns(np.where(finite, self.ns + step, self.ns), self.tz)
+
+    def __add__(self, duration):
+        return self.plus(duration)
+
+    def __sub__(self, other):
+        """A DateArray minus a DateArray gives their ``timedelta64[ns]``
+        differences, NaT where either side is missing or infinite."""
+        if isinstance(other, DateArray):
+            ns, valid = self._other_ns(other)
+            finite = self.valid & ~self.infinite & valid & ~other.infinite
+            return np.where(finite, self.ns - ns, _NAT).view('timedelta64[ns]')
+        return self.minus(other)
+
+
+class RangeArray(object):
+    """A column of Ranges stored as two int64 nanosecond arrays.
+
+    `values` is an iterable of Ranges, timestrings or None (missing).  An
+    open start is the smallest int64 but NaT and an open end the largest.
+    """
+    __slots__ = ('start_ns', 'end_ns', 'valid', 'tz')
+
+    __hash__ = None
+
+    def __init__(self, values=(), tz: str = None):
+        _require_numpy()
+        encode = _Encoder(tz)
+        start, end = array('q'), array('q')
+        for value in values:
+            if value is None:
+                start.append(_NAT)
+                end.append(_NAT)
+                continue
+            if not isinstance(value, Range):
+                value = Range(value, tz=encode.tz)
+            start.append(encode(value.start, _NEG_INF))
+            end.append(encode(value.end, _POS_INF))
+        self._set(np.frombuffer(start, dtype=np.int64).copy(),
+                  np.frombuffer(end, dtype=np.int64).copy(), encode.tz)
+
+    def _set(self, start_ns, end_ns, tz):
+        self.start_ns = start_ns
+        self.end_ns = end_ns
+        self.valid = start_ns != _NAT
+        self.tz = tz
+
+    @classmethod
+    def _from_ns(cls, start_ns, end_ns, tz):
+        self = cls.__new__(cls)
+        self._set(start_ns, end_ns, tz)
+        return self
+
+    @classmethod
+    def parse(cls, iterable, tz: str = None, now: datetime = None, errors: str = 'raise',
+              context=None, offset: dict = None, week_start: int = 1, workers: int = None):
+        """Parse a column of timestrings with `parse_many` straight into a RangeArray."""
+        _require_numpy()
+        return cls(parse_many(iterable, tz=tz, now=now, kind='range', errors=errors,
+                              context=context, offset=offset, week_start=week_start,
+                              workers=workers), tz=tz)
+
+    @classmethod
+    def from_datetime64(cls, start, end, tz: str = None):
+        """`start` and `end` are UTC instants, or wall times when `tz` is None."""
+        _require_numpy()
+        start = np.asarray(start, dtype='datetime64[ns]').view(np.int64)
+        end = np.asarray(end, dtype='datetime64[ns]').view(np.int64)
+        return cls._from_ns(start, np.where(start == _NAT, _NAT, end),
+                            timezones.get_timezone(tz))
+
+    def to_datetime64(self):
+        """:return: (start, end) as ``datetime64[ns]`` arrays"""
+        return (self.start_ns.view('datetime64[ns]').copy(),
+                self.end_ns.view('datetime64[ns]').copy())
+
+    @property
+    def start(self):
+        return DateArray._from_ns(self.start_ns, self.tz)
+
+    @property
+    def end(self):
+        return DateArray._from_ns(self.end_ns, self.tz)
+
+    def __len__(self):
+        return len(self.start_ns)
+
+    def __iter__(self):
+        tz = self.tz
+        for start, end in zip(self.start_ns.tolist(), self.end_ns.tolist()):
+            yield None if start == _NAT else Range._from_dates(_decode(start, tz), _decode(end, tz))
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            start = int(self.start_ns[key])
+            if start == _NAT:
+                return None
+            return Range._from_dates(_decode(start, self.tz), _decode(int(self.end_ns[key]), self.tz))
+        return RangeArray._from_ns(self.start_ns[key], self.end_ns[key], self.tz)
+
+    def __repr__(self):
+        head = ', '.join(str(_range) for _range in self[:3])
+        if len(self) > 3:
+            head += ', ...'
+        return "<timestring.RangeArray [%s] %s>" % (head, id(self))
+
+    def contains(self, other):
+        """:return: a boolean mask of the ranges that contain `other`, a Date
+            or datetime, or elementwise the dates of a DateArray of the same
+            length"""
+        if isinstance(other, DateArray):
+            ns, valid = self.start._other_ns(other)
+            infinite = other.infinite
+        else:
+            ns = _scalar_ns(other, self.tz)
+            valid = ns != _NAT
+            infinite = ns == _POS_INF
+        return _between(self.start_ns, self.end_ns, ns, infinite) & self.valid & valid
+
+    def __contains__(self, other):
+        return bool(self.contains(other).any())
+
+    def plus(self, duration, unit: str = None):
+        """:return: a new RangeArray with both ends moved by `duration`, see
+            `DateArray.plus`"""
+        return self._shift(_step_ns(duration, unit))
+
+    def minus(self, duration, unit: str = None):
+        return self._shift(-_step_ns(duration, unit))
+
+    def _shift(self, step):
+        return RangeArray._from_ns(self.start._shift(step).ns, self.end._shift(step).ns, self.tz)
+
+    def __add__(self, duration):
+        return self.plus(duration)
+
+    def __sub__(self, duration):
+        return self.minus(duration)
+
+
+def range_mask(_range: Range, values):
+    """The engine of `Range.mask`."""
+    _require_numpy()
+    if isinstance(values, DateArray):
+        return values.within(_range)
+
+    values = np.asarray(values)
+    if values.dtype.kind == 'M':
+        ns = values.astype('datetime64[ns]').view(np.int64)
+        lo, hi = _bounds(_range, wall=True)
+        return _between(lo, hi, ns, (ns == _POS_INF) | (ns == _NEG_INF)) & (ns != _NAT)
+    if values.dtype.kind not in 'iuf':
+        raise TypeError('Expected epoch seconds or datetime64, not %s' % values.dtype)
+
+    lo, hi = _range._epoch_bounds()
+    lo = -np.inf if lo is None else lo / 1e9
+    hi = np.inf if hi is None else hi / 1e9
+    inside = (lo <= values) & (values <= hi)
+    if values.dtype.kind != 'f':
+        return inside
+    # comparisons with NaN are False already
+    return np.where(np.isinf(values), lo == -np.inf or hi == np.inf, inside)
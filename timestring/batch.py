@@ -0,0 +1,105 @@
+from copy import copy
+from datetime import datetime
+
+from timestring import TimestringInvalid, Context
+from . import timezones
+from .Date import Date
+from .Range import Range
+
+KINDS = ('date', 'range')
+ERRORS = ('raise', 'coerce', 'skip')
+
+# distinct inputs remembered by one parse_many call before the memo restarts
+MEMO_SIZE = 1 << 16
+
+# what parsing a bad input raises: besides TimestringInvalid, the date
+# arithmetic fails on numbers too large for a datetime or a timedelta
+# (OverflowError) and on open ranges it cannot order (TypeError)
+PARSE_ERRORS = (TimestringInvalid, ValueError, TypeError, OverflowError)
+
+
+def _clone(result):
+    if isinstance(result, Range):
+        return Range._from_dates(copy(result.start), copy(result.end))
+    return copy(result)
+
+
+def parse_many(iterable, tz: str = None, now: datetime = None, kind: str = 'date',
+               errors: str = 'raise', context: Context = None,
+               offset: dict = None, week_start: int = 1, workers: int = None):
+    """Parse every item of `iterable`, yielding a Date (or Range) per item in order.
+
+    `tz` and `now` are fixed once for the whole batch, so every item is
+    evaluated against the same reference time, and identical items are only
+    parsed once.  Each result is the one ``Date(item, tz=tz, now=now)``
+    (or ``Range``) would give.  With ``errors='coerce'`` an invalid item yields None,
+    with ``errors='skip'`` it yields nothing.  `workers` spreads the work
+    over that many processes (0 for one per CPU), see `timestring.parallel`.
+
+    >>> list(timestring.parse_many(['today', 'next week', 'today'], kind='range'))
+    [<timestring.Range ...>, <timestring.Range ...>, <timestring.Range ...>]
+    """
+    if kind not in KINDS:
+        raise ValueError('kind must be one of %s' % ', '.join(KINDS))
+    if errors not in ERRORS:
+        raise ValueError('errors must be one of %s' % ', '.join(ERRORS))
+
+    if isinstance(now, Date):
+        now = now.date
+    elif not now:
+        now = timezones.now(tz)
+
+    if workers is not None and workers != 1:
+        from .parallel import parse_parallel
+        return parse_parallel(iterable, now, kind, errors, context, offset, week_start,
+                              workers=workers, tz=tz)
+
+    return _apply(_results(iterable, now, kind, context, offset, week_start, tz), errors)
+
+
+def _results(iterable, now, kind, context, offset, week_start, tz=None):
+    """Yield the Date/Range of each item, or the exception it raised."""
+    if kind == 'date':
+        def parse(item):
+            return Date(item, tz=tz, now=now, offset=offset, context=context)
+    else:
+        def parse(item):
+            return Range(item, tz=tz, now=now, offset=offset, context=context,
+                         week_start=week_start)
+
+    memo = {}
+    for item in iterable:
+        try:
+            hit = memo.get(item)
+        except TypeError:
+            # unhashable, e.g. a dict of groups
+            hit = None
+            key = None
+        else:
+            key = item
+
+        if hit is None:
+            try:
+                result = parse(item)
+            except PARSE_ERRORS as e:
+                result = e
+            if key is not None:
+                if len(memo) >= MEMO_SIZE:
+                    memo.clear()
+                memo[key] = result if isinstance(result, Exception) else _clone(result)
+            yield result
+        elif isinstance(hit, Exception):
+            yield hit
+        else:
+            yield _clone(hit)
+
+
+def _apply(results, errors):
+    for result in results:
+        if isinstance(result, Exception):
+            if errors == 'raise':
+                raise result
+            if errors == 'coerce':
+                yield None
+        else:
+            yield result
@@ -0,0 +1,241 @@
+"""Round Dates down or up to the boundaries of time buckets.
+
+`floor` gives the start of the bucket a value falls in, `ceil` the first
+boundary at or after it, with the same boundaries as `Range.each`: the
+start of the unit ('day', 'month', 'week' from `week_start`), or for
+shorter steps multiples of the step from midnight ('15 minutes').
+
+Single values and lists are rounded one at a time.  A DateArray or a numpy
+``datetime64`` array is rounded in a few vectorized passes:
+
+>>> hours = timestring.floor(events.ts.values, 'hour')
+>>> weeks = timestring.floor(dates, 'week', week_start=7, tz='US/Eastern')
+"""
+from datetime import datetime, timedelta
+
+from . import timezones
+from .Date import Date, INFINITY, _EPOCH_UTC, _MICROSECOND
+from .Range import CALENDAR_MONTHS, _align, _parse_step, _steps
+from .arrays import DateArray, np, _NAT, _POS_INF, _NEG_INF
+
+try:
+    unicode
+except NameError:
+    unicode = str
+
+_DAY_NS = 86400 * 10 ** 9
+# the resolution at which UTC offsets are looked up; every zone changes
+# its offset on a quarter hour
+_OFFSET_STEP_NS = 15 * 60 * 10 ** 9
+_STEPS_PER_DAY = 96
+
+
+def floor(values, unit: str, week_start: int = 1, tz: str = None):
+    """:return: the start of the bucket of each of `values`
+
+    `values` is a Date, a datetime, a list of them (or of timestrings), a
+    DateArray or a numpy ``datetime64`` array; the result is of the same
+    kind.  `unit` is a unit or a step such as '15 minutes' or '3 months'.
+    With `tz` aware values are bucketed by the wall time in `tz` and naive
+    values are read in it.  datetime64 values are UTC instants when `tz`
+    is given and wall times otherwise.
+    """
+    return _bucket(values, unit, week_start, tz, ceil=False)
+
+
+def ceil(values, unit: str, week_start: int = 1, tz: str = None):
+    """:return: the first bucket boundary at or after each of `values`, see `floor`"""
+    return _bucket(values, unit, week_start, tz, ceil=True)
+
+
+def _bucket(values, unit, week_start, tz, ceil):
+    number, unit = _parse_step(unit)
+    tz = timezones.get_timezone(tz)
+
+    if isinstance(values, DateArray):
+        if values.tz is None:
+            return DateArray._from_ns(_bucket_ns(values.ns, number, unit, week_start, None, ceil), None)
+        tz = tz or values.tz
+        return DateArray._from_ns(_bucket_ns(values.ns, number, unit, week_start, tz, ceil), tz)
+
+    if np is not None and isinstance(values, np.ndarray):
+        if values.dtype.kind != 'M':
+            raise TypeError('Expected a datetime64 array, not %s' % values.dtype)
+        ns = values.astype('datetime64[ns]').view(np.int64)
+        return _bucket_ns(ns, number, unit, week_start, tz, ceil).view('datetime64[ns]').astype(values.dtype)
+
+    if isinstance(values, (Date, datetime, str, unicode)):
+        return _bucket_one(values, number, unit, week_start, tz, ceil)
+    return [_bucket_one(value, number, unit, week_start, tz, ceil) for value in values]
+
+
+def _bucket_one(value, number, unit, week_start, tz, ceil):
+    if isinstance(value, (str, unicode)):
+        value = Date(value, tz=tz)
+    date = value.date if isinstance(value, Date) else value
+    if date is INFINITY:
+        return Date('infinity')
+
+    if tz is not None:
+        date = date.astimezone(tz) if date.tzinfo else timezones.localize(date, tz)
+    result = _align(date, number, unit, week_start)
+    if ceil and _instant(result) < _instant(date):
+        if unit in CALENDAR_MONTHS or unit in ('weeks', 'days'):
+            steps = _steps(result, number, unit)
+            next(steps)
+            result = next(steps)
+        else:
+            # as in `_bucket_ns`
+            size = timedelta(**{unit: number})
+            later = _later(date, size)
+            up = _align(later, number, unit, week_start)
+            while _instant(up) < _instant(date):
+                later = _later(later, size)
+                up = _align(later, number, unit, week_start)
+            before = _align(_later(up, -_MICROSECOND), number, unit, week_start)
+            result = before if _instant(before) >= _instant(date) else up
+    return Date(result) if isinstance(value, Date) else result
+
+
+def _instant(date: datetime):
+    """`date` in UTC: datetimes in the same zone compare by wall time, which
+    is ambiguous when clocks go back"""
+    if date.tzinfo is None:
+        return date
+    return date.astimezone(timezones.get_timezone('UTC'))
+
+
+def _later(date: datetime, delta: timedelta):
+    """:return: the instant `delta` after `date`"""
+    if date.tzinfo is None:
+        return date + delta
+    return (_instant(date) + delta).astimezone(date.tzinfo)
+
+
+def _bucket_ns(ns, number, unit, week_start, tz, ceil):
+    """Round nanoseconds since the epoch, wall times or, with `tz`, UTC
+    instants bucketed by their wall time in `tz`.  Missing and infinite
+    values are kept."""
+    out = ns.copy()
+    finite = (ns != _NAT) & (ns != _POS_INF) & (ns != _NEG_INF)
+    values = ns[finite]
+    if not values.size:
+        return out
+
+    if tz is None:
+        out[finite] = _round_wall(values, number, unit, week_start, ceil)
+        return out
+
+    if ceil and (unit in CALENDAR_MONTHS or unit in ('weeks', 'days')):
+        offsets = _utcoffsets(values, tz)(values)
+        bounds = _round_wall(values + offsets, number, unit, week_start, True)
+        out[finite] = _instants(bounds, offsets, tz)
+        return out
+
+    def align(instants):
+        offsets = _utcoffsets(instants, tz)(instants)
+        bounds = _round_wall(instants + offsets, number, unit, week_start, False)
+        return _instants(bounds, offsets, tz)
+
+    down = align(values)
+    if ceil:
+        # around a change of offset buckets are longer or shorter than a
+        # step: the next boundary is the start of the bucket of a step
+        # later (or of more, for a longer bucket), or of the one before it
+        size = timedelta(**{unit: number}) // _MICROSECOND * 1000
+        later = values + size
+        up = align(later)
+        while (up < values).any():
+            later = np.where(up < values, later + size, later)
+            up = align(later)
+        before = align(up - 1)
+        up = np.where(before >= values, before, up)
+        down = np.where(down < values, up, down)
+    out[finite] = down
+    return out
+
+
+def _instants(bounds, offsets, tz):
+    """:return: the UTC instants of the wall times `bounds`, read first with
+        `offsets`, the offsets of the values they were rounded from
+
+    A wall time repeated when clocks go back keeps the offset of its value,
+    one skipped when they go forward is read with the offset before the
+    change, as `timezones.localize` does.
+    """
+    lookup = _utcoffsets(bounds - offsets, tz, pad=_DAY_NS)
+    guess = bounds - offsets
+    offset = lookup(guess)
+    instants = bounds - offset
+    skipped = lookup(instants) != offset
+    return np.where(skipped, np.maximum(guess, instants), instants)
+
+
+def _utcoffsets(ns, tz, pad=0):
+    """:return: a function giving the UTC offset of `tz`, in nanoseconds, at
+        instants from `pad` before the first of `ns` to `pad` after the last
+
+    Offsets are looked up per quarter hour, but only computed per day
+    except on the days where the offset changes.
+    """
+    first = (int(ns.min()) - pad) // _DAY_NS * _STEPS_PER_DAY
+    days = (int(ns.max()) + pad) // _DAY_NS - first // _STEPS_PER_DAY + 1
+
+    daily = [_offset_ns((first + day * _STEPS_PER_DAY) * _OFFSET_STEP_NS, tz)
+             for day in range(days + 1)]
+    table = np.repeat(np.array(daily[:-1], dtype=np.int64), _STEPS_PER_DAY)
+    for day in range(days):
+        if daily[day] != daily[day + 1]:
+            start = day * _STEPS_PER_DAY
+            table[start:start + _STEPS_PER_DAY] = [
+                _offset_ns((first + step) * _OFFSET_STEP_NS, tz)
+                for step in range(start, start + _STEPS_PER_DAY)]
+
+    def lookup(instants):
+        return table[instants // _OFFSET_STEP_NS - first]
+    return lookup
+
+
+def _offset_ns(ns: int, tz):
+    instant = _EPOCH_UTC + timedelta(microseconds=ns // 1000)
+    return instant.astimezone(tz).utcoffset() // _MICROSECOND * 1000
+
+
+def _months(ns):
+    """:return: months since January 1970 of wall times in nanoseconds"""
+    return ns.view('datetime64[ns]').astype('datetime64[M]').view(np.int64)
+
+
+def _from_months(months):
+    return months.view('datetime64[M]').astype('datetime64[ns]').view(np.int64)
+
+
+def _round_wall(ns, number, unit, week_start, ceil):
+    """The vectorized `_align` (and for `ceil` the step after it) of wall
+    times in nanoseconds."""
+    if unit in CALENDAR_MONTHS:
+        months = _months(ns)
+        size = int(number) * CALENDAR_MONTHS[unit]
+        # align within each year, as `_align` does
+        start = months - (months % 12 if unit == 'years' else (months % 12) % size)
+        down = _from_months(start)
+        if ceil:
+            return np.where(down < ns, _from_months(start + size), down)
+        return down
+
+    if unit == 'weeks':
+        days = ns // _DAY_NS
+        # 1970-01-01 was a Thursday
+        down = (days - (days + 4 - week_start) % 7) * _DAY_NS
+        size = int(number) * 7 * _DAY_NS
+    elif unit == 'days':
+        down = ns // _DAY_NS * _DAY_NS
+        size = int(number) * _DAY_NS
+    else:
+        size = timedelta(**{unit: number}) // _MICROSECOND * 1000
+        midnight = ns // _DAY_NS * _DAY_NS
+        down = midnight + (ns - midnight) // size * size
+
+    if ceil:
+        return np.where(down < ns, down + size, down)
+    return down
@@ -0,0 +1,91 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses evictions maxsize currsize')
+
+_MISSING = object()
+
+
+class ParseCache(object):
+    """Size-bounded LRU cache of parsed timestrings.
+
+    The cache is disabled (``maxsize=0``) until it is enabled with
+    `enable_cache`.  Only the `Plan` of each string is stored: it depends
+    on the text alone, never on `now`, `tz`, `context`, `offset` or
+    `week_start`, so a cached entry is valid however those arguments
+    change between calls and the text is the whole key.
+    """
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=_MISSING):
+        if not self.maxsize:
+            return default
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def resize(self, maxsize: int):
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.evictions,
+                         self.maxsize, len(self._data))
+
+
+PARSE_CACHE = ParseCache()
+
+
+def enable_cache(maxsize: int = 1024):
+    """Cache the parse of up to `maxsize` distinct strings.
+
+    >>> timestring.enable_cache(512)
+    >>> Range('last 7 days'); Range('last 7 days')
+    >>> timestring.cache_info()
+    CacheInfo(hits=1, misses=1, evictions=0, maxsize=512, currsize=1)
+    """
+    if maxsize < 1:
+        raise ValueError('maxsize must be a positive integer')
+    PARSE_CACHE.resize(maxsize)
+
+
+def disable_cache():
+    PARSE_CACHE.resize(0)
+    PARSE_CACHE.clear()
+
+
+def cache_info():
+    return PARSE_CACHE.info()
+
+
+def cache_clear():
+    PARSE_CACHE.clear()
+
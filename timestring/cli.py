@@ -0,0 +1,174 @@
+"""The `timestring` console script.
+
+    $ timestring next tuesday at noon
+    $ printf 'today\\nnext week\\n' | timestring --batch --format jsonl --now 2017-06-16
+    $ timestring --serve /tmp/timestring.sock &
+    $ printf 'tomorrow 5pm\\n' | nc -U /tmp/timestring.sock
+
+``--batch`` reads a timestring per line of stdin and writes a result per
+line to stdout, in order and all against the same reference time.  Lines
+that repeat are parsed once (see `parse_many`).  ``--serve`` answers the
+same lines on a Unix socket, or a TCP port given as ``host:port``, so that
+other programs parse without starting Python every time.
+
+A result line holds the input then the Date, or the start and end of the
+Range, in ISO-8601.  With ``--format tsv`` they are separated by tabs and
+left empty when the input does not parse.  With ``--format jsonl`` a
+result is ``{"input": ..., "start": ..., "end": ...}``, or ``"date"`` for a
+Date, or ``"error"``.  `-v` adds the groups the input matched.
+"""
+import json
+import sys
+from datetime import datetime
+from itertools import tee
+
+from .Date import Date, INFINITY
+from .Range import Range
+from .Plan import _compile
+from .batch import PARSE_ERRORS, parse_many
+from .cache import PARSE_CACHE, enable_cache
+
+FORMATS = ('tsv', 'jsonl')
+
+# distinct strings whose parse a server remembers
+SERVE_CACHE_SIZE = 4096
+
+
+def _iso(date):
+    # the end of an open Range ('since monday') is a datetime
+    if isinstance(date, Date):
+        date = date.date
+    return 'infinity' if date is INFINITY else date.isoformat()
+
+
+def _matches(text: str):
+    """:return: {group: value} of what `text` matched, as `-v` prints them"""
+    plan = _compile(text)
+    return dict((k, v) for k, v in plan.groups if v) if plan is not None else {}
+
+
+def format_result(text: str, value, format: str = 'tsv', matches: dict = None):
+    """:return: the output line, without its newline, for the input `text`
+        and the Date or Range it gave, None if it did not parse"""
+    if format == 'jsonl':
+        result = dict(input=text)
+        if value is None:
+            result['error'] = 'Invalid timestring: %s' % text
+        elif isinstance(value, Range):
+            result.update(start=_iso(value.start), end=_iso(value.end))
+        else:
+            result['date'] = _iso(value)
+        if matches is not None:
+            result['matches'] = matches
+        return json.dumps(result)
+
+    if isinstance(value, Range):
+        fields = [_iso(value.start), _iso(value.end)]
+    elif value is not None:
+        fields = [_iso(value)]
+    else:
+        fields = ['']
+    if matches is not None:
+        fields.append(' '.join('%s=%s' % item for item in sorted(matches.items())))
+    return '\t'.join([text.replace('\t', ' ')] + fields)
+
+
+def batch(lines, out, kind: str = 'range', format: str = 'tsv', tz: str = None,
+          now: datetime = None, verbose: bool = False):
+    """Write to `out` a result line for each of `lines`."""
+    # parse_many takes a line for each result it yields, so the copy kept
+    # to echo the input is never more than a line behind
+    texts, echo = tee(line.rstrip('\r\n') for line in lines)
+    for text, value in zip(echo, parse_many(texts, tz=tz, now=now, kind=kind, errors='coerce')):
+        out.write(format_result(text, value, format, _matches(text) if verbose else None) + '\n')
+
+
+def make_server(address: str, kind: str = 'range', format: str = 'tsv', tz: str = None,
+                now: datetime = None, verbose: bool = False):
+    """:return: a server answering the lines of each connection like `batch`
+
+    `address` is ``host:port`` for TCP, anything else a Unix socket path.
+    Without `now` each line is evaluated at the time it arrives.  The parse
+    cache is left as it is; ``timestring --serve`` enables it.
+
+    >>> server = make_server('/tmp/timestring.sock')
+    >>> server.serve_forever()
+    """
+    import socketserver
+
+    parse = Date if kind == 'date' else Range
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                text = line.decode('utf-8', 'replace').rstrip('\r\n')
+                try:
+                    value = parse(text, tz=tz, now=now)
+                except PARSE_ERRORS:
+                    value = None
+                matches = _matches(text) if verbose else None
+                self.wfile.write((format_result(text, value, format, matches) + '\n').encode('utf-8'))
+                self.wfile.flush()
+
+    host, _, port = address.rpartition(':')
+    if port.isdigit():
+        base = socketserver.ThreadingTCPServer
+        address = (host or '127.0.0.1', int(port))
+    else:
+        base = socketserver.ThreadingUnixStreamServer
+
+    class Server(base):
+        allow_reuse_address = True
+        daemon_threads = True
+
+    return Server(address, Handler)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog='timestring',
+                                     add_help=True,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     epilog=""" """)
+    parser.add_argument('-d', '--date', action='store_true')
+    parser.add_argument('-z', '--zone', help="Time zone")
+    parser.add_argument('--verbose', '-v', action="store_true", help="Verbose mode")
+    parser.add_argument('--batch', action='store_true',
+                        help="Parse each line of stdin, writing a result per line to stdout")
+    parser.add_argument('--serve', metavar='ADDRESS',
+                        help="Parse the lines sent to a Unix socket path, or to host:port")
+    parser.add_argument('--format', choices=FORMATS, default='tsv',
+                        help="Result lines of --batch and --serve")
+    parser.add_argument('--now', help="Reference time, by default the current time")
+    parser.add_argument('args', nargs="*", help="Time input")
+
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        parser.print_help()
+        return
+    args = parser.parse_args(argv)
+    kind = 'date' if args.date else 'range'
+    now = Date(args.now, tz=args.zone).date if args.now else None
+
+    if args.batch:
+        batch(sys.stdin, sys.stdout, kind, args.format, args.zone, now, args.verbose)
+    elif args.serve:
+        if not PARSE_CACHE.maxsize:
+            # the reference time moves, the parse of a string does not
+            enable_cache(SERVE_CACHE_SIZE)
+        server = make_server(args.serve, kind, args.format, args.zone, now, args.verbose)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if isinstance(server.server_address, str):
+                import os
+                os.unlink(server.server_address)
+    elif not args.args:
+        parser.error('give a timestring, --batch or --serve')
+    elif args.date:
+        print(Date(" ".join(args.args), verbose=args.verbose, tz=args.zone, now=now))
+    else:
+        print(Range(" ".join(args.args), verbose=args.verbose, tz=args.zone, now=now))
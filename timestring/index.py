@@ -0,0 +1,193 @@
+"""Find the saved Ranges that contain a Date, without testing each one.
+
+`RangeIndex` keeps Ranges in an interval tree: a treap (a binary search
+tree balanced by random priorities) ordered by start, where every node
+also records the latest end in its subtree.  A query descends only into
+subtrees that can still hold a match and stops at the first start past
+the query, so it visits O(log N) nodes besides the k it reports, where
+``any(date in r for r in ranges)`` tests all N.
+
+>>> windows = timestring.RangeIndex(maintenance_windows)
+>>> for event in events:
+...     if windows.stab(event.date):
+...         suppress(event)
+"""
+import random
+
+from .Date import Date, INFINITY
+from .Range import Range
+
+_INF = float('inf')
+
+
+def _key(date: Date, infinity: float = _INF):
+    """:return: the position of `date` on the tree's axis, epoch
+        microseconds with naive Dates read as UTC, as `Date.sort_key` does"""
+    if date.date is INFINITY:
+        return infinity
+    return date.sort_key()[1]
+
+
+class _Node(object):
+    __slots__ = ('start', 'end', 'max_end', 'priority', 'left', 'right', 'item')
+
+    def __init__(self, start, end, item):
+        self.start = start
+        self.end = self.max_end = end
+        self.priority = random.random()
+        self.left = self.right = None
+        self.item = item
+
+
+def _update(node: _Node):
+    max_end = node.end
+    if node.left is not None and node.left.max_end > max_end:
+        max_end = node.left.max_end
+    if node.right is not None and node.right.max_end > max_end:
+        max_end = node.right.max_end
+    node.max_end = max_end
+
+
+def _split(node: _Node, key, strict: bool):
+    """:return: the nodes ordered before `key` (or also equal to it unless
+        `strict`), and the rest"""
+    if node is None:
+        return None, None
+    if (node.start, node.end) < key or (not strict and (node.start, node.end) == key):
+        node.right, rest = _split(node.right, key, strict)
+        _update(node)
+        return node, rest
+    before, node.left = _split(node.left, key, strict)
+    _update(node)
+    return before, node
+
+
+def _merge(a: _Node, b: _Node):
+    """:return: the treap of `a` followed by `b`"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.priority > b.priority:
+        a.right = _merge(a.right, b)
+        _update(a)
+        return a
+    b.left = _merge(a, b.left)
+    _update(b)
+    return b
+
+
+def _nodes(node: _Node):
+    stack = []
+    while stack or node is not None:
+        if node is not None:
+            stack.append(node)
+            node = node.left
+        else:
+            node = stack.pop()
+            yield node
+            node = node.right
+
+
+class RangeIndex(object):
+    """An interval tree of Ranges with incremental `add` and `remove`.
+
+    Ranges are closed at both ends, as for ``date in range``, and may be
+    infinite at either end.  A Range must not be changed while it is
+    indexed; `Range.freeze` makes one that cannot be.
+    """
+    __slots__ = ('_root', '_len')
+
+    def __init__(self, ranges=()):
+        self._root = None
+        self._len = 0
+        for _range in ranges:
+            self.add(_range)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        """Yield the Ranges in order of start."""
+        for node in _nodes(self._root):
+            yield node.item
+
+    def __repr__(self):
+        return "<timestring.RangeIndex of %d ranges %s>" % (self._len, id(self))
+
+    def add(self, _range: Range):
+        node = _Node(_key(_range.start, -_INF), _key(_range.end), _range)
+        before, after = _split(self._root, (node.start, node.end), strict=False)
+        self._root = _merge(_merge(before, node), after)
+        self._len += 1
+
+    def remove(self, _range: Range):
+        """Remove `_range`, or a Range equal to it.
+
+        :raises ValueError: if there is none
+        """
+        key = (_key(_range.start, -_INF), _key(_range.end))
+        before, rest = _split(self._root, key, strict=True)
+        equal, after = _split(rest, key, strict=False)
+        if equal is None:
+            self._root = _merge(before, after)
+            raise ValueError('Range not in index: %s' % _range)
+
+        nodes = list(_nodes(equal))
+        for i, node in enumerate(nodes):
+            if node.item is _range:
+                break
+        else:
+            i = 0
+        del nodes[i]
+        equal = None
+        for node in nodes:
+            node.left = node.right = None
+            _update(node)
+            equal = _merge(equal, node)
+
+        self._root = _merge(_merge(before, equal), after)
+        self._len -= 1
+
+    def _search(self, lo, hi):
+        """Yield, in order of start, the Ranges with start <= `hi` and end >= `lo`."""
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            if node is not None:
+                if node.max_end < lo:
+                    # everything below ends too early
+                    node = None
+                    continue
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                if node.start > hi:
+                    # and so do all later starts
+                    return
+                if node.end >= lo:
+                    yield node.item
+                node = node.right
+
+    def stab(self, date):
+        """:return: the Ranges that contain `date`
+
+        As for ``date in range``, an infinite `date` is contained in the
+        Ranges that are infinite at either end.
+        """
+        if not isinstance(date, Date):
+            date = Date(date)
+        if date.date is INFINITY:
+            found = list(self._search(-_INF, -_INF))
+            return found + [r for r in self._search(_INF, _INF) if r.start.date is not INFINITY]
+        point = _key(date)
+        return list(self._search(point, point))
+
+    def overlapping(self, _range: Range):
+        """:return: the Ranges that share at least an instant with `_range`"""
+        return list(self._search(_key(_range.start, -_INF), _key(_range.end)))
+
+    def containing(self, _range: Range):
+        """:return: the Ranges that `_range` lies within"""
+        return list(self._search(_key(_range.end), _key(_range.start, -_INF)))
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+from . import timezones
+from .timestring_re import ISO_RE
+
+
+def parse_iso(text: str):
+    """Read a strict ISO-8601 / RFC-3339 timestamp without the natural language parser.
+
+    A `Z` suffix gives a UTC datetime and a `+HH:MM` suffix a fixed
+    offset.  The Postgres text form, a space before the time and a numeric
+    offset (``2014-03-06 15:33:43.764419-05``), is converted to naive UTC
+    as it always has been.
+
+    :return: (datetime, the unit of its least significant field, whether
+        the string carried an offset) or None
+    """
+    match = ISO_RE.match(text)
+    if match is None:
+        return None
+    (year, month, day, month_b, day_b, week, week_day, ordinal,
+     sep, hour, minute, second, fraction, offset, sign, offset_hour, offset_minute) = match.groups()
+
+    try:
+        if week:
+            date = datetime.fromisocalendar(int(year), int(week), int(week_day or 1))
+            unit = 'day' if week_day else 'week'
+        elif ordinal:
+            date = datetime(int(year), 1, 1) + timedelta(days=int(ordinal) - 1)
+            if ordinal == '000' or date.year != int(year):
+                return None
+            unit = 'day'
+        else:
+            day = day or day_b
+            date = datetime(int(year), int(month or month_b), int(day or 1))
+            unit = 'day' if day else 'month'
+
+        if hour is None:
+            return date, unit, False
+        if unit != 'day':
+            return None
+        date = date.replace(hour=int(hour), minute=int(minute or 0),
+                            second=int(second or 0),
+                            microsecond=int(fraction[:6].ljust(6, '0')) if fraction else 0)
+    except ValueError:
+        return None
+
+    unit = 'second' if second else 'minute' if minute else 'hour'
+
+    if offset:
+        import pytz
+        if offset in 'Zz':
+            return date.replace(tzinfo=pytz.utc), unit, True
+        minutes = int(offset_hour) * 60 + int(offset_minute or 0)
+        if minutes >= 24 * 60:
+            return None
+        if sign == '-':
+            minutes = -minutes
+        if sep == ' ':
+            # postgresql timestamptz
+            return date - timedelta(minutes=minutes), unit, True
+        return date.replace(tzinfo=pytz.FixedOffset(minutes)), unit, True
+
+    return date, unit, False
+
+
+def localize(date: datetime, tz: str = None, now: datetime = None):
+    """Place a naive wall time in `tz`, or else in the zone of `now`."""
+    return timezones.localize(date, tz or (now.tzinfo if now else None))
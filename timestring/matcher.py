@@ -0,0 +1,240 @@
+"""Match `TIMESTRING_RE` one component at a time.
+
+`TIMESTRING_RE` is a single alternation over every kind of component, so
+each attempt tries every branch and fills some fifty named groups, even
+for "7am".  `match` and `search` find the same matches with the
+component patterns of `timestring_re` instead: the character a component
+starts with selects the few kinds that can start with it, each is tried
+alone, and the groups of the components that matched are merged as the
+repetition in `TIMESTRING_RE` would leave them.
+
+>>> match = matcher.search('lunch next tuesday at noon')
+>>> match.group(), match.groupdict()['weekday']
+('next tuesday at noon', 'tuesday')
+"""
+import re
+import string
+from functools import lru_cache
+
+from .timestring_re import PREFIX, UNIXTIME, PREFIX_RE, UNIXTIME_RE, LEAD_RE, COMPONENTS
+
+# the characters each kind of component may start with, lower case, when
+# no lead word starts it
+FIRST_CHARS = dict(
+    relative_day='dtny',
+    weekday='mtwfs',
+    duration=string.digits + 'i' + 'ctofsenh' + 'smhdwqy',
+    date_5=string.digits + "'/-" + string.whitespace + 'jfmasond',
+    date_6=string.digits + "'",
+    time_2=string.digits + 'anmteb',
+    month_1='jfmasond',
+)
+
+# the first characters of the lead words: since, until/till, by, the, and
+# this, current, last, prev/previous/past/prior, next, upcoming, following
+LEAD_CHARS = dict.fromkeys(FIRST_CHARS, 'sutb' + 'tclpnuf')
+LEAD_CHARS['relative_day'] = 'sutb' + 't'
+
+
+@lru_cache(maxsize=None)
+def _compiled(source: str):
+    """:return: the pattern and the (name, index in its groups()) of its named groups"""
+    pattern = re.compile(source, re.I)
+    return pattern, tuple((name, number - 1) for name, number in pattern.groupindex.items())
+
+
+class _Dispatch(dict):
+    """{character: the (pattern, groups) in order that may start with it}
+
+    Patterns are compiled the first time a character needs them.
+    """
+
+    def __init__(self, first_chars: dict, sources):
+        super(_Dispatch, self).__init__()
+        self.first_chars = first_chars
+        self.sources = sources
+
+    def __missing__(self, char):
+        if char > '\x7f':
+            # Unicode digits, spaces and case folding are left to the
+            # patterns, and the characters not remembered
+            return tuple(_compiled(lead) for _, lead, _ in COMPONENTS)
+        lower = char.lower()
+        self[char] = patterns = tuple(_compiled(source) for kind, source in self.sources
+                                      if lower in self.first_chars[kind])
+        return patterns
+
+
+_LEAD_DISPATCH = _Dispatch(
+    dict((kind, FIRST_CHARS[kind] + LEAD_CHARS[kind]) for kind in FIRST_CHARS),
+    [(kind, lead) for kind, lead, _ in COMPONENTS])
+_BARE_DISPATCH = _Dispatch(FIRST_CHARS, [(kind, bare) for kind, _, bare in COMPONENTS])
+
+# the groups of TIMESTRING_RE, in its order
+_NO_GROUPS = dict.fromkeys(re.findall(r'\(\?P<(\w+)>', ''.join(
+    [PREFIX, UNIXTIME] + [lead for _, lead, _ in COMPONENTS])))
+
+# something every match contains, see `scan`
+ANCHOR_RE = re.compile(r'''
+    \d
+    |\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)
+    |\b(?:mon|tue|wed|thu|fri|sat|sun)
+    |\b(?:today|now|yesterday|tomorrow)
+    |\b(?:second|minute|hour|day|weekend|week|month|quarter|year)
+    |(?<![a-z])[yqdhms](?!\w)
+    |noon|morning|time|evening|night
+    ''', re.I | re.X)
+
+# Everything that may precede the first anchor of a match.  Over-matching
+# only widens the window that is searched.
+LEAD_IN_RE = re.compile(r'''
+    (?:
+        [\s'/.,<>=-]
+        |between|from|before|after|greater|less|than|then|\ba\b
+        |since|until|till|by|the
+        |this|current|last|prev|previous|past|prior|next|upcoming|following
+        |in|couple|of|around|about|near|mid
+        |one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve
+        |thirteen|fourteen|fifteen|sixteen|seventeen|eighteen|nineteen
+        |twenty|thirty|forty|fifty|sixty|seventy|eighty|ninety|hundred
+    )*\Z''', re.I | re.X)
+
+# characters looked back from an anchor at first; doubled while the lead-in
+# reaches that far
+LOOKBACK = 64
+
+# Only a date can start on these, by taking the whole run of them, so it
+# fails at every offset in a run once it failed at one.  See `scan`.
+SEPARATORS_RE = re.compile(r'[/\-\s]*')
+
+
+class Match(object):
+    """The part of `re.Match` that callers of `TIMESTRING_RE` use."""
+    __slots__ = ('string', '_start', '_end', '_groups')
+
+    def __init__(self, string: str, start: int, end: int, groups: dict):
+        self.string = string
+        self._start = start
+        self._end = end
+        self._groups = groups
+
+    def __repr__(self):
+        return "<timestring.matcher.Match span=%r match=%r>" % (self.span(), self.group())
+
+    def start(self):
+        return self._start
+
+    def end(self):
+        return self._end
+
+    def span(self):
+        return self._start, self._end
+
+    def group(self, group=0):
+        """Group 0 and 1 are the whole match, as in `TIMESTRING_RE`."""
+        if group in (0, 1):
+            return self.string[self._start:self._end]
+        if group not in _NO_GROUPS:
+            raise IndexError('no such group')
+        return self._groups.get(group)
+
+    def groupdict(self):
+        groups = dict(_NO_GROUPS)
+        groups.update(self._groups)
+        return groups
+
+
+def _components(text: str, pos: int, groups: dict):
+    """:return: where the components from `pos` end, their groups merged
+        into `groups`; None if there is none"""
+    end = None
+    size = len(text)
+    lead_match = LEAD_RE.match
+    while pos < size:
+        char = text[pos]
+        # without a lead word, the patterns that skip them find the same
+        table = _LEAD_DISPATCH if lead_match(text, pos) is not None else _BARE_DISPATCH
+        for pattern, names in table[char]:
+            found = pattern.match(text, pos)
+            if found is not None:
+                break
+        else:
+            return end
+        # a group keeps its last value, as in a repetition
+        values = found.groups()
+        for name, index in names:
+            value = values[index]
+            if value is not None:
+                groups[name] = value
+        pos = end = found.end()
+    return end
+
+
+def match(text: str, pos: int = 0):
+    """:return: a `Match` like ``TIMESTRING_RE.match(text, pos)``"""
+    prefix = PREFIX_RE.match(text, pos)
+    if prefix is not None:
+        # with the prefix, and failing that without it
+        attempts = ((prefix.end(), {'prefix': prefix.group('prefix')}), (pos, {}))
+    else:
+        attempts = ((pos, {}),)
+    for start, groups in attempts:
+        unixtime = UNIXTIME_RE.match(text, start)
+        if unixtime is not None:
+            groups['unixtime'] = unixtime.group()
+            return Match(text, pos, unixtime.end(), groups)
+        end = _components(text, start, groups)
+        if end is not None:
+            return Match(text, pos, end, groups)
+    return None
+
+
+def _lead_in(text: str, pos: int, anchor: int):
+    """:return: the first offset >= `pos` from which only lead-in precedes `anchor`"""
+    lookback = LOOKBACK
+    while True:
+        lo = max(pos, anchor - lookback)
+        start = LEAD_IN_RE.search(text, lo, anchor).start()
+        if start > lo or lo == pos:
+            return start
+        lookback *= 2
+
+
+def scan(text: str, pos: int = 0):
+    """Yield the same matches as ``TIMESTRING_RE.finditer(text, pos)``.
+
+    Every match contains an anchor: a digit, a month, weekday or relative
+    day name, a duration unit or a time of day word.  Before its first
+    anchor a match can only hold lead-in words ("last", "the", "since",
+    "twenty", ...), whitespace and a little punctuation.  So `scan` looks
+    for the next anchor with a cheap regex, walks back over the lead-in
+    that precedes it and tries `match` only at the offsets in between,
+    once per run of separators.  Text without anchors is skipped at the
+    speed of the anchor search.
+    """
+    search_anchor = ANCHOR_RE.search
+    skip_separators = SEPARATORS_RE.match
+    while True:
+        anchor = search_anchor(text, pos)
+        if anchor is None:
+            return
+        end = anchor.end()
+        start = _lead_in(text, pos, anchor.start())
+        while start < end:
+            found = match(text, start)
+            if found is not None:
+                yield found
+                pos = found.end()
+                break
+            start = max(start + 1, skip_separators(text, start).end())
+        else:
+            pos = end
+
+
+def search(text: str, pos: int = 0):
+    """:return: a `Match` like ``TIMESTRING_RE.search(text, pos)``"""
+    # most callers search text that starts with its timestring
+    found = match(text, pos)
+    if found is not None:
+        return found
+    return next(scan(text, pos + 1), None)
@@ -0,0 +1,118 @@
+"""Parse large batches across several processes.
+
+Parsing is pure Python and bound by the GIL, so `parse_many(...,
+workers=n)` shards the input into chunks and parses them in a
+`concurrent.futures.ProcessPoolExecutor`.  The pinned reference time and
+parse options are sent to each worker once, when it starts; afterwards
+only the chunks of strings and their results travel between processes.
+
+>>> for date in timestring.parse_many(tickets, tz='UTC', workers=0, errors='coerce'):
+...     store(date)
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+
+from .batch import MEMO_SIZE, _results, _apply, _clone
+
+# items per task sent to a worker
+CHUNKSIZE = 2000
+# below this many items the pool costs more than it saves
+SERIAL_THRESHOLD = 20000
+
+_options = None
+_MISSING = object()
+
+
+def _init_worker(options):
+    global _options
+    _options = options
+
+
+def _parse_chunk(chunk):
+    return list(_results(chunk, *_options))
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_parallel(iterable, now, kind, errors, context, offset, week_start,
+                   workers: int = 0, chunksize: int = CHUNKSIZE,
+                   threshold: int = SERIAL_THRESHOLD, tz: str = None):
+    """The engine of `parse_many(..., workers=n)`, with `now` already pinned.
+
+    At most two chunks per worker are in flight at a time, so arbitrarily
+    long iterables stream through in constant memory and results come back
+    in input order.  Inputs shorter than `threshold` are parsed serially.
+    """
+    options = (now, kind, context, offset, week_start, tz)
+    iterator = iter(iterable)
+    head = list(islice(iterator, threshold))
+    if len(head) < threshold:
+        return _apply(_results(head, *options), errors)
+
+    return _apply(_pooled(chain(head, iterator), options, workers or os.cpu_count() or 1,
+                          chunksize),
+                  errors)
+
+
+def _pooled(iterable, options, workers, chunksize):
+    """Yield results in order while at most `2 * workers` chunks are in flight.
+
+    Each distinct item is sent to a worker only once: later occurrences
+    are answered from the results of the chunk that carried it.
+    """
+    memo = {}
+    sent = set()
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(options,)) as pool:
+        for chunk in _chunks(iterable, chunksize):
+            todo = []
+            for item in chunk:
+                try:
+                    if item in memo or item in sent:
+                        continue
+                    sent.add(item)
+                except TypeError:
+                    pass
+                todo.append(item)
+            pending.append((chunk, todo, pool.submit(_parse_chunk, todo)))
+            if len(pending) >= workers * 2:
+                for result in _collect(pending.popleft(), memo, sent, options):
+                    yield result
+        while pending:
+            for result in _collect(pending.popleft(), memo, sent, options):
+                yield result
+
+
+def _collect(task, memo, sent, options):
+    chunk, todo, future = task
+    if len(memo) >= MEMO_SIZE:
+        memo.clear()
+    unhashable = []
+    for item, result in zip(todo, future.result()):
+        try:
+            memo[item] = result
+            sent.discard(item)
+        except TypeError:
+            unhashable.append(result)
+    unhashable = iter(unhashable)
+
+    for item in chunk:
+        try:
+            result = memo.get(item, _MISSING)
+        except TypeError:
+            result = next(unhashable)
+        if result is _MISSING:
+            # evicted from the memo since it was parsed
+            result, = _results([item], *options)
+        yield result if isinstance(result, Exception) else _clone(result)
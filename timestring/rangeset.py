@@ -0,0 +1,182 @@
+"""Union, intersection and difference of many Ranges at once.
+
+A `RangeSet` holds its Ranges as a sorted list of disjoint intervals:
+building one sorts its Ranges once and merges those that overlap or
+touch, and every operation between two sets is a single merge-like pass
+over both lists.  The intervals are half-open, ``[start, end)``, so
+``Range('today') | Range('tomorrow')`` is the single Range from today to
+the day after tomorrow and ``Range('this week') - Range('today')`` leaves
+today's midnight in the first piece.
+
+>>> busy = timestring.RangeSet(meetings)
+>>> free = busy.complement(Range('this week'))
+>>> free.total_seconds()
+"""
+from bisect import bisect_right
+from copy import copy
+from datetime import timedelta
+from heapq import merge
+from operator import itemgetter
+
+from .Date import Date, INFINITY
+from .Range import Range
+from .index import _INF, _key
+
+_lo = itemgetter(0)
+
+
+def _interval(_range: Range):
+    """:return: (start key, end key, start Date, end Date) of `_range`"""
+    return _key(_range.start, -_INF), _key(_range.end), _range.start, _range.end
+
+
+def _coalesce(intervals):
+    """:return: `intervals`, sorted by start, with the empty ones dropped and
+        those that overlap or touch merged"""
+    out = []
+    for interval in intervals:
+        if interval[0] >= interval[1]:
+            continue
+        if out and interval[0] <= out[-1][1]:
+            last = out[-1]
+            if interval[1] > last[1]:
+                out[-1] = (last[0], interval[1], last[2], interval[3])
+        else:
+            out.append(interval)
+    return out
+
+
+class RangeSet(object):
+    """A normalized set of instants: sorted, non-overlapping Ranges.
+
+    `ranges` is an iterable of Ranges, or of anything `Range` accepts.
+    Ranges may be infinite at either end.  Naive and aware Ranges are
+    ordered by `Date.sort_key`, reading naive ones as UTC.
+    """
+    __slots__ = ('_intervals', '_starts')
+
+    __hash__ = None
+
+    def __init__(self, ranges=()):
+        intervals = [_interval(r if isinstance(r, Range) else Range(r)) for r in ranges]
+        intervals.sort(key=_lo)
+        self._set(_coalesce(intervals))
+
+    def _set(self, intervals):
+        self._intervals = intervals
+        self._starts = [interval[0] for interval in intervals]
+
+    @classmethod
+    def _from_intervals(cls, intervals):
+        """Internal constructor for intervals that are already normalized"""
+        self = cls.__new__(cls)
+        self._set(intervals)
+        return self
+
+    @staticmethod
+    def _coerce(other):
+        if isinstance(other, RangeSet):
+            return other
+        if isinstance(other, Range):
+            return RangeSet((other,))
+        return RangeSet(other)
+
+    def __len__(self):
+        """:return: the number of disjoint Ranges"""
+        return len(self._intervals)
+
+    def __iter__(self):
+        for _, _, start, end in self._intervals:
+            yield Range._from_dates(copy(start), copy(end))
+
+    def __repr__(self):
+        return "<timestring.RangeSet [%s] %s>" % (', '.join(map(str, self)), id(self))
+
+    def __eq__(self, other):
+        if not isinstance(other, RangeSet):
+            return NotImplemented
+        return [interval[:2] for interval in self._intervals] == \
+            [interval[:2] for interval in other._intervals]
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __contains__(self, other):
+        """A Date is in the set if an interval holds it; a Range if a single
+        interval holds all of it."""
+        if isinstance(other, Range):
+            lo, hi = _interval(other)[:2]
+        else:
+            if not isinstance(other, Date):
+                other = Date(other)
+            if other.date is INFINITY:
+                # as for `date in range`, infinity is in what is unbounded
+                return bool(self._intervals) and \
+                    (self._intervals[0][0] == -_INF or self._intervals[-1][1] == _INF)
+            lo = _key(other)
+            hi = None
+        i = bisect_right(self._starts, lo) - 1
+        if i < 0:
+            return False
+        end = self._intervals[i][1]
+        return lo < end if hi is None else hi <= end
+
+    def union(self, other):
+        other = self._coerce(other)
+        return RangeSet._from_intervals(_coalesce(merge(self._intervals, other._intervals, key=_lo)))
+
+    def intersection(self, other):
+        a, b = self._intervals, self._coerce(other)._intervals
+        out = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            lo, _, start, _ = a[i] if a[i][0] >= b[j][0] else b[j]
+            _, hi, _, end = a[i] if a[i][1] <= b[j][1] else b[j]
+            if lo < hi:
+                out.append((lo, hi, start, end))
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+        return RangeSet._from_intervals(out)
+
+    def difference(self, other):
+        b = self._coerce(other)._intervals
+        out = []
+        j = 0
+        for lo, hi, start, end in self._intervals:
+            while j < len(b) and b[j][1] <= lo:
+                j += 1
+            k = j
+            while k < len(b) and b[k][0] < hi:
+                if b[k][0] > lo:
+                    out.append((lo, b[k][0], start, b[k][2]))
+                if b[k][1] > lo:
+                    lo, start = b[k][1], b[k][3]
+                k += 1
+            if lo < hi:
+                out.append((lo, hi, start, end))
+        return RangeSet._from_intervals(out)
+
+    def complement(self, within: Range = None):
+        """:return: the instants of `within` that are not in this set,
+            everything when `within` is None"""
+        if within is None:
+            within = Range('infinity')
+        return self._coerce(within).difference(self)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def total_seconds(self):
+        """:return: the length of the set in seconds, inf if it is unbounded"""
+        return sum(hi - lo for lo, hi, _, _ in self._intervals) / 1e6
+
+    def duration(self):
+        """:return: the length of the set as a timedelta, None if it is unbounded"""
+        total = sum(hi - lo for lo, hi, _, _ in self._intervals)
+        if total == _INF:
+            return None
+        return timedelta(microseconds=total)
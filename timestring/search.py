@@ -0,0 +1,100 @@
+"""Locate timestrings in free text.
+
+`matcher.scan` finds the same matches as ``TIMESTRING_RE.finditer`` while
+only trying the offsets just before an anchor; `finditer` wraps them as
+`TimestringMatch` and streams file objects through it.
+"""
+import re
+
+from .Date import Date
+from .Range import Range
+from .matcher import scan
+from .utils import check_length
+
+# timestrings that findall reads as a Range rather than a Date
+RANGE_HINT_RE = re.compile(
+    r'((next|last)\s(\d+|couple(\sof))\s(weeks|months|quarters|years))|(between|from)', re.I)
+
+
+class TimestringMatch(object):
+    """A timestring found by `finditer`.
+
+    `text` is the stripped timestring and ``document[start:end] == text``.
+    The Date or Range it describes is only built when `value` is read.
+    """
+    __slots__ = ('text', 'start', 'end', '_raw', '_value')
+
+    def __init__(self, raw: str, start: int):
+        self._raw = raw
+        self.text = raw.strip()
+        self.start = start + len(raw) - len(raw.lstrip())
+        self.end = self.start + len(self.text)
+        self._value = None
+
+    def __repr__(self):
+        return "<timestring.TimestringMatch %r at %d>" % (self.text, self.start)
+
+    def span(self):
+        return self.start, self.end
+
+    @property
+    def value(self):
+        if self._value is None:
+            if RANGE_HINT_RE.match(self._raw):
+                self._value = Range(self._raw)
+            else:
+                self._value = Date(self._raw)
+        return self._value
+
+
+# characters kept before the resume point so that \b and lookbehinds see
+# the same context as in the whole document
+CONTEXT = 16
+
+
+def finditer(source, chunk_size: int = 1 << 16, overlap: int = 1024, max_input_length: int = None):
+    """Yield a `TimestringMatch` for every timestring in `source`.
+
+    `source` is a string or a text file object.  File objects are read
+    `chunk_size` characters at a time, so documents of any size are scanned
+    in constant memory.  A match within `overlap` characters of the end of
+    what has been read is held back until more text arrives, so matches
+    that straddle a chunk boundary are found whole.  `overlap` must exceed
+    the longest run of lead-in ("the last", "twenty one", whitespace)
+    before a timestring.  A string longer than `max_input_length` raises
+    TimestringInvalid before anything is scanned.
+
+    >>> with open('export.log') as f:
+    ...     for match in timestring.finditer(f):
+    ...         print(match.start, match.text, match.value)
+    """
+    if isinstance(source, str):
+        check_length(source, max_input_length)
+        for match in scan(source):
+            yield TimestringMatch(match.group(1), match.start())
+        return
+
+    buf = ''
+    offset = 0  # position of buf[0] in the document
+    pos = 0     # where scanning resumes in buf
+    eof = False
+    while not eof:
+        data = source.read(chunk_size)
+        eof = not data
+        buf += data
+        limit = len(buf) if eof else max(len(buf) - overlap, pos)
+
+        last_end = pos
+        resume = None
+        for match in scan(buf, pos):
+            if not eof and match.end() > limit:
+                resume = max(min(match.start(), limit), last_end)
+                break
+            yield TimestringMatch(match.group(1), offset + match.start())
+            last_end = match.end()
+        if resume is None:
+            resume = max(limit, last_end)
+        cut = max(resume - CONTEXT, 0)
+        buf = buf[cut:]
+        offset += cut
+        pos = resume - cut
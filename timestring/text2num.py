@@ -0,0 +1,118 @@
+"""Numbers written in words, such as 'twelve hundred' or 'one and a half'.
+
+Every word is looked up in a table built once at import, and results are
+memoized, so the numbers `TIMESTRING_RE` matches ('sixty', 'couple of',
+'two hundred') cost a dictionary lookup after the first time.
+
+>>> text2num('twelve thousand three hundred four')
+12304
+>>> text2num('two and three quarters')
+2.75
+"""
+from functools import lru_cache
+
+from timestring import TimestringInvalid
+
+NUMBER_CACHE_SIZE = 1024
+
+UNITS = dict((word, value) for value, word in enumerate((
+    'zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight',
+    'nine', 'ten', 'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen',
+    'sixteen', 'seventeen', 'eighteen', 'nineteen')))
+UNITS.update(a=1, an=1, couple=2)
+
+TENS = dict((word, value * 10) for value, word in enumerate((
+    'twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty',
+    'ninety'), 2))
+
+SCALES = dict((word, 1000 ** power) for power, word in enumerate((
+    'thousand', 'million', 'billion', 'trillion', 'quadrillion', 'quintillion',
+    'sextillion', 'septillion', 'octillion', 'nonillion', 'decillion'), 1))
+
+FRACTIONS = dict(half=0.5, halves=0.5, third=1 / 3., thirds=1 / 3.,
+                 quarter=0.25, quarters=0.25)
+
+# words that only join others: 'one hundred and five', 'couple of'
+FILLERS = frozenset(('and', 'of'))
+
+# how each word acts on the number being read
+_UNIT, _HUNDRED, _SCALE, _FRACTION, _FILLER, _POINT = range(6)
+
+_WORDS = {}
+_WORDS.update((word, (_UNIT, value)) for word, value in UNITS.items())
+_WORDS.update((word, (_UNIT, value)) for word, value in TENS.items())
+_WORDS.update((word, (_SCALE, value)) for word, value in SCALES.items())
+_WORDS.update((word, (_FRACTION, value)) for word, value in FRACTIONS.items())
+_WORDS.update((word, (_FILLER, None)) for word in FILLERS)
+_WORDS.update(hundred=(_HUNDRED, 100), point=(_POINT, None))
+
+# single words that are a number on their own
+_NUMBERS = dict(UNITS, hundred=100, **TENS)
+_NUMBERS.update(SCALES)
+_NUMBERS.update(FRACTIONS)
+
+
+@lru_cache(maxsize=NUMBER_CACHE_SIZE)
+def text2num(text: str):
+    """:return: the number `text` spells out, an int when it is whole
+
+    Words may be mixed with digits ('2 hundred').  A fraction applies to
+    the count before it, 'three quarters' is 0.75 and 'one and a half' 1.5.
+
+    :raises TimestringInvalid: if `text` is not a number
+    """
+    words = text.lower().replace('-', ' ').replace(',', ' ').split()
+    if len(words) == 1 and words[0] in _NUMBERS:
+        return _NUMBERS[words[0]]
+
+    total = 0
+    # the number below the last scale word, and its last count of units
+    current = count = 0
+    decimals = None
+    found = False
+    for word in words:
+        kind, value = _WORDS.get(word, (None, None))
+
+        if decimals is not None:
+            # digits after 'point'
+            if kind is not _UNIT or value > 9:
+                raise TimestringInvalid('Unknown number: %s' % text)
+            decimals.append(str(value))
+            continue
+
+        if kind is None:
+            try:
+                value = int(word)
+            except ValueError:
+                try:
+                    value = float(word)
+                except ValueError:
+                    raise TimestringInvalid('Unknown number: %s' % text)
+            kind = _UNIT
+        found = found or kind is not _FILLER
+
+        if kind is _UNIT:
+            current += value
+            count += value
+        elif kind is _HUNDRED:
+            current = (current or 1) * value
+            count = 0
+        elif kind is _SCALE:
+            total += (current or 1) * value
+            current = count = 0
+        elif kind is _FRACTION:
+            current += (count or 1) * value - count
+            count = 0
+        elif kind is _FILLER:
+            count = 0
+        else:
+            decimals = []
+
+    if not found and decimals is None:
+        raise TimestringInvalid('Unknown number: %s' % text)
+    number = total + current
+    if decimals:
+        number += float('0.' + ''.join(decimals))
+    if number == int(number):
+        return int(number)
+    return number
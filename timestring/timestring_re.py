@@ -3,90 +3,179 @@ import re
 MONTH_NAMES = r'''\b(january|february|march|april|june|july|august|september|october|november|december''' \
               r'''|jan|feb|mar|apr|may|jun|jul|aug|sept?|oct|nov|dec)\b'''
 
-TIMESTRING_RE = re.compile(re.sub('[\t\n\s]', '', re.sub('(\(\?\#[^\)]+\))', '', r'''
-    (
-        ((?P<prefix>between|from|before|after|\>=?|\<=?|greater\s+th(a|e)n(\s+a)?|less\s+th(a|e)n(\s+a)?)\s+)?
+
+def _clean(source: str):
+    """Drop the (?# comments) and the whitespace used to lay out a pattern."""
+    return re.sub(r'[\t\n\s]', '', re.sub(r'(\(\?\#[^\)]+\))', '', source))
+
+
+# =-=-=-= The pieces of TIMESTRING_RE =-=-=-=
+
+PREFIX = _clean(r'''
+    ((?P<prefix>between|from|before|after|\>=?|\<=?|greater\s+th(a|e)n(\s+a)?|less\s+th(a|e)n(\s+a)?)\s+)
+''')
+
+UNIXTIME = r'(?P<unixtime>\d{10})'
+
+SINCE = _clean(r'''
+    (\b((?P<since>since)|(?P<until>until|till)|(?P<by>by))\s+)?
+''')
+
+ARTICLE = r'(\b(?P<article>the\s)\s+)?'
+
+RELATIVE_DAY = _clean(r'''
+    \b(?P<relative_day>day\s+before\s+yesterday|day\s+after\s+tomorrow|today|now|yesterday|tomorrow)\b
+''')
+
+RECURRENCE = _clean(r'''
+    (\b
+        (?P<recurrence>
+            (?P<this>this|current)
+            |(?P<prev>last|prev(ious)|past|prior)
+            |(?P<next>next|upcoming|following)
+        )
+    \s+)?
+''')
+
+WEEKDAY = _clean(r'''
+    (?P<weekday>\b(mondays?|tuesdays?|wednesdays?|thursdays?|fridays?|saturdays?|sundays?|mon|tues?|wedn?|thur?|fri|sat|sun)\b)
+''')
+
+# The number of a duration is read atomically, `(?=(?P<num>...))(?P=num)`:
+# once the longest run of number words is taken none is given back, which
+# no unit could have used anyway.  Left free to backtrack, "2017 2017 ..."
+# is re-split digit by digit and the search grows exponentially.  The run is
+# bounded so that every offset of a long one costs the same.
+MAX_NUMBER_WORDS = 16
+
+DURATION = _clean(r'''
+    (?# =-=-=-= Matches:: number-frame-ago?, "4 weeks", "sixty days ago" =-=-=-= )
+    (?P<duration>
+        (\b(?P<in>in\s+))?
+        (?=(?P<num>((\d+(\.\d+)?|couple(\s+of)?|one|two|twenty|twelve|three|thirty|thirteen|four(teen|ty)?|five|fif(teen|ty)|six(teen|ty)?|seven(teen|ty)?|eight(een|y)?|nine(teen|ty)?|ten|eleven|hundred)\s*){0,''' + str(MAX_NUMBER_WORDS) + r'''}))(?P=num)
         (
-            (?P<unixtime>\d{10})
-            |
-            (
-                (\b((?P<since>since)|(?P<until>until|till)|(?P<by>by))\s+)?
-                (
-                    (\b(?P<article>the\s)\s+)?
-                    \b(?P<relative_day>day\s+before\s+yesterday|day\s+after\s+tomorrow|today|now|yesterday|tomorrow)\b
-                    |
-                    (\b
-                        (?P<recurrence>
-                            (?P<this>this|current)
-                            |(?P<prev>last|prev(ious)|past|prior)
-                            |(?P<next>next|upcoming|following)
-                        )
-                    \s+)?
-                    (
-                        (?# =-=-=-= Matches Days =-=-=-= )
-                        (?P<weekday>\b(mondays?|tuesdays?|wednesdays?|thursdays?|fridays?|saturdays?|sundays?|mon|tues?|wedn?|thur?|fri|sat|sun)\b)
-                        |
-                        (?# =-=-=-= Matches:: number-frame-ago?, "4 weeks", "sixty days ago" =-=-=-= )
-                        (?P<duration>
-                            (\b(?P<in>in\s+))?
-                            (?P<num>((\d+(\.\d+)?|couple(\s+of)?|one|two|twenty|twelve|three|thirty|thirteen|four(teen|ty)?|five|fif(teen|ty)|six(teen|ty)?|seven(teen|ty)?|eight(een|y)?|nine(teen|ty)?|ten|eleven|hundred)\s*)*)
-                            (
-                                \b(?P<delta>seconds?|minutes?|hours?|days?|weekends?|weeks?|months?|quarters?|years?)
-                                |((?<![a-zA-Z])(?P<delta_2>[YyQqDdHhMmSs])(?!\w))
-                            )
-                        )
-                        (\s+((?P<ago>ago)|(?P<from_now>from\s+now))\b)?
-                        |
-                        (?# =-=-=-= Matches dates with month name =-=-=-= )
-                        (?P<date_5>
-                            ((?P<year_6>(([12][089]\d{2})|('\d{2})))?([\/\-\s]+)?)
-                            (
-                                ((?P<date_4>(\d{1,2})(?!\d))(th|nd|st|rd)?([\/\-\s]+)?)
-                                (\s+of\s+)?
-                                (?P<month_5>''' + MONTH_NAMES + r''')[\/\-\s]?
-                            )
-                            |
-                            (
-                                (?P<month>''' + MONTH_NAMES + r''')[\/\-\s]?
-                                ((?P<date>(\d{1,2})(?!\d))(th|nd|st|rd)?)
-                            )
-                            (,?\s(?P<year>([12][089]|')?\d{2}))?
-                        )
-
-                        |
-
-                        (?# =-=-=-= Matches "2012/12/11", "2013-09-10T", "5/23/2012", "05/2012", "2012" =-=-=-= )
-                        (?P<date_6>
-                            ((?P<year_3>[12][089]\d{2})[/-](?P<month_3>[01]?\d)([/-](?P<date_3>[0-3]?\d))?)T?
-                                |
-                            ((?P<month_2>[01]?\d)[/-](?P<date_2>[0-3]?\d)[/-](?P<year_2>(([12][089]\d{2})|(\d{2}))))
-                                |
-                            ((?P<month_4>[01]?\d)[/-](?P<year_4>([12][089]\d{2})|(\d{2})))
-                                |
-                            (?P<year_5>([12][089]\d{2})|('\d{2}))
-                        )
-
-                        |
-
-                        (?# =-=-=-= Matches "01:20", "6:35 pm", "7am", "noon" =-=-=-= )
-                        (?P<time_2>
-                            ((?P<hour>[012]?[0-9]):(?P<minute>[0-5]\d)\s*(?P<am>am|pm|p|a))
-                                |
-                            ((?P<hour_2>[012]?[0-9]):(?P<minute_2>[0-5]\d)(:(?P<seconds>[0-5]\d))?)
-                                |
-                            ((?P<hour_3>[012]?[0-9])\s*(?P<am_1>am|pm|p|a|o'?clock))
-                                |
-                            (?P<daytime>(after)?noon|morning|((around|about|near|by)\s+)?this\s+time|evening|(mid)?night(time)?)
-                        )
-
-                        |
-
-                        (?P<month_1>''' + MONTH_NAMES + ''')
-                    )
-                )
-                (?# =-=-=-= Conjunctions =-=-=-= )
-                ,?(\s+(on|at|of|by|and|to|@))?\s*
-            )+
+            \b(?P<delta>seconds?|minutes?|hours?|days?|weekends?|weeks?|months?|quarters?|years?)
+            |((?<![a-zA-Z])(?P<delta_2>[YyQqDdHhMmSs])(?!\w))
+        )
+    )
+    (\s+((?P<ago>ago)|(?P<from_now>from\s+now))\b)?
+''')
+
+DATE_5 = _clean(r'''
+    (?# =-=-=-= Matches dates with month name =-=-=-= )
+    (?P<date_5>
+        ((?P<year_6>(([12][089]\d{2})|('\d{2})))?([\/\-\s]+)?)
+        (
+            ((?P<date_4>(\d{1,2})(?!\d))(th|nd|st|rd)?([\/\-\s]+)?)
+            ((?<=\s)of\s+)?
+            (?P<month_5>''' + MONTH_NAMES + r''')[\/\-\s]?
         )
+        |
+        (
+            (?P<month>''' + MONTH_NAMES + r''')[\/\-\s]?
+            ((?P<date>(\d{1,2})(?!\d))(th|nd|st|rd)?)
+        )
+        (,?\s(?P<year>([12][089]|')?\d{2}))?
+    )
+''')
+
+DATE_6 = _clean(r'''
+    (?# =-=-=-= Matches "2012/12/11", "2013-09-10T", "5/23/2012", "05/2012", "2012" =-=-=-= )
+    (?P<date_6>
+        ((?P<year_3>[12][089]\d{2})[/-](?P<month_3>[01]?\d)([/-](?P<date_3>[0-3]?\d))?)T?
+            |
+        ((?P<month_2>[01]?\d)[/-](?P<date_2>[0-3]?\d)[/-](?P<year_2>(([12][089]\d{2})|(\d{2}))))
+            |
+        ((?P<month_4>[01]?\d)[/-](?P<year_4>([12][089]\d{2})|(\d{2})))
+            |
+        (?P<year_5>([12][089]\d{2})|('\d{2}))
+    )
+''')
+
+TIME_2 = _clean(r'''
+    (?# =-=-=-= Matches "01:20", "6:35 pm", "7am", "noon" =-=-=-= )
+    (?P<time_2>
+        ((?P<hour>[012]?[0-9]):(?P<minute>[0-5]\d)\s*(?P<am>am|pm|p|a))
+            |
+        ((?P<hour_2>[012]?[0-9]):(?P<minute_2>[0-5]\d)(:(?P<seconds>[0-5]\d))?)
+            |
+        ((?P<hour_3>[012]?[0-9])\s*(?P<am_1>am|pm|p|a|o'?clock))
+            |
+        (?P<daytime>(after)?noon|morning|((around|about|near|by)\s+)?this\s+time|evening|(mid)?night(time)?)
+    )
+''')
+
+MONTH_1 = '(?P<month_1>' + MONTH_NAMES + ')'
+
+CONJUNCTION = _clean(r'''
+    (?# =-=-=-= Conjunctions =-=-=-= )
+    ,?(\s+(on|at|of|by|and|to|@))?\s*
+''')
+
+# One timestring is an optional prefix, then a unix time or one or more
+# components (a day, a duration, a date, a time, ...) joined by conjunctions.
+# Only a date can start on a run of separators, and one that starts inside a
+# run also starts at its first character, so a timestring never begins
+# inside one: a search would otherwise walk the rest of the run from every
+# offset in it.
+NOT_IN_SEPARATORS = r'(?![\/\-\s](?<=[\/\-\s][\/\-\s]))'
+
+TIMESTRING = NOT_IN_SEPARATORS + '(' + PREFIX + '?(' + UNIXTIME + '|(' + SINCE + '(' + ARTICLE + RELATIVE_DAY + '|' + RECURRENCE + \
+    '(' + WEEKDAY + '|' + DURATION + '|' + DATE_5 + '|' + DATE_6 + '|' + TIME_2 + '|' + MONTH_1 + '))' + \
+    CONJUNCTION + ')+))'
+
+
+# The same pieces apart, for `matcher`: each kind of component, in the
+# order TIMESTRING_RE tries them, with its conjunction.  A component may be
+# led by the words of LEAD_RE ("since", "last", "the"); the patterns without
+# them are what is left to try where no such word starts.
+PREFIX_RE = re.compile(PREFIX, re.I)
+UNIXTIME_RE = re.compile(UNIXTIME)
+LEAD_RE = re.compile('|'.join(lead[:-1] for lead in (SINCE, ARTICLE, RECURRENCE)), re.I)
+COMPONENTS = tuple(
+    (kind, lead + component + CONJUNCTION, component + CONJUNCTION)
+    for kind, lead, component in (
+        ('relative_day', SINCE + ARTICLE, RELATIVE_DAY),
+        ('weekday', SINCE + RECURRENCE, WEEKDAY),
+        ('duration', SINCE + RECURRENCE, DURATION),
+        ('date_5', SINCE + RECURRENCE, DATE_5),
+        ('date_6', SINCE + RECURRENCE, DATE_6),
+        ('time_2', SINCE + RECURRENCE, TIME_2),
+        ('month_1', SINCE + RECURRENCE, MONTH_1),
+    ))
+
+
+def __getattr__(name):
+    # Compiling the patterns takes longer than the rest of the import.
+    # `matcher` compiles the COMPONENTS it meets; these are compiled on
+    # first use, for the callers that want them whole.
+    if name == 'TIMESTRING_RE':
+        value = re.compile(TIMESTRING, re.I)
+    elif name == 'COMPONENT_RES':
+        value = tuple((kind, re.compile(lead, re.I), re.compile(bare, re.I))
+                      for kind, lead, bare in COMPONENTS)
+    else:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+# Strict ISO-8601 / RFC-3339: "2024-03-05", "2024-03-05T12:30:00.5Z", "2024-W10-2",
+# "2024-065", "20240305T123000+0100".  Tried before TIMESTRING_RE.
+ISO_RE = re.compile(r'''
+    (?P<year>\d{4})
+    (?:
+        -(?P<month>\d{2})(?:-(?P<day>\d{2}))?
+        |(?P<month_b>\d{2})(?P<day_b>\d{2})
+        |-?W(?P<week>\d{2})(?:-?(?P<week_day>[1-7]))?
+        |-?(?P<ordinal>\d{3})
     )
-    ''')), re.I)
+    (?:
+        (?P<sep>[T\ ])
+        (?P<hour>\d{2})
+        (?::?(?P<minute>\d{2})
+            (?::?(?P<second>\d{2})(?:[.,](?P<fraction>\d{1,9}))?)?
+        )?
+        (?P<offset>Z|(?P<sign>[+-])(?P<offset_hour>\d{2})(?::?(?P<offset_minute>\d{2}))?)?
+    )?
+    $''', re.I | re.X)
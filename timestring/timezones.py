@@ -0,0 +1,92 @@
+"""Resolve timezone names once and place datetimes in them.
+
+Every Date and Range built with ``tz='US/Eastern'`` used to look the zone up
+again.  `get_timezone` memoizes the lookup, so a service building Dates for
+hundreds of tenants resolves each zone once per process.
+
+Zones come from pytz by default.  ``set_backend('zoneinfo')`` switches to
+the standard library `zoneinfo` (Python 3.9+).  The two attach zones
+differently: a pytz zone must be applied with its ``localize`` and fixed up
+with ``normalize`` after arithmetic, a zoneinfo zone is simply set as the
+tzinfo.  `localize` and `normalize` do the right thing for either, so
+callers never use ``datetime.replace(tzinfo=...)`` with a pytz zone, which
+silently gives the zone's local mean time (e.g. -04:56 for US/Eastern).
+
+>>> timestring.set_backend('zoneinfo')
+>>> Date('today 9am', tz='Europe/Paris').tz
+zoneinfo.ZoneInfo(key='Europe/Paris')
+"""
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
+
+BACKENDS = ('pytz', 'zoneinfo')
+
+# distinct zone names remembered per backend
+ZONE_CACHE_SIZE = 1024
+
+_backend = 'pytz'
+
+
+def set_backend(backend: str):
+    """Choose where zone names are looked up: 'pytz' (default) or 'zoneinfo'."""
+    global _backend
+    if backend not in BACKENDS:
+        raise ValueError('backend must be one of %s' % ', '.join(BACKENDS))
+    if backend == 'zoneinfo':
+        import zoneinfo  # noqa: F401 (fail here, not on the first lookup)
+    _backend = backend
+
+
+def get_backend():
+    return _backend
+
+
+@lru_cache(maxsize=ZONE_CACHE_SIZE)
+def _lookup(name: str, backend: str):
+    if backend == 'zoneinfo':
+        from zoneinfo import ZoneInfo
+        if name.upper() == 'UTC':
+            # pytz accepts 'utc', zoneinfo only knows 'UTC'
+            name = 'UTC'
+        return ZoneInfo(name)
+    import pytz
+    return pytz.timezone(name)
+
+
+def get_timezone(tz):
+    """:return: the tzinfo for a zone name, `tz` itself if it already is a
+        tzinfo, or None for no zone
+
+    Unknown names raise the backend's error, a `KeyError` in both cases.
+    """
+    if not tz:
+        return None
+    if isinstance(tz, tzinfo):
+        return tz
+    return _lookup(str(tz), _backend)
+
+
+def localize(date: datetime, tz) -> datetime:
+    """Place the naive wall time `date` in `tz`."""
+    tz = get_timezone(tz)
+    if tz is None:
+        return date
+    if hasattr(tz, 'localize'):
+        return tz.localize(date)
+    return date.replace(tzinfo=tz)
+
+
+def normalize(date: datetime) -> datetime:
+    """Correct the UTC offset of an aware `date` after timedelta arithmetic."""
+    tz = date.tzinfo
+    if tz is None:
+        return date
+    if hasattr(tz, 'normalize'):
+        return tz.normalize(date)
+    # a wall time skipped by a DST change keeps the offset from before it;
+    # the round trip through UTC moves it past the gap, as pytz does
+    return date.astimezone(timezone.utc).astimezone(tz)
+
+
+def now(tz=None) -> datetime:
+    return datetime.now(get_timezone(tz))
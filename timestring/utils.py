@@ -1,6 +1,5 @@
-from word2number import w2n
-
 from timestring import TimestringInvalid
+from .text2num import text2num
 
 
 def get_num(num):
@@ -11,13 +10,17 @@ def get_num(num):
     if isinstance(num, (int, float)):
         return num
 
-    if 'couple' in (num or ''):
-        return 2
-
     try:
         return float(num)
     except ValueError:
-        try:
-            return w2n.word_to_num(num or 'one')
-        except ValueError:
-            raise TimestringInvalid('Unknown number: %s' % num)
+        return text2num(num or 'one')
+
+
+def check_length(text: str, max_input_length: int = None):
+    """
+    :raises TimestringInvalid: if `text` is longer than `max_input_length`
+        characters, which None leaves unbounded
+    """
+    if max_input_length is not None and len(text) > max_input_length:
+        raise TimestringInvalid('Input too long: %d characters, at most %d'
+                                % (len(text), max_input_length))